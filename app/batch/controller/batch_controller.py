@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.orm import Session
+
+from app.batch.models.schema.batch_schema import BatchItemResponse, BatchRequest
+from app.batch.service.batch_service import BATCH_PATH, BatchService
+from app.config.db_config import get_db_session
+from app.models.response import ApiListResponse
+from app.utility.trace.trace_utility import TracedRoute
+
+batch_router = APIRouter(prefix=BATCH_PATH, tags=["Batch"], route_class=TracedRoute)
+
+
+@batch_router.post(
+    "/",
+    response_model=ApiListResponse[BatchItemResponse],
+    summary="批次請求",
+    description="在單一 HTTP 請求中依序執行多個 API 子請求，子請求共用同一個資料庫 session；"
+    "回傳每個子請求的狀態碼與內容",
+)
+async def run_batch(
+    payload: BatchRequest, request: Request, db: Session = Depends(get_db_session)
+):
+    """批次請求"""
+    results = await BatchService(request.app, request.scope, db).run(payload.requests)
+    return ApiListResponse.success(data=results, message="batch success")
@@ -0,0 +1,30 @@
+from typing import Any, Dict, List, Literal, Optional
+from pydantic import BaseModel, Field
+
+MAX_BATCH_REQUESTS = 50
+
+
+class BatchItemRequest(BaseModel):
+    """One sub-request of a batch"""
+
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET"
+    path: str = Field(
+        ...,
+        pattern=r"^/api/",
+        description="API path with optional query string, e.g. /api/v1/examples/1",
+    )
+    headers: Dict[str, str] = Field(default_factory=dict, description="Extra request headers")
+    body: Optional[Any] = Field(None, description="JSON request body")
+
+
+class BatchRequest(BaseModel):
+    """Request schema for a batch of sub-requests"""
+
+    requests: List[BatchItemRequest] = Field(..., min_length=1, max_length=MAX_BATCH_REQUESTS)
+
+
+class BatchItemResponse(BaseModel):
+    """Result of one sub-request"""
+
+    status: int
+    body: Optional[Any] = None
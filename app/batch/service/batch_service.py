@@ -0,0 +1,111 @@
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from app.batch.models.schema.batch_schema import BatchItemRequest, BatchItemResponse
+from app.config.db_config import SHARED_SESSION_STATE
+from app.config.json_config import JsonConfig
+
+BATCH_PATH = "/api/v1/batch"
+
+# Connection-level scope keys a sub-request inherits from the batch request
+_INHERITED_SCOPE_KEYS = (
+    "type", "asgi", "http_version", "scheme", "server", "client", "root_path", "extensions",
+)
+_BODY_HEADERS = (b"content-length", b"content-type")
+
+
+class _StreamingNotSupported(Exception):
+    pass
+
+
+class BatchService:
+    """
+    Runs batch sub-requests in-process through the ASGI app
+    - Sub-requests pass the full middleware stack (rate limits, tracing) and
+      routing, exactly like separate HTTP requests, minus the round-trips
+    - They run one after another and share the batch's DB session through
+      request state, so they also share its connection and identity map
+    """
+
+    def __init__(self, app, scope: dict, db: Session):
+        self.app = app
+        self.scope = scope
+        self.db = db
+        self.codec = JsonConfig.get_codec()
+
+    async def run(self, items: List[BatchItemRequest]) -> List[BatchItemResponse]:
+        """Run sub-requests in order; the shared session is not safe for concurrent use"""
+        results = []
+        for item in items:
+            result = await self._dispatch(item)
+            if result.status >= 400:
+                # Don't let a failed sub-request poison the shared session
+                self.db.rollback()
+            results.append(result)
+        return results
+
+    def _build_scope(self, item: BatchItemRequest, body: bytes) -> dict:
+        path, _, query = item.path.partition("?")
+        headers = [
+            (name, value) for name, value in self.scope["headers"] if name not in _BODY_HEADERS
+        ]
+        headers.extend(
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in item.headers.items()
+        )
+        if body:
+            headers.append((b"content-type", b"application/json"))
+            headers.append((b"content-length", str(len(body)).encode()))
+        scope = {key: self.scope[key] for key in _INHERITED_SCOPE_KEYS if key in self.scope}
+        scope.update(
+            method=item.method,
+            path=path,
+            raw_path=path.encode(),
+            query_string=query.encode(),
+            headers=headers,
+            state={**self.scope.get("state", {}), SHARED_SESSION_STATE: self.db},
+        )
+        return scope
+
+    async def _dispatch(self, item: BatchItemRequest) -> BatchItemResponse:
+        if item.path.partition("?")[0].rstrip("/") == BATCH_PATH:
+            return BatchItemResponse(status=400, body={"detail": "Nested batch requests are not allowed"})
+
+        body = b"" if item.body is None else self.codec.dumps(item.body)
+        request_sent = False
+        status = None
+        content_type = b""
+        chunks = []
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal status, content_type
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                content_type = dict(message.get("headers", [])).get(b"content-type", b"")
+                if content_type.startswith(b"text/event-stream"):
+                    raise _StreamingNotSupported()
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        try:
+            await self.app(self._build_scope(item, body), receive, send)
+        except _StreamingNotSupported:
+            return BatchItemResponse(status=400, body={"detail": "Streaming endpoints cannot be batched"})
+        except Exception:
+            # ServerErrorMiddleware re-raises after sending its 500 response
+            return BatchItemResponse(status=status or 500, body={"detail": "Internal Server Error"})
+
+        content = b"".join(chunks)
+        if not content:
+            return BatchItemResponse(status=status)
+        if content_type.startswith(b"application/json"):
+            return BatchItemResponse(status=status, body=self.codec.loads(content))
+        return BatchItemResponse(status=status, body=content.decode("utf-8", errors="replace"))
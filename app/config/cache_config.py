@@ -0,0 +1,79 @@
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.utility.cache.response_cache_utility import ResponseCache, TableVersion
+
+
+class CacheConfig:
+    """
+    Response cache shared by all workers on the host
+    - RESPONSE_CACHE_ENABLED turns caching of list GETs on
+    - Writes bump the table version, invalidating cached responses everywhere
+    """
+
+    _versions = {}
+    _caches = {}
+    _purger = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return os.getenv("RESPONSE_CACHE_ENABLED", "False").lower() == "true"
+
+    @staticmethod
+    def cache_dir() -> str:
+        return os.getenv(
+            "RESPONSE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "fastapi-cache")
+        )
+
+    @classmethod
+    def get_table_version(cls, table: str) -> TableVersion:
+        version = cls._versions.get(table)
+        if version is None:
+            with cls._lock:
+                version = cls._versions.get(table)
+                if version is None:
+                    version = TableVersion(cls.cache_dir(), table)
+                    cls._versions[table] = version
+        return version
+
+    @classmethod
+    def get_response_cache(cls, table: str) -> ResponseCache:
+        cache = cls._caches.get(table)
+        if cache is None:
+            with cls._lock:
+                cache = cls._caches.get(table)
+                if cache is None:
+                    cache = ResponseCache(
+                        os.path.join(cls.cache_dir(), "responses", table),
+                        memory_entries=int(os.getenv("RESPONSE_CACHE_MEMORY_ENTRIES", "256")),
+                        ttl=float(os.getenv("RESPONSE_CACHE_TTL", "0")),
+                    )
+                    cls._caches[table] = cache
+        return cache
+
+    @classmethod
+    def bump(cls, table: str):
+        """Record a committed write to the table"""
+        if not cls.is_enabled():
+            return
+        version = cls.get_table_version(table).bump()
+        # Old entries are already unreachable; deleting their files can wait
+        # for a background thread instead of holding up the write
+        cls._get_purger().submit(cls.get_response_cache(table).purge_before, version)
+
+    @classmethod
+    def _get_purger(cls) -> ThreadPoolExecutor:
+        # Created lazily so each forked worker builds its own thread
+        if cls._purger is None:
+            with cls._lock:
+                if cls._purger is None:
+                    cls._purger = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="cache-purge"
+                    )
+        return cls._purger
@@ -1,23 +1,38 @@
 import os
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.middleware.cors_preflight_middleware import CorsPreflightMiddleware
+
 
 class CorsConfig:
     def __init__(self):
         pass
 
+    @staticmethod
+    def options() -> dict:
+        return {
+            "allow_origins": os.getenv("CORS_ORIGINS", "*").split(","),
+            "allow_methods": os.getenv("CORS_METHODS", "*").split(","),
+            "allow_headers": os.getenv("CORS_HEADERS", "*").split(","),
+            "allow_credentials": os.getenv("CORS_CREDENTIALS", "True").lower() == "true",
+            # How long browsers may reuse a preflight answer before asking again
+            "max_age": int(os.getenv("CORS_MAX_AGE", 600)),
+        }
+
     @classmethod
     def init_cors(cls, app=None):
-        origins = os.getenv("CORS_ORIGINS", "*").split(",")
-        methods = os.getenv("CORS_METHODS", "*").split(",")
-        headers = os.getenv("CORS_HEADERS", "*").split(",")
-        credentials = os.getenv("CORS_CREDENTIALS", "True").lower() == "true"
+        app.add_middleware(CORSMiddleware, **cls.options())
 
+    @classmethod
+    def init_preflight(cls, app=None):
+        """
+        Answer preflights from cache ahead of every other middleware; call it
+        after all other add_middleware calls so it ends up outermost
+        """
+        if os.getenv("CORS_PREFLIGHT_CACHE", "True").lower() != "true":
+            return
         app.add_middleware(
-            CORSMiddleware,
-            allow_origins=origins,
-            allow_methods=methods,
-            allow_headers=headers,
-            allow_credentials=credentials,
+            CorsPreflightMiddleware,
+            max_entries=int(os.getenv("CORS_PREFLIGHT_CACHE_SIZE", 1024)),
+            **cls.options(),
         )
-
@@ -1,46 +1,303 @@
+import asyncio
 import os
+import threading
 import time
 from pathlib import Path
-from sqlalchemy import create_engine
+from typing import Optional
+from fastapi import Depends, HTTPException, Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import OperationalError
 from dotenv import load_dotenv
 
+from app.utility.db.circuit_breaker_utility import CircuitBreaker, HALF_OPEN, backoff_delays
+from app.utility.db.shard_router_utility import ShardRouter, ShardSessions
+
 # Load .env from config directory (relative to this file's location)
 env_path = Path(__file__).resolve().parent.parent.parent / "config" / ".env"
 load_dotenv(env_path)
 
-engine = create_engine(
-    os.getenv("MYSQL_HOST"),
-    pool_pre_ping=True,
-    pool_size=int(os.getenv("POOL_SIZE", 32)),
-    max_overflow=int(os.getenv("MAX_OVERFLOW", 64)),
-    echo=(os.getenv("DEBUG", "False") == "True"),
-)
+
+# MYSQL_HOST is shard 0; SHARD_HOSTS (comma-separated URLs) adds shards 1..N-1.
+# With a single URL there is no router and nothing is sharded.
+_shard_urls = [os.getenv("MYSQL_HOST")] + [
+    url.strip() for url in os.getenv("SHARD_HOSTS", "").split(",") if url.strip()
+]
+# Routing relies on MySQL auto_increment offsets; any other backend would hand
+# out 1, 2, 3... on every shard and ids would silently route to the wrong one
+if len(_shard_urls) > 1 and any(make_url(url).get_backend_name() != "mysql" for url in _shard_urls):
+    raise ValueError("SHARD_HOSTS requires MySQL for MYSQL_HOST and every shard")
+
+
+def _create_engine(url: str, shard: int = 0, pool_size: int = None, max_overflow: int = None):
+    db_url = make_url(url)
+    connect_args = {}
+    if db_url.get_backend_name() == "mysql":
+        # Bound the TCP/handshake wait so an unreachable server fails in seconds
+        connect_args["connect_timeout"] = int(os.getenv("DB_CONNECT_TIMEOUT", 5))
+        if len(_shard_urls) > 1:
+            # Disjoint id sequences: shard k issues k+1, k+1+N, ... so (id - 1) % N == k
+            connect_args["init_command"] = (
+                f"SET SESSION auto_increment_increment = {len(_shard_urls)}, "
+                f"auto_increment_offset = {shard + 1}"
+            )
+    return create_engine(
+        db_url,
+        connect_args=connect_args,
+        pool_pre_ping=True,
+        pool_size=pool_size if pool_size is not None else int(os.getenv("POOL_SIZE", 32)),
+        max_overflow=(
+            max_overflow if max_overflow is not None else int(os.getenv("MAX_OVERFLOW", 64))
+        ),
+        echo=(os.getenv("DEBUG", "False") == "True"),
+    )
+
+
+# Engine and SessionLocal are thread-safe and shared by every thread; each
+# request gets its own Session from get_db_session and never shares it.
+engine = _create_engine(_shard_urls[0])
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
+shard_engines = [engine] + [
+    _create_engine(url, shard) for shard, url in enumerate(_shard_urls[1:], start=1)
+]
+shard_router = (
+    ShardRouter(shard_engines, int(os.getenv("SHARD_SCATTER_WORKERS", 0)) or None)
+    if len(shard_engines) > 1
+    else None
+)
+
+# A forked worker must never reuse connections opened by its parent process.
+# Dropping the inherited pool (without closing the parent's sockets) means each
+# worker lazily opens its own connections after the fork.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        after_in_child=lambda: [shard_engine.dispose(close=False) for shard_engine in shard_engines]
+    )
+
+
+class QueryCacheStats:
+    """Counts SQLAlchemy compiled-cache hits and misses per executed statement"""
+
+    _counts = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def install(cls, target_engine):
+        event.listen(target_engine, "before_cursor_execute", cls._record)
+
+    @classmethod
+    def _record(cls, conn, cursor, statement, parameters, context, executemany):
+        cache_hit = getattr(context, "cache_hit", None)
+        key = getattr(cache_hit, "name", "RAW_SQL")
+        with cls._lock:
+            cls._counts[key] = cls._counts.get(key, 0) + 1
+
+    @classmethod
+    def snapshot(cls, target_engine=None) -> dict:
+        """Hit/miss counters plus current compiled cache occupancy"""
+        target_engine = target_engine or engine
+        with cls._lock:
+            counts = dict(cls._counts)
+        hits = counts.get("CACHE_HIT", 0)
+        misses = counts.get("CACHE_MISS", 0)
+        compiled_cache = target_engine._compiled_cache
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+            "other": {k: v for k, v in counts.items() if k not in ("CACHE_HIT", "CACHE_MISS")},
+            "cache_size": len(compiled_cache) if compiled_cache is not None else 0,
+            "cache_capacity": compiled_cache.capacity if compiled_cache is not None else 0,
+        }
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._counts.clear()
+
+
+for _shard_engine in shard_engines:
+    QueryCacheStats.install(_shard_engine)
+
+
+class DatabaseUnavailableException(HTTPException):
+    """Exception raised when the database cannot be reached"""
+
+    def __init__(self, retry_after: float = 1.0):
+        super().__init__(
+            status_code=503,
+            detail="Database unavailable",
+            headers={"Retry-After": str(max(1, int(retry_after + 0.999)))},
+        )
+
+
+def _unavailable(error: Exception) -> Exception:
+    """Mark a DBAPI error as "could not connect" so get_db_session answers 503"""
+    error.db_unavailable = True
+    return error
+
+
+def is_connection_error(exc: OperationalError) -> bool:
+    """
+    Whether an OperationalError means the database could not be reached: a
+    failed or refused connect, or a connection lost mid-request. Lock wait
+    timeouts, deadlocks and the like are ordinary errors.
+    """
+    return exc.connection_invalidated or getattr(exc.orig, "db_unavailable", False)
+
+
+def _create_breaker() -> CircuitBreaker:
+    return CircuitBreaker(
+        failure_threshold=int(os.getenv("DB_BREAKER_FAILURES", 3)),
+        reset_timeout=float(os.getenv("DB_BREAKER_RESET_SECONDS", 10)),
+    )
+
 
-def get_db_session():
+def _on_event_loop() -> bool:
+    """Whether the caller is running on an event loop thread (inline sync handlers)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+class DbConnectGuard:
+    """
+    Retries new DBAPI connections with jittered exponential backoff and trips
+    a circuit breaker once connecting keeps failing, so callers fail fast
+    instead of each waiting out the connect timeout
+
+    With THREADED_HANDLERS=False handlers run inline on the event loop; there
+    a failed connect is not retried (a backoff sleep would stall every request
+    on the worker) and goes straight to the breaker.
+
+    Each shard has its own breaker so one dead shard does not fail the others;
+    `breaker` belongs to shard 0 (MYSQL_HOST) and gates get_db_session.
+    """
+
+    breaker = _create_breaker()
+    shard_breakers = {}
+    retries = int(os.getenv("DB_CONNECT_RETRIES", 2))
+    backoff_base = float(os.getenv("DB_CONNECT_BACKOFF_BASE", 0.1))
+    backoff_max = float(os.getenv("DB_CONNECT_BACKOFF_MAX", 2.0))
+
+    @classmethod
+    def breaker_for(cls, shard: int) -> CircuitBreaker:
+        if shard == 0:
+            return cls.breaker
+        breaker = cls.shard_breakers.get(shard)
+        if breaker is None:
+            breaker = cls.shard_breakers.setdefault(shard, _create_breaker())
+        return breaker
+
+    @classmethod
+    def install(cls, target_engine, shard: int = 0):
+        def connect(dialect, conn_rec, cargs, cparams):
+            return cls._connect(dialect, conn_rec, cargs, cparams, shard)
+
+        def on_error(context):
+            cls._on_error(context, shard)
+
+        event.listen(target_engine, "do_connect", connect)
+        event.listen(target_engine, "handle_error", on_error)
+
+    @classmethod
+    def _connect(cls, dialect, conn_rec, cargs, cparams, shard: int = 0):
+        dbapi = dialect.loaded_dbapi
+        breaker = cls.breaker_for(shard)
+        if not breaker.allow():
+            raise _unavailable(
+                dbapi.OperationalError(
+                    f"Database circuit open, retry after {breaker.retry_after():.1f}s"
+                )
+            )
+        # A half-open circuit gets a single probe attempt, as does a caller on the event loop
+        retries = 0 if breaker.state == HALF_OPEN or _on_event_loop() else cls.retries
+        delays = backoff_delays(retries, cls.backoff_base, cls.backoff_max)
+        while True:
+            try:
+                connection = dialect.connect(*cargs, **cparams)
+            except dbapi.OperationalError as exc:
+                delay = next(delays, None)
+                if delay is None:
+                    breaker.record_failure(exc)
+                    raise _unavailable(exc)
+                # Only reached off the event loop (threaded handlers / DB executor)
+                time.sleep(delay)
+                continue
+            breaker.record_success()
+            return connection
+
+    @classmethod
+    def _on_error(cls, context, shard: int = 0):
+        # A pooled connection dropped mid-query counts against the breaker too
+        if context.is_disconnect:
+            cls.breaker_for(shard).record_failure(context.original_exception)
+
+
+for _shard, _shard_engine in enumerate(shard_engines):
+    DbConnectGuard.install(_shard_engine, _shard)
+
+
+def create_engines(pool_size: int, max_overflow: int = 0) -> list:
+    """
+    A second set of shard engines with their own pools, for work that must
+    not draw on the request path's connections (background jobs)
+    """
+    engines = [
+        _create_engine(url, shard, pool_size, max_overflow)
+        for shard, url in enumerate(_shard_urls)
+    ]
+    for shard, target_engine in enumerate(engines):
+        QueryCacheStats.install(target_engine)
+        DbConnectGuard.install(target_engine, shard)
+    return engines
+
+
+# Request state attribute through which /batch shares one session with its sub-requests
+SHARED_SESSION_STATE = "db_session"
+
+
+def get_db_session(request: Request = None):
     """Create database session and yield it"""
-    retries = 3
-    delay = 2
-    for i in range(retries):
-        db = SessionLocal()
+    shared = getattr(request.state, SHARED_SESSION_STATE, None) if request is not None else None
+    if shared is not None:
+        # Owned and closed by the enclosing batch request
+        yield shared
+        return
+    breaker = DbConnectGuard.breaker
+    # Leave a half-open probe for the connect itself; the session may not need one
+    if not breaker.allow(claim_probe=False):
+        raise DatabaseUnavailableException(breaker.retry_after())
+    db = SessionLocal()
+    try:
+        yield db
+    except OperationalError as exc:
+        if not is_connection_error(exc):
+            raise
+        raise DatabaseUnavailableException(breaker.retry_after()) from exc
+    finally:
         try:
-            yield db
-            break
+            db.close()
         except OperationalError:
-            if i < retries - 1:
-                time.sleep(delay)
-            else:
-                raise
-        finally:
-            try:
-                db.close()
-            except OperationalError:
-                pass
+            pass
+
+
+def get_shard_sessions(db=Depends(get_db_session)) -> Optional[ShardSessions]:
+    """Per-request sessions for every shard (None when not sharded)"""
+    if shard_router is None:
+        yield None
+        return
+    shards = shard_router.sessions(primary=db)
+    try:
+        yield shards
+    finally:
+        shards.close()
 
 
 def close_db_session(db_session):
@@ -0,0 +1,150 @@
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException
+
+
+class DbExecutorSaturatedException(HTTPException):
+    """Exception raised when the DB executor queue is full"""
+
+    def __init__(self, route: str):
+        super().__init__(
+            status_code=503,
+            detail=f"Database busy, request for {route} rejected",
+            headers={"Retry-After": "1"},
+        )
+
+
+class RouteMetrics:
+    """Queue and wait-time counters for one route"""
+
+    __slots__ = ("calls", "rejected", "queued", "max_queued", "wait_total", "wait_max")
+
+    def __init__(self):
+        self.calls = 0
+        self.rejected = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "rejected": self.rejected,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "wait_avg_ms": round(self.wait_total / self.calls * 1000, 3) if self.calls else 0.0,
+            "wait_max_ms": round(self.wait_max * 1000, 3),
+        }
+
+
+class DbExecutor:
+    """
+    Dedicated thread pool for blocking repository work
+    - Sized from the SQLAlchemy pool (POOL_SIZE + MAX_OVERFLOW) so a thread
+      never waits on pool_timeout for a connection that cannot exist
+    - At most DB_EXECUTOR_QUEUE calls may wait for a thread; beyond that new
+      calls are rejected with 503 instead of piling up
+    """
+
+    _executor = None
+    _workers = 0
+    _max_queue = 0
+    _in_flight = 0
+    _metrics = {}
+    _lock = threading.Lock()
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def default_workers() -> int:
+        return int(
+            os.getenv(
+                "DB_EXECUTOR_WORKERS",
+                int(os.getenv("POOL_SIZE", 32)) + int(os.getenv("MAX_OVERFLOW", 64)),
+            )
+        )
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        if cls._executor is None:
+            with cls._lock:
+                if cls._executor is None:
+                    cls._workers = cls.default_workers()
+                    cls._max_queue = int(os.getenv("DB_EXECUTOR_QUEUE", cls._workers))
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=cls._workers, thread_name_prefix="db-executor"
+                    )
+        return cls._executor
+
+    @classmethod
+    def _route_metrics(cls, route: str) -> RouteMetrics:
+        metrics = cls._metrics.get(route)
+        if metrics is None:
+            metrics = cls._metrics.setdefault(route, RouteMetrics())
+        return metrics
+
+    @classmethod
+    async def run(cls, route: str, func, *args):
+        """Run func(*args) on the DB executor, rejecting when saturated"""
+        executor = cls.get_executor()
+        with cls._lock:
+            metrics = cls._route_metrics(route)
+            if cls._in_flight >= cls._workers + cls._max_queue:
+                metrics.rejected += 1
+                raise DbExecutorSaturatedException(route)
+            cls._in_flight += 1
+            metrics.queued += 1
+            metrics.max_queued = max(metrics.max_queued, metrics.queued)
+        submitted = time.perf_counter()
+        started = False
+
+        def call():
+            nonlocal started
+            waited = time.perf_counter() - submitted
+            with cls._lock:
+                started = True
+                metrics.queued -= 1
+                metrics.calls += 1
+                metrics.wait_total += waited
+                metrics.wait_max = max(metrics.wait_max, waited)
+            return func(*args)
+
+        def release(_future):
+            # Runs when the thread is done (or the call was cancelled before a
+            # thread picked it up), not when the awaiting request goes away, so
+            # in_flight keeps counting queries that are still running
+            with cls._lock:
+                cls._in_flight -= 1
+                if not started:
+                    metrics.queued -= 1
+
+        # Copy the context so contextvars (e.g. the current trace span) follow the call
+        context = contextvars.copy_context()
+        future = executor.submit(context.run, call)
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    @classmethod
+    def snapshot(cls) -> dict:
+        """Current executor state and per-route metrics"""
+        with cls._lock:
+            return {
+                "workers": cls._workers,
+                "max_queue": cls._max_queue,
+                "in_flight": cls._in_flight,
+                "routes": {route: m.to_dict() for route, m in cls._metrics.items()},
+            }
+
+    @classmethod
+    def shutdown(cls):
+        with cls._lock:
+            executor, cls._executor = cls._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -0,0 +1,59 @@
+import os
+import tempfile
+import threading
+
+from app.config.json_config import JsonConfig
+from app.utility.feed.change_feed_utility import ChangeFeed
+
+
+def sse_frame(event_id: int, line: bytes) -> bytes:
+    """Format one change-log line as a Server-Sent Events frame"""
+    event_type = JsonConfig.get_codec().loads(line)["type"]
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (event_id, event_type.encode(), line.rstrip())
+
+
+class FeedConfig:
+    """
+    Change feeds shared by all workers on the host
+    - CHANGE_FEED_ENABLED turns publishing and the SSE endpoints on
+    """
+
+    _feeds = {}
+    _lock = threading.Lock()
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return os.getenv("CHANGE_FEED_ENABLED", "False").lower() == "true"
+
+    @classmethod
+    def get_feed(cls, name: str) -> ChangeFeed:
+        feed = cls._feeds.get(name)
+        if feed is None:
+            with cls._lock:
+                feed = cls._feeds.get(name)
+                if feed is None:
+                    feed = ChangeFeed(
+                        os.getenv(
+                            "CHANGE_FEED_DIR",
+                            os.path.join(tempfile.gettempdir(), "fastapi-feed"),
+                        ),
+                        name,
+                        segment_bytes=int(os.getenv("CHANGE_FEED_SEGMENT_BYTES", 8 * 1024 * 1024)),
+                        keep_segments=int(os.getenv("CHANGE_FEED_KEEP_SEGMENTS", "4")),
+                        queue_size=int(os.getenv("CHANGE_FEED_QUEUE_SIZE", "256")),
+                        poll_interval=float(os.getenv("CHANGE_FEED_POLL_INTERVAL", "0.1")),
+                        formatter=sse_frame,
+                        codec=JsonConfig.get_codec(),
+                    )
+                    cls._feeds[name] = feed
+        return feed
+
+    @classmethod
+    def publish(cls, name: str, event_type: str, data):
+        """Publish a committed change"""
+        if not cls.is_enabled():
+            return
+        cls.get_feed(name).publish(event_type, data)
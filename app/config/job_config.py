@@ -0,0 +1,109 @@
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from sqlalchemy.orm import sessionmaker
+
+from app.config.db_config import create_engines, shard_router
+from app.config.logging_config import LoggingConfig
+from app.example.job.example_jobs import (
+    EXPORT_JOB,
+    IMPORT_JOB,
+    export_examples,
+    import_examples,
+)
+from app.job.runner.job_runner import JobRunner
+from app.utility.db.shard_router_utility import ShardRouter
+
+
+class JobConfig:
+    """
+    Background job workers (JOBS_ENABLED)
+    - Workers use their own engines, capped at JOB_POOL_SIZE connections per
+      shard, so long imports and exports never take connections or threads
+      from request handling
+    - Jobs can be submitted and queried from any process; only processes with
+      JOBS_ENABLED run them
+    """
+
+    _runner = None
+    _engines = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return os.getenv("JOBS_ENABLED", "False").lower() == "true"
+
+    @staticmethod
+    def handlers() -> dict:
+        """Job type -> handler"""
+        return {
+            IMPORT_JOB: import_examples,
+            EXPORT_JOB: export_examples,
+        }
+
+    @staticmethod
+    def output_dir() -> Path:
+        # Must be shared storage when job workers run on more than one host
+        return Path(
+            os.getenv("JOB_OUTPUT_DIR", os.path.join(tempfile.gettempdir(), "fastapi-jobs"))
+        )
+
+    @classmethod
+    def get_runner(cls):
+        """The runner of this process, or None when job workers are disabled"""
+        if cls._runner is None and cls.is_enabled():
+            with cls._lock:
+                if cls._runner is None:
+                    workers = int(os.getenv("JOB_WORKERS", 2))
+                    # Created on first use, i.e. in each worker process after the fork
+                    cls._engines = create_engines(
+                        pool_size=int(os.getenv("JOB_POOL_SIZE", workers)), max_overflow=0
+                    )
+                    cls._runner = JobRunner(
+                        sessionmaker(autocommit=False, autoflush=False, bind=cls._engines[0]),
+                        cls.handlers(),
+                        cls.output_dir(),
+                        workers=workers,
+                        router=(
+                            ShardRouter(cls._engines, shard_router.max_workers)
+                            if shard_router is not None
+                            else None
+                        ),
+                        poll_interval=float(os.getenv("JOB_POLL_INTERVAL", 1.0)),
+                        progress_interval=float(os.getenv("JOB_PROGRESS_INTERVAL", 0.5)),
+                        stale_after=float(os.getenv("JOB_STALE_SECONDS", 300)),
+                    )
+        return cls._runner
+
+    @classmethod
+    def wake(cls):
+        """Let an idle local worker pick up a newly submitted job right away"""
+        if cls._runner is not None:
+            cls._runner.wake()
+
+    @classmethod
+    def start(cls):
+        """Start the job workers (called from the app lifespan)"""
+        runner = cls.get_runner()
+        if runner is None:
+            return
+        runner.start()
+        LoggingConfig.get_logger().info(f"Job workers started ({runner.workers})")
+
+    @classmethod
+    def stop(cls):
+        with cls._lock:
+            runner, engines = cls._runner, cls._engines
+            cls._runner, cls._engines = None, None
+        if runner is None:
+            return
+        runner.stop(timeout=float(os.getenv("JOB_SHUTDOWN_TIMEOUT", 30)))
+        if runner.router is not None:
+            runner.router.shutdown()
+        for job_engine in engines:
+            job_engine.dispose()
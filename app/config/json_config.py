@@ -0,0 +1,39 @@
+import os
+import threading
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+from app.utility.json.json_utility import JsonUtility, create_json_backend
+
+
+class JsonConfig:
+    """
+    Process-wide JSON codec
+    - JSON_BACKEND selects auto (orjson when installed), orjson or stdlib
+    """
+
+    _codec = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def backend_name() -> str:
+        return os.getenv("JSON_BACKEND", "auto").lower()
+
+    @classmethod
+    def get_codec(cls) -> JsonUtility:
+        if cls._codec is None:
+            with cls._lock:
+                if cls._codec is None:
+                    cls._codec = JsonUtility(create_json_backend(cls.backend_name()))
+        return cls._codec
+
+
+class JsonCodecResponse(JSONResponse):
+    """JSONResponse rendered by the configured JSON codec"""
+
+    def render(self, content: Any) -> bytes:
+        return JsonConfig.get_codec().dumps(content)
@@ -1,10 +1,12 @@
 import os
+import threading
 from logging.handlers import TimedRotatingFileHandler
 import logging
 
 
 class LoggingConfig:
     _instance = None
+    _lock = threading.Lock()
 
     def __init__(self):
         if LoggingConfig._instance is not None:
@@ -33,5 +35,8 @@ class LoggingConfig:
     @staticmethod
     def get_logger():
         if LoggingConfig._instance is None:
-            LoggingConfig()
+            # Without the GIL two threads can both see None and attach handlers twice
+            with LoggingConfig._lock:
+                if LoggingConfig._instance is None:
+                    LoggingConfig()
         return LoggingConfig._instance
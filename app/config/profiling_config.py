@@ -0,0 +1,25 @@
+import os
+
+from app.middleware.profiling_middleware import ProfilingMiddleware
+
+
+class ProfilingConfig:
+    def __init__(self):
+        pass
+
+    @classmethod
+    def init_profiling(cls, app=None):
+        """Install the profiler only when enabled, so it costs nothing otherwise"""
+        sample_rate = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+        secret = os.getenv("PROFILE_SECRET", "")
+        if sample_rate <= 0 and not secret:
+            return
+
+        app.add_middleware(
+            ProfilingMiddleware,
+            sample_rate=sample_rate,
+            secret=secret,
+            output_dir=os.getenv("PROFILE_DIR", "/tmp/profiles"),
+            max_files=int(os.getenv("PROFILE_MAX_FILES", "200")),
+            interval=float(os.getenv("PROFILE_INTERVAL_MS", "1")) / 1000,
+        )
@@ -0,0 +1,50 @@
+import os
+import tempfile
+
+from app.middleware.rate_limit_middleware import RateLimitMiddleware, RateLimitRule
+from app.utility.rate_limit.rate_limit_utility import SharedTokenBuckets
+
+
+class RateLimitConfig:
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def parse_rules(spec: str):
+        """
+        Parse RATE_LIMIT_RULES: "METHOD /path/prefix=rate:burst;..."
+        METHOD may be * to match any method
+        """
+        rules = []
+        for index, item in enumerate(filter(None, (part.strip() for part in spec.split(";")))):
+            target, _, limit = item.partition("=")
+            method, _, path_prefix = target.strip().partition(" ")
+            rules.append(
+                RateLimitRule.parse(
+                    f"rule{index}",
+                    limit.strip(),
+                    None if method == "*" else method.upper(),
+                    path_prefix.strip(),
+                )
+            )
+        return rules
+
+    @classmethod
+    def init_rate_limit(cls, app=None):
+        if os.getenv("RATE_LIMIT_ENABLED", "False").lower() != "true":
+            return
+
+        app.add_middleware(
+            RateLimitMiddleware,
+            buckets=SharedTokenBuckets(
+                os.getenv(
+                    "RATE_LIMIT_FILE",
+                    os.path.join(tempfile.gettempdir(), "fastapi-rate-limit.bin"),
+                ),
+                slots=int(os.getenv("RATE_LIMIT_SLOTS", "65536")),
+            ),
+            read_rule=RateLimitRule.parse("read", os.getenv("RATE_LIMIT_READ", "50:100")),
+            write_rule=RateLimitRule.parse("write", os.getenv("RATE_LIMIT_WRITE", "5:10")),
+            rules=cls.parse_rules(os.getenv("RATE_LIMIT_RULES", "")),
+            api_keys=[key for key in map(str.strip, os.getenv("RATE_LIMIT_API_KEYS", "").split(",")) if key],
+        )
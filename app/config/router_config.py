@@ -1,6 +1,12 @@
+from app.batch.controller.batch_controller import batch_router
 from app.example.controller.example_controller import example_router
+from app.job.controller.job_controller import job_router
+from app.system.controller.system_controller import system_router
 
 
 class RoutesConfig:
     def __init__(self, app):
         app.include_router(example_router)
+        app.include_router(system_router)
+        app.include_router(batch_router)
+        app.include_router(job_router)
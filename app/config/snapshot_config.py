@@ -0,0 +1,79 @@
+import asyncio
+import os
+import threading
+
+from anyio.to_thread import run_sync as anyio_run_sync
+
+from app.config.db_config import SessionLocal, shard_router
+from app.config.logging_config import LoggingConfig
+from app.example.snapshot.example_snapshot import ExampleSnapshot
+
+
+class SnapshotConfig:
+    """
+    Optional in-process snapshot of the examples table for read-mostly
+    deployments (SNAPSHOT_ENABLED); each worker keeps and refreshes its own
+    """
+
+    _snapshot = None
+    _task = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def is_enabled() -> bool:
+        # The snapshot tails a single database; it is not available when sharded
+        return os.getenv("SNAPSHOT_ENABLED", "False").lower() == "true" and shard_router is None
+
+    @classmethod
+    def get_snapshot(cls):
+        """The snapshot, or None when the mode is disabled"""
+        if cls._snapshot is None and cls.is_enabled():
+            # Called from the refresher thread and request threads at once
+            with cls._lock:
+                if cls._snapshot is None:
+                    cls._snapshot = ExampleSnapshot(
+                        max_staleness=float(os.getenv("SNAPSHOT_MAX_STALENESS", "5")),
+                        reconcile_every=int(os.getenv("SNAPSHOT_RECONCILE_EVERY", "60")),
+                        max_bytes=int(os.getenv("SNAPSHOT_MAX_MB", "256")) * 1024 * 1024,
+                        detect_deletes=os.getenv("SNAPSHOT_DETECT_DELETES", "False").lower()
+                        == "true",
+                    )
+        return cls._snapshot
+
+    @classmethod
+    def refresh_once(cls):
+        with SessionLocal() as db:
+            cls.get_snapshot().refresh(db)
+
+    @classmethod
+    async def _refresh_loop(cls, interval: float):
+        logger = LoggingConfig.get_logger()
+        while True:
+            try:
+                await anyio_run_sync(cls.refresh_once)
+            except Exception as exc:
+                # Keep the last snapshot; it stops serving once it is too stale
+                logger.warning(f"Snapshot refresh failed: {exc}")
+            await asyncio.sleep(interval)
+
+    @classmethod
+    def start(cls):
+        """Start the background refresher (called from the app lifespan)"""
+        if not cls.is_enabled() or cls._task is not None:
+            return
+        interval = float(os.getenv("SNAPSHOT_REFRESH_INTERVAL", "1"))
+        cls._task = asyncio.get_running_loop().create_task(cls._refresh_loop(interval))
+
+    @classmethod
+    async def stop(cls):
+        if cls._task is None:
+            return
+        cls._task.cancel()
+        try:
+            await cls._task
+        except asyncio.CancelledError:
+            pass
+        cls._task = None
@@ -0,0 +1,37 @@
+import os
+import sys
+
+from app.config.db_config import shard_router
+from app.config.db_executor_config import DbExecutor
+
+
+class ThreadConfig:
+    """
+    Controls where blocking service calls run
+    - THREADED_HANDLERS=False (default): call inline on the event loop
+    - THREADED_HANDLERS=True: run on the dedicated DB executor so a
+      free-threaded (no-GIL) build can execute handlers on several cores in
+      one process
+    - Sharded (SHARD_HOSTS): always the DB executor, since scatter reads wait
+      on every shard and must not hold up the event loop while they do
+    """
+
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def is_threaded() -> bool:
+        return os.getenv("THREADED_HANDLERS", "False").lower() == "true"
+
+    @staticmethod
+    def is_gil_enabled() -> bool:
+        """False only on a free-threaded build running with the GIL disabled"""
+        check = getattr(sys, "_is_gil_enabled", None)
+        return True if check is None else check()
+
+    @classmethod
+    async def run_sync(cls, func, *args, route: str = "default"):
+        """Run a blocking callable according to the configured mode"""
+        if not cls.is_threaded() and shard_router is None:
+            return func(*args)
+        return await DbExecutor.run(route, func, *args)
@@ -0,0 +1,76 @@
+import os
+
+from sqlalchemy import event
+
+from app.config.db_config import shard_engines
+from app.config.json_config import JsonConfig
+from app.middleware.tracing_middleware import TracingMiddleware
+from app.utility.trace.trace_utility import SPAN_KIND_CLIENT, FileSpanExporter, Tracer
+
+
+class TracingConfig:
+    def __init__(self):
+        pass
+
+    @classmethod
+    def init_tracing(cls, app=None):
+        """Install request and SQL tracing when TRACE_SAMPLE_RATE or TRACE_FILE is set"""
+        sample_rate = float(os.getenv("TRACE_SAMPLE_RATE", "0"))
+        trace_file = os.getenv("TRACE_FILE", "")
+        if sample_rate <= 0 and not trace_file:
+            return
+
+        Tracer.configure(
+            sample_rate,
+            FileSpanExporter(
+                trace_file or "/tmp/traces/spans.jsonl",
+                os.getenv("APP_TITLE", "FastAPI Service"),
+                codec=JsonConfig.get_codec(),
+                queue_size=int(os.getenv("TRACE_QUEUE_SIZE", "1024")),
+            ),
+        )
+        for shard_engine in shard_engines:
+            cls.instrument_engine(shard_engine)
+        app.add_middleware(
+            TracingMiddleware,
+            trusted_networks=[
+                network
+                for network in os.getenv("TRACE_TRUSTED_NETWORKS", "").split(",")
+                if network.strip()
+            ],
+        )
+
+    @staticmethod
+    def flush():
+        """Wait for queued traces to be written (called from the app lifespan)"""
+        if Tracer.exporter is not None:
+            Tracer.exporter.flush()
+
+    @staticmethod
+    def instrument_engine(target_engine):
+        """Create a span around every cursor execute of a sampled request"""
+
+        @event.listens_for(target_engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if Tracer.current_span() is None:
+                return
+            operation = statement.lstrip().split(" ", 1)[0].upper()
+            span, token = Tracer.start_span(f"SQL {operation}", SPAN_KIND_CLIENT)
+            span.set_attribute("db.system", target_engine.dialect.name)
+            span.set_attribute("db.statement", statement[:1000])
+            context._trace_span = (span, token)
+
+        @event.listens_for(target_engine, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            traced = getattr(context, "_trace_span", None)
+            if traced is not None:
+                context._trace_span = None
+                Tracer.end_span(*traced)
+
+        @event.listens_for(target_engine, "handle_error")
+        def handle_error(exception_context):
+            context = exception_context.execution_context
+            traced = getattr(context, "_trace_span", None)
+            if traced is not None:
+                context._trace_span = None
+                Tracer.end_span(*traced, exception_context.original_exception)
@@ -1,28 +1,118 @@
-from fastapi import APIRouter, Depends, status
+from typing import List, Optional
+
+from anyio.to_thread import run_sync as anyio_run_sync
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from app.example.models.schema.example_schema import (
     ExampleCreateRequest,
     ExampleUpdateRequest,
     ExampleResponse,
 )
+from app.config.cache_config import CacheConfig
+from app.config.feed_config import FeedConfig
+from app.config.thread_config import ThreadConfig
 from app.example.service.example_service import ExampleService
 from app.example.dependencies import get_example_service
+from app.example.exception import ExampleValidationError
+from app.example.models.entity.example_entity import ExampleEntity
 from app.models.response import ApiResponse, ApiListResponse
+from app.utility.feed.change_feed_utility import RESET
+from app.utility.trace.trace_utility import TracedRoute
+
+example_router = APIRouter(
+    prefix="/api/v1/examples", tags=["Example"], route_class=TracedRoute
+)
+
+MAX_IDS_PER_REQUEST = 500
 
-example_router = APIRouter(prefix="/api/v1/examples", tags=["Example"])
+
+def _parse_ids(values: List[str]) -> List[int]:
+    """Parse ids given as ?ids=1,2,3 and/or ?ids=1&ids=2"""
+    try:
+        ids = [int(part) for value in values for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise ExampleValidationError("ids must be comma-separated integers")
+    if len(ids) > MAX_IDS_PER_REQUEST:
+        raise ExampleValidationError(f"At most {MAX_IDS_PER_REQUEST} ids per request")
+    return ids
 
 
 @example_router.get(
     "/",
     response_model=ApiListResponse[ExampleResponse],
     summary="取得所有 Examples",
-    description="取得所有 Example 資料列表",
+    description="取得所有 Example 資料列表；帶 `ids` 時以單一查詢取得指定的 Examples "
+    "(依 ids 順序，不存在的 id 略過)",
 )
-async def get_examples(service: ExampleService = Depends(get_example_service)):
+async def get_examples(
+    request: Request,
+    ids: Optional[List[str]] = Query(None, description="逗號分隔的 Example ID，如 1,2,3"),
+    service: ExampleService = Depends(get_example_service),
+):
     """取得所有 Examples"""
-    examples = service.get_all()
-    data = [ExampleResponse.model_validate(dto.to_dict()) for dto in examples]
-    return ApiListResponse.success(data=data, message="get list success")
+    if ids is not None:
+        examples = await ThreadConfig.run_sync(
+            service.get_by_ids, _parse_ids(ids), route="get_examples_by_ids"
+        )
+        data = [ExampleResponse.model_validate(dto.to_dict()) for dto in examples]
+        return ApiListResponse.success(data=data, message="get list success")
+
+    if not CacheConfig.is_enabled():
+        examples = await ThreadConfig.run_sync(service.get_all, route="get_examples")
+        data = [ExampleResponse.model_validate(dto.to_dict()) for dto in examples]
+        return ApiListResponse.success(data=data, message="get list success")
+
+    # Serialized bytes are cached per route + query string + table version
+    table = ExampleEntity.__tablename__
+    version = CacheConfig.get_table_version(table).get()
+    cache = CacheConfig.get_response_cache(table)
+    cache_key = f"{request.url.path}?{sorted(request.query_params.multi_items())}"
+    # Memory hits stay on the loop; the shared file store is read and written on a thread
+    content = cache.get_memory(cache_key, version)
+    if content is None:
+        content = await anyio_run_sync(cache.get, cache_key, version)
+    if content is None:
+        examples = await ThreadConfig.run_sync(service.get_all, route="get_examples")
+        data = [ExampleResponse.model_validate(dto.to_dict()) for dto in examples]
+        body = ApiListResponse[ExampleResponse].success(data=data, message="get list success")
+        content = body.model_dump_json().encode()
+        await anyio_run_sync(cache.put, cache_key, version, content)
+    return Response(content=content, media_type="application/json")
+
+
+@example_router.get(
+    "/changes",
+    summary="Example 變更串流",
+    description="以 Server-Sent Events 推送 Example 的新增、更新與刪除事件，"
+    "斷線後以 Last-Event-ID 續傳",
+    response_class=StreamingResponse,
+)
+async def stream_example_changes(
+    last_event_id: Optional[int] = Header(None, alias="Last-Event-ID"),
+    since: Optional[int] = Query(None, description="同 Last-Event-ID，供無法設定 header 的客戶端使用"),
+):
+    """Example 變更串流"""
+    if not FeedConfig.is_enabled():
+        raise HTTPException(status_code=503, detail="Change feed is disabled")
+    feed = FeedConfig.get_feed(ExampleEntity.__tablename__)
+    resume_from = last_event_id if last_event_id is not None else since
+
+    async def frames():
+        yield b"retry: 3000\n\n"
+        async for event_id, payload in feed.subscribe(resume_from):
+            if event_id is None:
+                yield b": keepalive\n\n"
+            elif payload is RESET:
+                yield b"id: %d\nevent: reset\ndata: {}\n\n" % event_id
+            else:
+                yield payload
+
+    return StreamingResponse(
+        frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @example_router.get(
@@ -35,7 +125,9 @@ async def get_example(
     example_id: int, service: ExampleService = Depends(get_example_service)
 ):
     """取得單一 Example"""
-    dto = service.get_by_id(example_id)
+    dto = await ThreadConfig.run_sync(
+        service.get_by_id, example_id, route="get_example"
+    )
     data = ExampleResponse.model_validate(dto.to_dict())
     return ApiResponse.success(data=data, message="get example success")
 
@@ -52,7 +144,9 @@ async def create_example(
     service: ExampleService = Depends(get_example_service),
 ):
     """建立新 Example"""
-    dto = service.create(request)
+    dto = await ThreadConfig.run_sync(
+        service.create, request, route="create_example"
+    )
     data = ExampleResponse.model_validate(dto.to_dict())
     return ApiResponse.success(data=data, message="create success", status="201")
 
@@ -69,7 +163,9 @@ async def update_example(
     service: ExampleService = Depends(get_example_service),
 ):
     """更新 Example"""
-    dto = service.update(example_id, request)
+    dto = await ThreadConfig.run_sync(
+        service.update, example_id, request, route="update_example"
+    )
     data = ExampleResponse.model_validate(dto.to_dict())
     return ApiResponse.success(data=data, message="update success")
 
@@ -84,5 +180,7 @@ async def delete_example(
     example_id: int, service: ExampleService = Depends(get_example_service)
 ):
     """刪除 Example"""
-    service.delete(example_id)
+    await ThreadConfig.run_sync(
+        service.delete, example_id, route="delete_example"
+    )
     return ApiResponse.success(data=None, message="delete success")
@@ -1,15 +1,22 @@
 """
 Dependency Injection module for Example feature
 """
+from typing import Optional
+
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
-from app.config.db_config import get_db_session
+from app.config.db_config import get_db_session, get_shard_sessions
+from app.config.snapshot_config import SnapshotConfig
 from app.example.repository.example_repository import ExampleRepository
 from app.example.service.example_service import ExampleService
+from app.utility.db.shard_router_utility import ShardSessions
 
 
-def get_example_service(db: Session = Depends(get_db_session)) -> ExampleService:
+def get_example_service(
+    db: Session = Depends(get_db_session),
+    shards: Optional[ShardSessions] = Depends(get_shard_sessions),
+) -> ExampleService:
     """Dependency injection for ExampleService"""
-    repository = ExampleRepository(db)
-    return ExampleService(repository)
+    repository = ExampleRepository(db, shards)
+    return ExampleService(repository, SnapshotConfig.get_snapshot())
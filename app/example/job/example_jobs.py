@@ -0,0 +1,83 @@
+"""
+Background job handlers for examples (registered in JobConfig)
+
+Handlers run on job worker threads with sessions from the job engines and go
+through the same ExampleService / ExampleRepository as the request path, so
+cache invalidation, the change feed and sharding behave identically.
+"""
+import os
+
+from pydantic import ValidationError
+
+from app.config.json_config import JsonConfig
+from app.config.snapshot_config import SnapshotConfig
+from app.example.models.schema.example_schema import ExampleCreateRequest
+from app.example.repository.example_repository import ExampleRepository
+from app.example.service.example_service import ExampleService
+from app.job.runner.job_runner import JobContext
+
+IMPORT_JOB = "examples.import"
+EXPORT_JOB = "examples.export"
+# Per-item errors kept in an import result; the rest are only counted
+MAX_IMPORT_ERRORS = 100
+
+
+def _service(context: JobContext) -> ExampleService:
+    return ExampleService(
+        ExampleRepository(context.db, context.shards), SnapshotConfig.get_snapshot()
+    )
+
+
+def import_examples(context: JobContext, params: dict) -> dict:
+    """
+    Create every entry of params["items"] ({name, description}); invalid entries are skipped
+
+    Creating is not idempotent, so a requeued import resumes after the items
+    its earlier run got through; those are only re-validated for the result
+    """
+    items = params.get("items")
+    if not isinstance(items, list):
+        raise ValueError("params.items must be a list")
+    service = _service(context)
+    resume_from = min(context.resume_from, len(items))
+    context.progress = resume_from
+    context.set_total(len(items))
+    created, errors = 0, []
+    for index, item in enumerate(items):
+        try:
+            request = ExampleCreateRequest.model_validate(item)
+        except ValidationError as exc:
+            if len(errors) < MAX_IMPORT_ERRORS:
+                errors.append({"index": index, "error": exc.errors()[0]["msg"]})
+        else:
+            if index >= resume_from:
+                service.create(request)
+            created += 1
+        if index >= resume_from:
+            context.advance()
+    return {"created": created, "failed": len(items) - created, "errors": errors}
+
+
+def export_examples(context: JobContext, params: dict) -> dict:
+    """Write every example to a JSON array file in the job output directory"""
+    dtos = _service(context).get_all()
+    context.set_total(len(dtos))
+
+    def items():
+        for dto in dtos:
+            yield dto.to_dict()
+            context.advance()
+
+    name = f"examples-{context.job_id}.json"
+    path = context.output_path(name)
+    partial = path.with_suffix(".part")
+    try:
+        with open(partial, "wb") as file:
+            for chunk in JsonConfig.get_codec().iter_array(items()):
+                file.write(chunk)
+        # Readers only ever see a complete file
+        os.replace(partial, path)
+    finally:
+        if partial.exists():
+            partial.unlink()
+    return {"file": name, "count": len(dtos)}
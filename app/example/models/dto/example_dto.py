@@ -1,11 +1,14 @@
-from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, List, NamedTuple, Optional
 
 
-@dataclass
-class ExampleDTO:
-    """Data Transfer Object for Example - used for passing data between layers"""
+class ExampleDTO(NamedTuple):
+    """
+    Data Transfer Object for Example - used for passing data between layers
+
+    Immutable and tuple-backed (no per-instance __dict__); field order matches
+    the column order of ExampleRepository.find_all_rows so rows convert directly.
+    """
 
     id: Optional[int] = None
     name: str = ""
@@ -24,6 +27,11 @@ class ExampleDTO:
             updated_at=entity.updated_at,
         )
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> List["ExampleDTO"]:
+        """Convert (id, name, description, created_at, updated_at) rows to DTOs"""
+        return list(map(cls._make, rows))
+
     def to_dict(self) -> dict:
         """Convert DTO to dictionary"""
         return {
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
+from sqlalchemy import Column, Index, Integer, String, DateTime, Text
 from sqlalchemy.sql import func
 
 from app.config.db_config import Base
@@ -8,6 +8,11 @@ class ExampleEntity(Base):
     """Example database entity"""
 
     __tablename__ = "examples"
+    # Created by app/migration/versions/0002_add_examples_indexes.py
+    __table_args__ = (
+        Index("ix_examples_name", "name"),
+        Index("ix_examples_updated_at", "updated_at"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(255), nullable=False)
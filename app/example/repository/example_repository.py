@@ -1,53 +1,130 @@
+from collections import defaultdict
+from operator import attrgetter, itemgetter
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, bindparam, exists, func, select
+from sqlalchemy.orm import Session, object_session
 
 from app.example.models.entity.example_entity import ExampleEntity
+from app.utility.db.shard_router_utility import ShardSessions
+from app.utility.trace.trace_utility import traced_class
 
+# Statements are built once at import and executed with bound parameters, so
+# the hot path skips per-call construction and hits the compiled cache.
+_SELECT_ALL = select(ExampleEntity)
+# Column-only select for read paths: plain rows, no identity map or instance state.
+# Column order is the field order of ExampleDTO.
+_SELECT_ALL_ROWS = select(
+    ExampleEntity.id,
+    ExampleEntity.name,
+    ExampleEntity.description,
+    ExampleEntity.created_at,
+    ExampleEntity.updated_at,
+)
+_SELECT_BY_ID = (
+    select(ExampleEntity).where(ExampleEntity.id == bindparam("example_id")).limit(1)
+)
+# Expanding parameter: one IN (...) query per call, cached per list length
+_SELECT_BY_IDS = select(ExampleEntity).where(
+    ExampleEntity.id.in_(bindparam("example_ids", expanding=True))
+)
+_SELECT_BY_NAME = (
+    select(ExampleEntity).where(ExampleEntity.name == bindparam("name")).limit(1)
+)
+_EXISTS_BY_ID = select(
+    exists().where(ExampleEntity.id == bindparam("example_id"))
+)
+_COUNT = select(func.count()).select_from(ExampleEntity)
 
+# Scatter-gather reads order each shard by id so the results merge in order
+_SELECT_ALL_BY_ID = _SELECT_ALL.order_by(ExampleEntity.id)
+_SELECT_ALL_ROWS_BY_ID = _SELECT_ALL_ROWS.order_by(ExampleEntity.id)
+_entity_id = attrgetter("id")
+_row_id = itemgetter(0)
+
+
+@traced_class
 class ExampleRepository:
-    """Repository for database operations on ExampleEntity"""
+    """
+    Repository for database operations on ExampleEntity
+    - With shards, reads by id go to the owning shard and list/count queries
+      scatter to every shard in parallel; without, everything uses `db`
+    """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, shards: Optional[ShardSessions] = None):
         self.db = db
+        self.shards = shards
+
+    def _db_for(self, example_id: int) -> Session:
+        return self.db if self.shards is None else self.shards.for_key(example_id)
 
     def find_all(self) -> List[ExampleEntity]:
         """Retrieve all examples from database"""
-        return self.db.query(ExampleEntity).all()
+        if self.shards is not None:
+            return self.shards.gather_sorted(
+                lambda db: db.scalars(_SELECT_ALL_BY_ID).all(), key=_entity_id
+            )
+        return self.db.scalars(_SELECT_ALL).all()
+
+    def find_all_rows(self) -> List[Row]:
+        """Retrieve all examples as read-only rows, skipping ORM bookkeeping"""
+        if self.shards is not None:
+            return self.shards.gather_sorted(
+                lambda db: db.execute(_SELECT_ALL_ROWS_BY_ID).all(), key=_row_id
+            )
+        return self.db.execute(_SELECT_ALL_ROWS).all()
+
+    def count(self) -> int:
+        """Count all examples"""
+        if self.shards is not None:
+            return sum(self.shards.scatter(lambda db: db.scalar(_COUNT)))
+        return self.db.scalar(_COUNT)
 
     def find_by_id(self, example_id: int) -> Optional[ExampleEntity]:
         """Find example by ID"""
-        return (
-            self.db.query(ExampleEntity)
-            .filter(ExampleEntity.id == example_id)
-            .first()
+        return self._db_for(example_id).scalars(_SELECT_BY_ID, {"example_id": example_id}).first()
+
+    def find_by_ids(self, example_ids: List[int]) -> List[ExampleEntity]:
+        """Find examples by IDs in a single query per shard (order not guaranteed)"""
+        if not example_ids:
+            return []
+        if self.shards is None:
+            return self.db.scalars(_SELECT_BY_IDS, {"example_ids": list(example_ids)}).all()
+        by_shard = defaultdict(list)
+        for example_id in example_ids:
+            by_shard[self.shards.router.shard_for(example_id)].append(example_id)
+        results = self.shards.router.map(
+            lambda item: item[0].scalars(_SELECT_BY_IDS, {"example_ids": item[1]}).all(),
+            [(self.shards.get(shard), ids) for shard, ids in by_shard.items()],
         )
+        return [entity for entities in results for entity in entities]
 
     def find_by_name(self, name: str) -> Optional[ExampleEntity]:
         """Find example by name"""
-        return (
-            self.db.query(ExampleEntity)
-            .filter(ExampleEntity.name == name)
-            .first()
-        )
+        if self.shards is not None:
+            found = self.shards.gather_sorted(
+                lambda db: db.scalars(_SELECT_BY_NAME, {"name": name}).all(), key=_entity_id
+            )
+            return found[0] if found else None
+        return self.db.scalars(_SELECT_BY_NAME, {"name": name}).first()
 
     def save(self, entity: ExampleEntity) -> ExampleEntity:
         """Save (create or update) an entity"""
-        self.db.add(entity)
-        self.db.commit()
-        self.db.refresh(entity)
+        db = self.db
+        if self.shards is not None:
+            # Updates stay on the shard the entity was loaded from
+            db = object_session(entity) or self.shards.for_insert()
+        db.add(entity)
+        db.commit()
+        db.refresh(entity)
         return entity
 
     def delete(self, entity: ExampleEntity) -> bool:
         """Delete an entity"""
-        self.db.delete(entity)
-        self.db.commit()
+        db = self.db if self.shards is None else object_session(entity)
+        db.delete(entity)
+        db.commit()
         return True
 
     def exists_by_id(self, example_id: int) -> bool:
         """Check if entity exists by ID"""
-        return (
-            self.db.query(ExampleEntity)
-            .filter(ExampleEntity.id == example_id)
-            .count()
-            > 0
-        )
+        return bool(self._db_for(example_id).scalar(_EXISTS_BY_ID, {"example_id": example_id}))
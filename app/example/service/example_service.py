@@ -1,5 +1,7 @@
-from typing import List
+from typing import List, Optional
 
+from app.config.cache_config import CacheConfig
+from app.config.feed_config import FeedConfig
 from app.example.exception import ExampleNotFoundException
 from app.example.models.dto.example_dto import ExampleDTO
 from app.example.models.entity.example_entity import ExampleEntity
@@ -8,26 +10,55 @@ from app.example.models.schema.example_schema import (
     ExampleUpdateRequest,
 )
 from app.example.repository.example_repository import ExampleRepository
+from app.example.snapshot.example_snapshot import ExampleSnapshot
+from app.utility.trace.trace_utility import traced_class
 
 
+@traced_class
 class ExampleService:
     """Service layer for business logic - uses Repository for data access"""
 
-    def __init__(self, repository: ExampleRepository):
+    def __init__(
+        self, repository: ExampleRepository, snapshot: Optional[ExampleSnapshot] = None
+    ):
         self.repository = repository
+        self.snapshot = snapshot
 
     def get_all(self) -> List[ExampleDTO]:
         """Get all examples and convert to DTOs"""
-        entities = self.repository.find_all()
-        return [ExampleDTO.from_entity(entity) for entity in entities]
+        if self.snapshot is not None and self.snapshot.is_serving():
+            return self.snapshot.get_all()
+        return ExampleDTO.from_rows(self.repository.find_all_rows())
 
     def get_by_id(self, example_id: int) -> ExampleDTO:
         """Get example by ID and convert to DTO"""
+        if self.snapshot is not None and self.snapshot.is_serving():
+            dto = self.snapshot.get(example_id)
+            if dto is not None:
+                return dto
         entity = self.repository.find_by_id(example_id)
         if not entity:
             raise ExampleNotFoundException(example_id)
         return ExampleDTO.from_entity(entity)
 
+    def get_by_ids(self, example_ids: List[int]) -> List[ExampleDTO]:
+        """Get examples by IDs in request order; unknown IDs are skipped"""
+        example_ids = list(dict.fromkeys(example_ids))
+        found = {}
+        missing = example_ids
+        if self.snapshot is not None and self.snapshot.is_serving():
+            missing = []
+            for example_id in example_ids:
+                dto = self.snapshot.get(example_id)
+                if dto is None:
+                    missing.append(example_id)
+                else:
+                    found[example_id] = dto
+        if missing:
+            for entity in self.repository.find_by_ids(missing):
+                found[entity.id] = ExampleDTO.from_entity(entity)
+        return [found[example_id] for example_id in example_ids if example_id in found]
+
     def create(self, request: ExampleCreateRequest) -> ExampleDTO:
         """
         Create a new example
@@ -41,7 +72,11 @@ class ExampleService:
             description=request.description,
         )
         saved_entity = self.repository.save(entity)
-        return ExampleDTO.from_entity(saved_entity)
+        dto = ExampleDTO.from_entity(saved_entity)
+        if self.snapshot is not None:
+            self.snapshot.apply(dto)
+        self._changed("created", dto.to_dict())
+        return dto
 
     def update(self, example_id: int, request: ExampleUpdateRequest) -> ExampleDTO:
         """
@@ -61,15 +96,28 @@ class ExampleService:
             entity.description = request.description
 
         saved_entity = self.repository.save(entity)
-        return ExampleDTO.from_entity(saved_entity)
+        dto = ExampleDTO.from_entity(saved_entity)
+        if self.snapshot is not None:
+            self.snapshot.apply(dto)
+        self._changed("updated", dto.to_dict())
+        return dto
 
     def delete(self, example_id: int) -> bool:
         """Delete an example by ID"""
         entity = self.repository.find_by_id(example_id)
         if not entity:
             raise ExampleNotFoundException(example_id)
-        return self.repository.delete(entity)
+        deleted = self.repository.delete(entity)
+        if self.snapshot is not None:
+            self.snapshot.remove(example_id)
+        self._changed("deleted", {"id": example_id})
+        return deleted
 
     def exists(self, example_id: int) -> bool:
         """Check if example exists"""
         return self.repository.exists_by_id(example_id)
+
+    def _changed(self, event_type: str, data: dict):
+        """Invalidate cached reads and publish a committed change"""
+        CacheConfig.bump(ExampleEntity.__tablename__)
+        FeedConfig.publish(ExampleEntity.__tablename__, event_type, data)
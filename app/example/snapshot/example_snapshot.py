@@ -0,0 +1,222 @@
+import sys
+import threading
+import time
+from array import array
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.example.models.dto.example_dto import ExampleDTO
+from app.example.models.entity.example_entity import ExampleEntity
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NULL_TIME = -(2**63)
+
+_COLUMNS = (
+    ExampleEntity.id,
+    ExampleEntity.name,
+    ExampleEntity.description,
+    ExampleEntity.created_at,
+    ExampleEntity.updated_at,
+)
+
+
+def _to_micros(value: Optional[datetime]) -> int:
+    return _NULL_TIME if value is None else (value - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(value: int) -> Optional[datetime]:
+    return None if value == _NULL_TIME else _EPOCH + value * _MICROSECOND
+
+
+class ExampleSnapshot:
+    """
+    Column-oriented, in-process copy of the examples table
+    - Incremental refresh reads rows with updated_at >= the high-water mark
+    - Deletes seen in this worker leave a tombstone; deletes from elsewhere
+      are caught by a periodic full reload (reconciliation). With
+      detect_deletes, each incremental refresh also compares the row count
+      (a COUNT(*) per refresh) and scans ids when rows have gone missing
+    - Reads are only served while the snapshot is younger than max_staleness
+    """
+
+    def __init__(
+        self,
+        max_staleness: float = 5.0,
+        reconcile_every: int = 60,
+        max_bytes: int = 256 * 1024 * 1024,
+        detect_deletes: bool = False,
+    ):
+        self.max_staleness = max_staleness
+        self.reconcile_every = reconcile_every
+        self.detect_deletes = detect_deletes
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._reset()
+        # example id -> sequence number of the local delete; a refresh skips
+        # rows this worker deleted after the refresh started reading
+        self._removed = {}
+        self._remove_seq = 0
+        self.high_water_mark = None
+        self.refreshed_at = None
+        self.refreshes = 0
+        self.last_refresh_seconds = 0.0
+        self.memory_bytes = 0
+        self.over_budget = False
+
+    def _reset(self):
+        self._ids = array("q")
+        self._names = []
+        self._descriptions = []
+        self._created = array("q")
+        self._updated = array("q")
+        self._alive = bytearray()
+        self._index = {}
+
+    # -- refresh -----------------------------------------------------------
+
+    def refresh(self, db: Session):
+        """Apply changes since the high-water mark, or reload everything periodically"""
+        started = time.perf_counter()
+        # Staleness counts from when the rows were read, not when applied
+        read_at = time.monotonic()
+        full = self.refreshed_at is None or self.refreshes % self.reconcile_every == 0
+        with self._lock:
+            read_seq = self._remove_seq
+            known = set(self._index) if self.detect_deletes and not full else None
+        stmt = select(*_COLUMNS)
+        if not full and self.high_water_mark is not None:
+            # >= because updated_at has second precision on MySQL DATETIME
+            stmt = stmt.where(ExampleEntity.updated_at >= self.high_water_mark)
+        rows = db.execute(stmt.order_by(ExampleEntity.id)).all()
+        deleted = ()
+        if known is not None:
+            known.update(row.id for row in rows)
+            count = db.scalar(select(func.count()).select_from(ExampleEntity))
+            if count < len(known):
+                # Rows this snapshot holds were deleted elsewhere; find which
+                deleted = known.difference(db.scalars(select(ExampleEntity.id)))
+
+        with self._lock:
+            if full:
+                self._reset()
+            for row in rows:
+                if self._removed.get(row.id, read_seq) <= read_seq:
+                    self._upsert(row)
+            for example_id in deleted:
+                self._tombstone(example_id)
+            # Deletes up to read_seq are reflected in what was just read
+            self._removed = {k: v for k, v in self._removed.items() if v > read_seq}
+            if full:
+                self.high_water_mark = None
+            for row in rows:
+                if row.updated_at is not None and (
+                    self.high_water_mark is None or row.updated_at > self.high_water_mark
+                ):
+                    self.high_water_mark = row.updated_at
+            self.refreshes += 1
+            self.refreshed_at = read_at
+            self.memory_bytes = self._measure()
+            self.over_budget = self.memory_bytes > self.max_bytes
+        self.last_refresh_seconds = time.perf_counter() - started
+
+    def _upsert(self, row):
+        index = self._index.get(row.id)
+        if index is None:
+            self._index[row.id] = len(self._ids)
+            self._ids.append(row.id)
+            self._names.append(row.name)
+            self._descriptions.append(row.description)
+            self._created.append(_to_micros(row.created_at))
+            self._updated.append(_to_micros(row.updated_at))
+            self._alive.append(1)
+        else:
+            self._names[index] = row.name
+            self._descriptions[index] = row.description
+            self._created[index] = _to_micros(row.created_at)
+            self._updated[index] = _to_micros(row.updated_at)
+            self._alive[index] = 1
+
+    def _measure(self) -> int:
+        size = sum(
+            sys.getsizeof(column)
+            for column in (self._ids, self._created, self._updated, self._alive, self._index)
+        )
+        size += sys.getsizeof(self._names) + sum(map(sys.getsizeof, self._names))
+        size += sys.getsizeof(self._descriptions) + sum(
+            sys.getsizeof(d) for d in self._descriptions if d is not None
+        )
+        return size
+
+    # -- local writes ------------------------------------------------------
+
+    def apply(self, dto: ExampleDTO):
+        """Reflect a write committed by this worker"""
+        with self._lock:
+            self._upsert(dto)
+
+    def remove(self, example_id: int):
+        """Tombstone a row deleted by this worker"""
+        with self._lock:
+            self._remove_seq += 1
+            self._removed[example_id] = self._remove_seq
+            self._tombstone(example_id)
+
+    def _tombstone(self, example_id: int):
+        index = self._index.pop(example_id, None)
+        if index is not None:
+            self._alive[index] = 0
+
+    # -- reads -------------------------------------------------------------
+
+    def is_serving(self) -> bool:
+        return (
+            self.refreshed_at is not None
+            and not self.over_budget
+            and time.monotonic() - self.refreshed_at <= self.max_staleness
+        )
+
+    def _dto(self, index: int) -> ExampleDTO:
+        return ExampleDTO(
+            id=self._ids[index],
+            name=self._names[index],
+            description=self._descriptions[index],
+            created_at=_from_micros(self._created[index]),
+            updated_at=_from_micros(self._updated[index]),
+        )
+
+    def get_all(self) -> List[ExampleDTO]:
+        with self._lock:
+            return [self._dto(i) for i in range(len(self._ids)) if self._alive[i]]
+
+    def get(self, example_id: int) -> Optional[ExampleDTO]:
+        with self._lock:
+            index = self._index.get(example_id)
+            return None if index is None else self._dto(index)
+
+    def metrics(self) -> dict:
+        with self._lock:
+            rows = len(self._index)
+            tombstones = len(self._ids) - rows
+        return {
+            "serving": self.is_serving(),
+            "rows": rows,
+            "tombstones": tombstones,
+            "memory_bytes": self.memory_bytes,
+            "max_bytes": self.max_bytes,
+            "staleness_seconds": (
+                round(time.monotonic() - self.refreshed_at, 3)
+                if self.refreshed_at is not None
+                else None
+            ),
+            "max_staleness_seconds": self.max_staleness,
+            # Without detect_deletes, deletes by other workers wait for the next full reload
+            "detect_deletes": self.detect_deletes,
+            "reconcile_every": self.reconcile_every,
+            "high_water_mark": self.high_water_mark,
+            "refreshes": self.refreshes,
+            "last_refresh_ms": round(self.last_refresh_seconds * 1000, 3),
+        }
@@ -0,0 +1,78 @@
+from fastapi import APIRouter, Depends, status
+from fastapi.responses import FileResponse
+
+from app.config.thread_config import ThreadConfig
+from app.job.dependencies import get_job_service
+from app.job.models.schema.job_schema import JobResponse, JobSubmitRequest
+from app.job.service.job_service import JobService
+from app.models.response import ApiResponse
+from app.utility.trace.trace_utility import TracedRoute
+
+job_router = APIRouter(prefix="/api/v1/jobs", tags=["Job"], route_class=TracedRoute)
+
+
+@job_router.post(
+    "/",
+    response_model=ApiResponse[JobResponse],
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="提交背景工作",
+    description="將大量匯入（examples.import）或完整匯出（examples.export）等耗時操作排入背景工作佇列，"
+    "立即回傳工作 ID；以 GET /api/v1/jobs/{job_id} 查詢進度",
+)
+async def submit_job(
+    request: JobSubmitRequest,
+    service: JobService = Depends(get_job_service),
+):
+    """提交背景工作"""
+    dto = await ThreadConfig.run_sync(service.submit, request, route="submit_job")
+    data = JobResponse.model_validate(dto.to_dict())
+    return ApiResponse.success(data=data, message="job accepted", status="202")
+
+
+@job_router.get(
+    "/{job_id}",
+    response_model=ApiResponse[JobResponse],
+    summary="查詢背景工作",
+    description="取得背景工作的狀態、進度與結果",
+)
+async def get_job(
+    job_id: int,
+    service: JobService = Depends(get_job_service),
+):
+    """查詢背景工作"""
+    dto = await ThreadConfig.run_sync(service.get_by_id, job_id, route="get_job")
+    data = JobResponse.model_validate(dto.to_dict())
+    return ApiResponse.success(data=data, message="get job success")
+
+
+@job_router.post(
+    "/{job_id}/cancel",
+    response_model=ApiResponse[JobResponse],
+    summary="取消背景工作",
+    description="等待中的工作立即取消；執行中的工作於下一次回報進度時停止。已結束的工作回傳 409",
+)
+async def cancel_job(
+    job_id: int,
+    service: JobService = Depends(get_job_service),
+):
+    """取消背景工作"""
+    dto = await ThreadConfig.run_sync(service.cancel, job_id, route="cancel_job")
+    data = JobResponse.model_validate(dto.to_dict())
+    return ApiResponse.success(data=data, message="cancel success")
+
+
+@job_router.get(
+    "/{job_id}/download",
+    summary="下載背景工作結果",
+    description="下載已完成匯出工作所產生的檔案",
+    response_class=FileResponse,
+)
+async def download_job_result(
+    job_id: int,
+    service: JobService = Depends(get_job_service),
+):
+    """下載背景工作結果"""
+    path = await ThreadConfig.run_sync(
+        service.get_output_path, job_id, route="download_job_result"
+    )
+    return FileResponse(path, media_type="application/json", filename=path.name)
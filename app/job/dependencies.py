@@ -0,0 +1,14 @@
+"""
+Dependency Injection module for Job feature
+"""
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.config.db_config import get_db_session
+from app.job.repository.job_repository import JobRepository
+from app.job.service.job_service import JobService
+
+
+def get_job_service(db: Session = Depends(get_db_session)) -> JobService:
+    """Dependency injection for JobService"""
+    return JobService(JobRepository(db))
@@ -0,0 +1,21 @@
+from fastapi import HTTPException
+
+
+class JobNotFoundException(HTTPException):
+    """Exception raised when job is not found"""
+
+    def __init__(self, job_id: int):
+        super().__init__(
+            status_code=404,
+            detail=f"Job with id {job_id} not found",
+        )
+
+
+class JobValidationError(HTTPException):
+    """Exception raised when a job cannot be submitted or acted on"""
+
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(
+            status_code=status_code,
+            detail=message,
+        )
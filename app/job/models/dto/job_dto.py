@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Any, NamedTuple, Optional
+
+
+class JobDTO(NamedTuple):
+    """Data Transfer Object for a background job"""
+
+    id: Optional[int] = None
+    type: str = ""
+    status: str = ""
+    params: Optional[dict] = None
+    progress: int = 0
+    total: Optional[int] = None
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @classmethod
+    def from_entity(cls, entity) -> "JobDTO":
+        """Convert Entity to DTO"""
+        return cls(
+            id=entity.id,
+            type=entity.type,
+            status=entity.status,
+            params=entity.params,
+            progress=entity.progress,
+            total=entity.total,
+            result=entity.result,
+            error=entity.error,
+            cancel_requested=entity.cancel_requested,
+            created_at=entity.created_at,
+            started_at=entity.started_at,
+            finished_at=entity.finished_at,
+        )
+
+    def to_dict(self) -> dict:
+        """Convert DTO to dictionary"""
+        return self._asdict()
@@ -0,0 +1,30 @@
+from sqlalchemy import JSON, Boolean, Column, DateTime, Index, Integer, String, Text
+from sqlalchemy.sql import func
+
+from app.config.db_config import Base
+
+
+class JobEntity(Base):
+    """Background job database entity"""
+
+    __tablename__ = "jobs"
+    # Created by app/migration/versions/0003_create_jobs.py
+    __table_args__ = (Index("ix_jobs_status_id", "status", "id"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    type = Column(String(64), nullable=False)
+    status = Column(String(16), nullable=False, default="pending")
+    params = Column(JSON, nullable=True)
+    progress = Column(Integer, nullable=False, default=0)
+    total = Column(Integer, nullable=True)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    worker = Column(String(255), nullable=True)
+    created_at = Column(DateTime, server_default=func.now())
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<JobEntity(id={self.id}, type={self.type}, status={self.status})>"
@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field
+
+
+class JobSubmitRequest(BaseModel):
+    """Request schema for submitting a background job"""
+
+    type: str = Field(..., min_length=1, max_length=64, description="Job type, e.g. examples.import")
+    params: Dict[str, Any] = Field(default_factory=dict, description="Job parameters")
+
+
+class JobResponse(BaseModel):
+    """Response schema for a background job"""
+
+    id: int
+    type: str
+    status: str
+    progress: int = 0
+    total: Optional[int] = None
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,159 @@
+from datetime import timedelta
+from typing import List, Optional
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.orm import Session
+
+from app.job.models.entity.job_entity import JobEntity
+
+PENDING = "pending"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED_STATUSES = (SUCCEEDED, FAILED, CANCELLED)
+
+_SELECT_BY_ID = select(JobEntity).where(JobEntity.id == bindparam("job_id")).limit(1)
+_NEXT_PENDING = (
+    select(JobEntity.id)
+    .where(
+        JobEntity.status == PENDING,
+        JobEntity.type.in_(bindparam("types", expanding=True)),
+    )
+    .order_by(JobEntity.id)
+    .limit(1)
+)
+# Claiming is a conditional UPDATE: whichever worker (thread or process) flips
+# the row from pending first wins; the others see rowcount 0 and move on
+_CLAIM = (
+    update(JobEntity)
+    .where(JobEntity.id == bindparam("job_id"), JobEntity.status == PENDING)
+    .values(status=RUNNING, worker=bindparam("worker"), started_at=func.now())
+)
+# Progress, finish and requeue only apply while the job is still running on the
+# worker that claimed it; after a stale requeue the original worker's writes
+# must not touch the new run
+_OWNED = (
+    JobEntity.id == bindparam("job_id"),
+    JobEntity.worker == bindparam("owner"),
+    JobEntity.status == RUNNING,
+)
+_PROGRESS = (
+    update(JobEntity)
+    .where(*_OWNED)
+    .values(progress=bindparam("progress"), total=bindparam("total"))
+)
+_CANCEL_REQUESTED = select(JobEntity.cancel_requested).where(
+    JobEntity.id == bindparam("job_id")
+)
+_FINISH = (
+    update(JobEntity)
+    .where(*_OWNED)
+    .values(
+        status=bindparam("status"),
+        result=bindparam("result"),
+        error=bindparam("error"),
+        finished_at=func.now(),
+    )
+)
+_REQUEUE = (
+    update(JobEntity)
+    .where(*_OWNED)
+    .values(status=PENDING, worker=None, started_at=None)
+)
+_NOW = select(func.now())
+_REQUEUE_STALE = (
+    update(JobEntity)
+    .where(JobEntity.status == RUNNING, JobEntity.updated_at < bindparam("before"))
+    .values(status=PENDING, worker=None, started_at=None)
+)
+_CANCEL_PENDING = (
+    update(JobEntity)
+    .where(JobEntity.id == bindparam("job_id"), JobEntity.status == PENDING)
+    .values(status=CANCELLED, cancel_requested=True, finished_at=func.now())
+)
+_CANCEL_RUNNING = (
+    update(JobEntity)
+    .where(JobEntity.id == bindparam("job_id"), JobEntity.status == RUNNING)
+    .values(cancel_requested=True)
+)
+
+
+class JobRepository:
+    """
+    Repository for the persistent job queue
+    - Job rows are the source of truth for status and progress, so any
+      process can report on a job that another process is running
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def find_by_id(self, job_id: int) -> Optional[JobEntity]:
+        """Find job by ID"""
+        return self.db.scalars(_SELECT_BY_ID, {"job_id": job_id}).first()
+
+    def save(self, entity: JobEntity) -> JobEntity:
+        """Insert a job"""
+        self.db.add(entity)
+        self.db.commit()
+        self.db.refresh(entity)
+        return entity
+
+    def claim_next(self, types: List[str], worker: str) -> Optional[JobEntity]:
+        """Mark the oldest pending job of the given types as running by worker"""
+        while True:
+            job_id = self.db.scalar(_NEXT_PENDING, {"types": types})
+            if job_id is None:
+                self.db.commit()
+                return None
+            claimed = self.db.execute(_CLAIM, {"job_id": job_id, "worker": worker}).rowcount
+            self.db.commit()
+            if claimed:
+                return self.find_by_id(job_id)
+
+    def update_progress(
+        self, job_id: int, worker: str, progress: int, total: Optional[int]
+    ) -> Optional[bool]:
+        """
+        Record progress (also the job's heartbeat); returns whether cancellation
+        was requested, or None if the job is no longer running on this worker
+        """
+        owned = self.db.execute(
+            _PROGRESS, {"job_id": job_id, "owner": worker, "progress": progress, "total": total}
+        ).rowcount
+        cancel_requested = self.db.scalar(_CANCEL_REQUESTED, {"job_id": job_id})
+        self.db.commit()
+        return bool(cancel_requested) if owned else None
+
+    def finish(
+        self, job_id: int, worker: str, status: str, result=None, error: Optional[str] = None
+    ) -> bool:
+        """Move a job run by worker to a final status; False if it no longer owns the job"""
+        finished = self.db.execute(
+            _FINISH,
+            {"job_id": job_id, "owner": worker, "status": status, "result": result, "error": error},
+        ).rowcount
+        self.db.commit()
+        return bool(finished)
+
+    def requeue(self, job_id: int, worker: str) -> bool:
+        """Hand a running job back to the queue (worker shutting down); keeps its progress"""
+        requeued = self.db.execute(_REQUEUE, {"job_id": job_id, "owner": worker}).rowcount
+        self.db.commit()
+        return bool(requeued)
+
+    def requeue_stale(self, stale_seconds: float) -> int:
+        """Requeue running jobs without a heartbeat for stale_seconds (crashed or stuck worker)"""
+        # Compare against the database clock, which also stamps updated_at
+        before = self.db.scalar(_NOW) - timedelta(seconds=stale_seconds)
+        count = self.db.execute(_REQUEUE_STALE, {"before": before}).rowcount
+        self.db.commit()
+        return count
+
+    def request_cancel(self, job_id: int) -> bool:
+        """Cancel a pending job outright, or flag a running one; False once it has finished"""
+        cancelled = self.db.execute(_CANCEL_PENDING, {"job_id": job_id}).rowcount
+        if not cancelled:
+            cancelled = self.db.execute(_CANCEL_RUNNING, {"job_id": job_id}).rowcount
+        self.db.commit()
+        return bool(cancelled)
@@ -0,0 +1,246 @@
+import os
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.config.logging_config import LoggingConfig
+from app.job.models.entity.job_entity import JobEntity
+from app.job.repository.job_repository import (
+    CANCELLED,
+    FAILED,
+    SUCCEEDED,
+    JobRepository,
+)
+from app.utility.db.shard_router_utility import ShardRouter, ShardSessions
+
+
+class JobCancelledError(Exception):
+    """Raised inside a handler once its job has been cancelled"""
+
+
+class JobInterruptedError(Exception):
+    """
+    Raised inside a handler when the runner is stopping (the job goes back to
+    the queue), or when the job was requeued away from this worker
+    """
+
+
+class JobContext:
+    """
+    Everything a handler gets besides its params
+    - db / shards are sessions on the job engines, never the request pool
+    - advance() records progress; it is written at most every
+      progress_interval seconds and each write doubles as the heartbeat and
+      the cancellation check
+    - resume_from is the progress an earlier, interrupted run of the job
+      recorded; handlers whose work is not idempotent skip that many items
+      (set progress to it before set_total)
+    """
+
+    def __init__(self, runner: "JobRunner", job: JobEntity):
+        self.job_id = job.id
+        self.resume_from = job.progress or 0
+        self.progress = 0
+        self.total = None
+        self._runner = runner
+        self._db = None
+        self._shards = None
+        self._flushed_at = time.monotonic()
+
+    @property
+    def db(self) -> Session:
+        if self._db is None:
+            self._db = self._runner.session_factory()
+        return self._db
+
+    @property
+    def shards(self) -> Optional[ShardSessions]:
+        if self._shards is None and self._runner.router is not None:
+            self._shards = self._runner.router.sessions(primary=self.db)
+        return self._shards
+
+    def output_path(self, name: str) -> Path:
+        """Path for a result file, under the runner's output directory"""
+        self._runner.output_dir.mkdir(parents=True, exist_ok=True)
+        return self._runner.output_dir / name
+
+    def set_total(self, total: int):
+        self.total = total
+        self.flush()
+
+    def advance(self, count: int = 1):
+        self.progress += count
+        if self._runner.stopping:
+            raise JobInterruptedError()
+        if time.monotonic() - self._flushed_at >= self._runner.progress_interval:
+            self.flush()
+
+    def flush(self, check: bool = True):
+        """
+        Write progress now; raises JobCancelledError if cancellation was
+        requested, JobInterruptedError if another worker has taken the job over
+        """
+        self._flushed_at = time.monotonic()
+        cancel_requested = self._runner.with_repository(
+            lambda repository: repository.update_progress(
+                self.job_id, self._runner.worker_id, self.progress, self.total
+            )
+        )
+        if check and cancel_requested is None:
+            raise JobInterruptedError()
+        if check and cancel_requested:
+            raise JobCancelledError()
+
+    def close(self):
+        if self._shards is not None:
+            self._shards.close()
+        if self._db is not None:
+            self._db.close()
+
+
+JobHandler = Callable[[JobContext, dict], object]
+
+
+class JobRunner:
+    """
+    Worker threads that claim jobs from the jobs table and run their handlers
+    - Every process running a JobRunner competes for the same queue; a job is
+      claimed by exactly one worker (see JobRepository.claim_next)
+    - Idle workers poll every poll_interval seconds, or sooner when this
+      process submits a job (wake)
+    - Jobs still running when the runner stops are requeued; jobs of a process
+      that died are requeued once their heartbeat is stale_after seconds old
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker,
+        handlers: Dict[str, JobHandler],
+        output_dir: Path,
+        workers: int = 2,
+        router: Optional[ShardRouter] = None,
+        poll_interval: float = 1.0,
+        progress_interval: float = 0.5,
+        stale_after: float = 300.0,
+    ):
+        self.session_factory = session_factory
+        self.handlers = handlers
+        self.output_dir = Path(output_dir)
+        self.workers = workers
+        self.router = router
+        self.poll_interval = poll_interval
+        self.progress_interval = progress_interval
+        self.stale_after = stale_after
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._threads = []
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._stale_checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def stopping(self) -> bool:
+        return self._stopping.is_set()
+
+    def with_repository(self, func: Callable[[JobRepository], object]):
+        """Run func on a short-lived session, separate from the handler's own"""
+        with self.session_factory() as db:
+            return func(JobRepository(db))
+
+    def start(self):
+        self._stopping.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._loop, name=f"job-worker-{index}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def wake(self):
+        self._wakeup.set()
+
+    def stop(self, timeout: float = 30.0):
+        """Ask running handlers to stop at their next advance() and wait for the threads"""
+        self._stopping.set()
+        self._wakeup.set()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        self._threads = []
+
+    def run_next(self) -> bool:
+        """Claim and run one job; False when the queue has nothing for this runner"""
+        self._requeue_stale()
+        job = self.with_repository(
+            lambda repository: repository.claim_next(list(self.handlers), self.worker_id)
+        )
+        if job is None:
+            return False
+        self._run(job)
+        return True
+
+    def _loop(self):
+        logger = LoggingConfig.get_logger()
+        while not self.stopping:
+            try:
+                ran = self.run_next()
+            except Exception as exc:
+                # Database unavailable and the like: back off for one poll interval
+                logger.warning(f"Job worker error: {exc}")
+                ran = False
+            if not ran:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+
+    def _requeue_stale(self):
+        now = time.monotonic()
+        with self._lock:
+            if now - self._stale_checked_at < self.stale_after / 2:
+                return
+            self._stale_checked_at = now
+        count = self.with_repository(
+            lambda repository: repository.requeue_stale(self.stale_after)
+        )
+        if count:
+            LoggingConfig.get_logger().warning(f"Requeued {count} stale job(s)")
+
+    def _run(self, job: JobEntity):
+        logger = LoggingConfig.get_logger()
+        context = JobContext(self, job)
+        result, error = None, None
+        logger.info(f"Job {job.id} ({job.type}) started on {self.worker_id}")
+        try:
+            result = self.handlers[job.type](context, job.params or {})
+            context.flush(check=False)
+            status = SUCCEEDED
+        except JobCancelledError:
+            status = CANCELLED
+        except JobInterruptedError:
+            # Persist exactly how far the handler got, so the next run resumes there
+            context.flush(check=False)
+            requeued = self.with_repository(
+                lambda repository: repository.requeue(job.id, self.worker_id)
+            )
+            if requeued:
+                logger.info(f"Job {job.id} ({job.type}) interrupted at {context.progress}, requeued")
+            else:
+                logger.warning(f"Job {job.id} ({job.type}) was taken over by another worker")
+            return
+        except Exception as exc:
+            logger.exception(f"Job {job.id} ({job.type}) failed")
+            status, error = FAILED, f"{type(exc).__name__}: {exc}"
+        finally:
+            context.close()
+        finished = self.with_repository(
+            lambda repository: repository.finish(
+                job.id, self.worker_id, status, result=result, error=error
+            )
+        )
+        if finished:
+            logger.info(f"Job {job.id} ({job.type}) {status}")
+        else:
+            logger.warning(f"Job {job.id} ({job.type}) {status}, but another worker owns it now")
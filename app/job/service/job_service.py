@@ -0,0 +1,55 @@
+from app.config.job_config import JobConfig
+from app.job.exception import JobNotFoundException, JobValidationError
+from app.job.models.dto.job_dto import JobDTO
+from app.job.models.entity.job_entity import JobEntity
+from app.job.models.schema.job_schema import JobSubmitRequest
+from app.job.repository.job_repository import PENDING, JobRepository
+from app.utility.trace.trace_utility import traced_class
+
+
+@traced_class
+class JobService:
+    """Service layer for submitting and tracking background jobs"""
+
+    def __init__(self, repository: JobRepository):
+        self.repository = repository
+
+    def submit(self, request: JobSubmitRequest) -> JobDTO:
+        """Queue a job; a job worker in any process picks it up"""
+        if request.type not in JobConfig.handlers():
+            raise JobValidationError(f"Unknown job type: {request.type}")
+        entity = JobEntity(
+            type=request.type,
+            status=PENDING,
+            params=request.params,
+            progress=0,
+            cancel_requested=False,
+        )
+        dto = JobDTO.from_entity(self.repository.save(entity))
+        JobConfig.wake()
+        return dto
+
+    def get_by_id(self, job_id: int) -> JobDTO:
+        """Get job by ID and convert to DTO"""
+        entity = self.repository.find_by_id(job_id)
+        if not entity:
+            raise JobNotFoundException(job_id)
+        return JobDTO.from_entity(entity)
+
+    def cancel(self, job_id: int) -> JobDTO:
+        """Cancel a pending job, or ask a running one to stop at its next progress report"""
+        if not self.repository.request_cancel(job_id):
+            dto = self.get_by_id(job_id)
+            raise JobValidationError(f"Job {job_id} already {dto.status}", status_code=409)
+        return self.get_by_id(job_id)
+
+    def get_output_path(self, job_id: int):
+        """Path of a finished job's result file"""
+        dto = self.get_by_id(job_id)
+        name = (dto.result or {}).get("file") if isinstance(dto.result, dict) else None
+        if name is None:
+            raise JobValidationError(f"Job {job_id} has no result file", status_code=404)
+        path = JobConfig.output_dir() / name
+        if not path.is_file():
+            raise JobValidationError(f"Result file of job {job_id} is gone", status_code=410)
+        return path
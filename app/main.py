@@ -6,12 +6,20 @@ from dotenv import load_dotenv
 from fastapi import FastAPI
 
 from app.config.cors_config import CorsConfig
+from app.config.job_config import JobConfig
+from app.config.json_config import JsonCodecResponse
 from app.config.logging_config import LoggingConfig
+from app.config.profiling_config import ProfilingConfig
+from app.config.rate_limit_config import RateLimitConfig
 from app.config.router_config import RoutesConfig
-from app.config.db_config import engine, Base
+from app.config.snapshot_config import SnapshotConfig
+from app.config.tracing_config import TracingConfig
+from app.config.db_config import Base, shard_engines, shard_router
+from app.config.db_executor_config import DbExecutor
 
 # Import all entities to register them with Base.metadata
 from app.example.models.entity.example_entity import ExampleEntity  # noqa: F401
+from app.job.models.entity.job_entity import JobEntity  # noqa: F401
 
 # Load .env from config directory (relative to this file's location)
 env_path = Path(__file__).resolve().parent.parent / "config" / ".env"
@@ -21,12 +29,22 @@ load_dotenv(env_path)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
-    # Startup: Create all tables
-    if os.getenv("AUTO_CREATE_TABLES", "True").lower() == "true":
-        Base.metadata.create_all(bind=engine)
+    # Startup: schema is managed by app/migration (run once per deploy);
+    # AUTO_CREATE_TABLES is only meant for local development
+    if os.getenv("AUTO_CREATE_TABLES", "False").lower() == "true":
+        for shard_engine in shard_engines:
+            Base.metadata.create_all(bind=shard_engine)
         LoggingConfig.get_logger().info("Database tables created/verified")
+    SnapshotConfig.start()
+    JobConfig.start()
     yield
     # Shutdown: cleanup if needed
+    JobConfig.stop()
+    await SnapshotConfig.stop()
+    DbExecutor.shutdown()
+    TracingConfig.flush()
+    if shard_router is not None:
+        shard_router.shutdown()
     LoggingConfig.get_logger().info("Application shutdown")
 
 
@@ -34,21 +52,38 @@ app = FastAPI(
     title=os.getenv("APP_TITLE", "FastAPI Service"),
     description=os.getenv("APP_DESCRIPTION", "FastAPI Backend Service Template"),
     lifespan=lifespan,
+    default_response_class=JsonCodecResponse,
 )
 
 RoutesConfig(app)
 
+# Added before CORS so 429 responses still carry CORS headers
+RateLimitConfig.init_rate_limit(app)
+
 cors_config = CorsConfig()
 cors_config.init_cors(app)
 
+TracingConfig.init_tracing(app)
+ProfilingConfig.init_profiling(app)
+
+# Added last so preflights are answered before tracing, profiling and routing
+cors_config.init_preflight(app)
+
 if __name__ == "__main__":
     LoggingConfig.get_logger().info("Application START")
 
-    uvicorn.run(
-        app="app.main:app",
-        host=os.getenv("HOST", "0.0.0.0"),
-        app_dir=".",
-        port=int(os.getenv("PORT", "8080")),
-        reload=os.getenv("DEBUG", "False").lower() == "true",
-        workers=int(os.getenv("WORKERS", 1)),
-    )
+    workers = int(os.getenv("WORKERS", 1))
+    reload = os.getenv("DEBUG", "False").lower() == "true"
+    if workers > 1 and not reload and os.getenv("PREFORK", "True").lower() == "true":
+        from app.server.prefork_server import PreforkServer
+
+        PreforkServer(workers=workers).run()
+    else:
+        uvicorn.run(
+            app="app.main:app",
+            host=os.getenv("HOST", "0.0.0.0"),
+            app_dir=".",
+            port=int(os.getenv("PORT", "8080")),
+            reload=reload,
+            workers=workers,
+        )
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+
+from starlette.datastructures import Headers
+from starlette.middleware.cors import CORSMiddleware
+
+# Request headers that decide the preflight answer, in cache key order
+_KEY_HEADERS = (
+    b"origin",
+    b"access-control-request-method",
+    b"access-control-request-headers",
+    b"access-control-request-private-network",
+)
+# Preflights whose key headers are larger than this are answered but not cached
+_MAX_KEY_BYTES = 1024
+
+
+class CorsPreflightMiddleware:
+    """
+    Answers CORS preflight requests before the rest of the middleware stack
+    - The answer is computed once by CORSMiddleware.preflight_response (so it
+      matches the regular CORS handling exactly) and the rendered status,
+      headers and body are reused for every later preflight with the same
+      origin and requested method/headers
+    - Only allowed (200) answers are cached, at most max_entries of them with
+      least-recently-used eviction, and only for key headers up to 1 KiB;
+      preflights with random origins or oversized headers are still answered
+      here, they just cannot crowd out the real frontend's entries for good
+    """
+
+    def __init__(self, app, max_entries: int = 1024, **cors_options):
+        self.app = app
+        self.cors = CORSMiddleware(app, **cors_options)
+        self.max_entries = max_entries
+        self._responses = OrderedDict()
+
+    def _render(self, scope) -> tuple:
+        response = self.cors.preflight_response(request_headers=Headers(scope=scope))
+        return (
+            {
+                "type": "http.response.start",
+                "status": response.status_code,
+                "headers": response.raw_headers,
+            },
+            {"type": "http.response.body", "body": response.body},
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        values = [None, None, None, None]
+        for name, value in scope["headers"]:
+            if name in _KEY_HEADERS:
+                index = _KEY_HEADERS.index(name)
+                if values[index] is None:
+                    values[index] = value
+        if values[0] is None or values[1] is None:
+            # Not a preflight: a plain OPTIONS request goes to the app
+            await self.app(scope, receive, send)
+            return
+
+        key = tuple(values)
+        rendered = self._responses.get(key)
+        if rendered is not None:
+            self._responses.move_to_end(key)
+        else:
+            rendered = self._render(scope)
+            if (
+                rendered[0]["status"] == 200
+                and self.max_entries > 0
+                and sum(len(value) for value in values if value is not None) <= _MAX_KEY_BYTES
+            ):
+                self._responses[key] = rendered
+                if len(self._responses) > self.max_entries:
+                    self._responses.popitem(last=False)
+        start, body = rendered
+        await send(start)
+        await send(body)
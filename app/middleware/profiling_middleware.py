@@ -0,0 +1,156 @@
+import hashlib
+import hmac
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+from anyio.to_thread import run_sync as anyio_run_sync
+
+PROFILE_HEADER = b"x-profile"
+IDLE_WORKER_FRAME = "thread.py:_worker"
+
+
+def sign_profile_request(secret: str, path: str, expires: int) -> str:
+    """Build the X-Profile header value that forces profiling of one path"""
+    digest = hmac.new(
+        secret.encode(), f"{expires}:{path}".encode(), hashlib.sha256
+    ).hexdigest()
+    return f"{expires}:{digest}"
+
+
+class StackSampler:
+    """
+    Samples Python stacks of the given threads at a fixed interval and
+    aggregates them as collapsed stacks ("a;b;c count")
+    """
+
+    def __init__(self, thread_ids, interval: float):
+        self.thread_ids = thread_ids
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        frames = sys._current_frames()
+        for thread_id in self.thread_ids():
+            frame = frames.get(thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_filename.rsplit(os.sep, 1)[-1]}:{code.co_name}")
+                frame = frame.f_back
+            # An idle executor thread is parked in its worker loop (the queue
+            # get is C code, so _worker is the innermost Python frame)
+            if stack and stack[0] == IDLE_WORKER_FRAME:
+                continue
+            self.stacks[";".join(reversed(stack))] += 1
+
+
+class ProfilingMiddleware:
+    """
+    Profiles a sampled fraction of requests, or requests carrying a valid
+    signed X-Profile header, and writes one collapsed-stack file per request
+    (compatible with flamegraph.pl / speedscope / inferno)
+
+    The event-loop thread and DB executor threads are sampled, so work from
+    other requests running concurrently on the same worker shows up as well.
+    """
+
+    def __init__(
+        self,
+        app,
+        sample_rate: float = 0.0,
+        secret: str = "",
+        output_dir: str = "/tmp/profiles",
+        max_files: int = 200,
+        interval: float = 0.001,
+    ):
+        self.app = app
+        self.sample_rate = sample_rate
+        self.secret = secret
+        self.output_dir = output_dir
+        self.max_files = max_files
+        self.interval = interval
+        os.makedirs(output_dir, exist_ok=True)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        loop_thread = threading.get_ident()
+
+        def thread_ids():
+            ids = [loop_thread]
+            ids.extend(
+                t.ident for t in threading.enumerate() if t.name.startswith("db-executor")
+            )
+            return ids
+
+        sampler = StackSampler(thread_ids, self.interval)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            sampler.stop()
+            # File write and rotation are blocking I/O: keep them off the event loop
+            await anyio_run_sync(
+                self._write, scope, sampler.stacks, time.perf_counter() - started
+            )
+
+    def _should_profile(self, scope) -> bool:
+        if self.secret:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    return self._verify(scope["path"], value.decode("latin-1"))
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def _verify(self, path: str, value: str) -> bool:
+        expires, _, _ = value.partition(":")
+        if not expires.isdigit() or int(expires) < time.time():
+            return False
+        expected = sign_profile_request(self.secret, path, int(expires))
+        return hmac.compare_digest(expected, value)
+
+    def _write(self, scope, stacks: Counter, elapsed: float):
+        if not stacks:
+            return
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", scope["path"]).strip("_") or "root"
+        name = (
+            f"{time.strftime('%Y%m%d-%H%M%S')}-{int(elapsed * 1000)}ms-"
+            f"{scope['method']}-{slug}-{os.getpid()}.folded"
+        )
+        with open(os.path.join(self.output_dir, name), "w", encoding="UTF-8") as output:
+            for stack, count in stacks.items():
+                output.write(f"{stack} {count}\n")
+        self._rotate()
+
+    def _rotate(self):
+        entries = sorted(
+            (entry for entry in os.scandir(self.output_dir) if entry.name.endswith(".folded")),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        for entry in entries[: max(0, len(entries) - self.max_files)]:
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                pass
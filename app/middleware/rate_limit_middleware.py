@@ -0,0 +1,100 @@
+import json
+import math
+import time
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class RateLimitRule:
+    """Token bucket parameters for requests matching a method and path prefix"""
+
+    __slots__ = ("name", "method", "path_prefix", "rate", "burst")
+
+    def __init__(self, name: str, rate: float, burst: float, method: str = None, path_prefix: str = ""):
+        if not rate > 0:
+            raise ValueError(f"Rate limit {name!r}: rate must be > 0, got {rate}")
+        if not burst >= 1:
+            raise ValueError(f"Rate limit {name!r}: burst must be >= 1, got {burst}")
+        self.name = name
+        self.method = method
+        self.path_prefix = path_prefix
+        self.rate = rate
+        self.burst = burst
+
+    @classmethod
+    def parse(cls, name: str, spec: str, method: str = None, path_prefix: str = ""):
+        """Build a rule from "rate:burst" (tokens per second : bucket size)"""
+        rate, _, burst = spec.partition(":")
+        return cls(name, float(rate), float(burst or rate), method, path_prefix)
+
+
+class RateLimitMiddleware:
+    """
+    Per-client token-bucket rate limiting
+    - Clients are identified by X-API-Key when the key is one of api_keys,
+      otherwise by client IP (an unknown key must not buy a fresh bucket)
+    - The first matching route rule applies, else the read or write default
+    - Buckets live in SharedTokenBuckets, shared by all workers on the host
+    """
+
+    def __init__(
+        self,
+        app,
+        buckets,
+        read_rule,
+        write_rule,
+        rules=(),
+        api_keys=(),
+        api_key_header: str = "x-api-key",
+    ):
+        self.app = app
+        self.buckets = buckets
+        self.read_rule = read_rule
+        self.write_rule = write_rule
+        self.rules = tuple(rules)
+        self.api_keys = frozenset(key.encode("latin-1") for key in api_keys)
+        self.api_key_header = api_key_header.lower().encode()
+
+    def _rule(self, method: str, path: str) -> RateLimitRule:
+        for rule in self.rules:
+            if (rule.method is None or rule.method == method) and path.startswith(rule.path_prefix):
+                return rule
+        return self.write_rule if method in WRITE_METHODS else self.read_rule
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client = None
+        if self.api_keys:
+            for name, value in scope["headers"]:
+                if name == self.api_key_header:
+                    if value in self.api_keys:
+                        client = "k:" + value.decode("latin-1")
+                    break
+        if client is None:
+            client = "ip:" + (scope["client"][0] if scope.get("client") else "unknown")
+
+        rule = self._rule(scope["method"], scope["path"])
+        key_hash = self.buckets.key_hash(f"{rule.name}|{client}")
+        retry_after = self.buckets.acquire(key_hash, rule.rate, rule.burst, time.monotonic())
+        if not retry_after:
+            await self.app(scope, receive, send)
+            return
+
+        body = json.dumps(
+            {"data": None, "message": "Too Many Requests", "status": "429"}
+        ).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(math.ceil(retry_after)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,70 @@
+import ipaddress
+
+from app.utility.trace.trace_utility import SPAN_KIND_SERVER, Trace, Tracer
+
+TRACEPARENT_HEADER = b"traceparent"
+
+
+class TracingMiddleware:
+    """
+    Starts the root span of a request when it is sampled, either by
+    TRACE_SAMPLE_RATE or by an incoming sampled W3C traceparent header
+    - The sampled flag is only honoured from clients in trusted_networks;
+      anyone else could otherwise force tracing of every request. Other
+      callers' traceparent only links the trace when the local sampler picks it
+    """
+
+    def __init__(self, app, trusted_networks=()):
+        self.app = app
+        self.trusted_networks = tuple(
+            ipaddress.ip_network(network.strip(), strict=False) for network in trusted_networks
+        )
+
+    def _is_trusted(self, scope) -> bool:
+        if not self.trusted_networks or not scope.get("client"):
+            return False
+        try:
+            address = ipaddress.ip_address(scope["client"][0])
+        except ValueError:
+            return False
+        return any(address in network for network in self.trusted_networks)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        parent = None
+        for name, value in scope["headers"]:
+            if name == TRACEPARENT_HEADER:
+                parent = Trace.parse_traceparent(value.decode("latin-1"))
+                break
+        forced = parent is not None and parent[2] and self._is_trusted(scope)
+        if not forced and not Tracer.should_sample():
+            await self.app(scope, receive, send)
+            return
+        trace = Trace(parent[0], parent[1]) if parent is not None else Trace()
+
+        span, token = Tracer.start_span(
+            f"HTTP {scope['method']}", SPAN_KIND_SERVER, trace=trace
+        )
+        span.set_attribute("http.request.method", scope["method"])
+        span.set_attribute("url.path", scope["path"])
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                span.set_attribute("http.response.status_code", message["status"])
+            await send(message)
+
+        error = None
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            route = scope.get("route")
+            if route is not None and hasattr(route, "path"):
+                span.name = f"HTTP {scope['method']} {route.path}"
+                span.set_attribute("http.route", route.path)
+            Tracer.end_span(span, token, error)
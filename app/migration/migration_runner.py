@@ -0,0 +1,174 @@
+"""
+Schema migrations
+
+Versioned scripts in app/migration/versions are applied once, in order, by a
+one-time deploy step instead of every worker introspecting the schema at
+startup:
+
+    python -m app.migration.migration_runner upgrade
+    python -m app.migration.migration_runner status
+"""
+import argparse
+import importlib.util
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+
+VERSIONS_DIR = Path(__file__).resolve().parent / "versions"
+_SCRIPT_NAME = re.compile(r"^(\d{4})_\w+\.py$")
+_LOCK_NAME = "schema_migrations"
+
+_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _metadata,
+    Column("version", String(32), primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def create_index_online(conn: Connection, table: str, name: str, columns: List[str]):
+    """
+    Create an index if it does not exist yet, without blocking writes where
+    the database supports it (MySQL InnoDB online DDL)
+    """
+    existing = {index["name"] for index in inspect(conn).get_indexes(table)}
+    if name in existing:
+        return
+    column_list = ", ".join(columns)
+    if conn.dialect.name == "mysql":
+        conn.execute(
+            text(
+                f"ALTER TABLE {table} ADD INDEX {name} ({column_list}), "
+                "ALGORITHM=INPLACE, LOCK=NONE"
+            )
+        )
+    else:
+        conn.execute(text(f"CREATE INDEX {name} ON {table} ({column_list})"))
+
+
+def drop_index_online(conn: Connection, table: str, name: str):
+    """Drop an index if it exists"""
+    existing = {index["name"] for index in inspect(conn).get_indexes(table)}
+    if name not in existing:
+        return
+    if conn.dialect.name == "mysql":
+        conn.execute(text(f"ALTER TABLE {table} DROP INDEX {name}, ALGORITHM=INPLACE, LOCK=NONE"))
+    else:
+        conn.execute(text(f"DROP INDEX {name}"))
+
+
+class Migration:
+    """One versioned migration script"""
+
+    def __init__(self, version: str, path: Path):
+        self.version = version
+        self.path = path
+        spec = importlib.util.spec_from_file_location(f"migration_{version}", path)
+        self.module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(self.module)
+        self.description = getattr(self.module, "description", path.stem)
+
+    def upgrade(self, conn: Connection):
+        self.module.upgrade(conn)
+
+
+class MigrationRunner:
+    """Applies pending migrations and records them in schema_migrations"""
+
+    def __init__(self, engine: Engine, versions_dir: Path = VERSIONS_DIR):
+        self.engine = engine
+        self.versions_dir = versions_dir
+
+    def discover(self) -> List[Migration]:
+        migrations = []
+        for path in sorted(self.versions_dir.iterdir()):
+            match = _SCRIPT_NAME.match(path.name)
+            if match:
+                migrations.append(Migration(match.group(1), path))
+        return migrations
+
+    def applied(self, conn: Connection) -> set:
+        schema_migrations.create(conn, checkfirst=True)
+        return set(conn.execute(select(schema_migrations.c.version)).scalars())
+
+    def pending(self) -> List[Migration]:
+        with self.engine.begin() as conn:
+            applied = self.applied(conn)
+        return [m for m in self.discover() if m.version not in applied]
+
+    def upgrade(self) -> List[str]:
+        """Apply every pending migration, returns the applied versions"""
+        done = []
+        with self.engine.connect() as conn:
+            self._lock(conn)
+            try:
+                applied = self.applied(conn)
+                conn.commit()
+                for migration in self.discover():
+                    if migration.version in applied:
+                        continue
+                    migration.upgrade(conn)
+                    conn.execute(
+                        schema_migrations.insert().values(
+                            version=migration.version,
+                            description=migration.description,
+                            applied_at=datetime.now(),
+                        )
+                    )
+                    conn.commit()
+                    done.append(migration.version)
+            finally:
+                self._unlock(conn)
+        return done
+
+    def _lock(self, conn: Connection):
+        # Only one deploy step may migrate at a time
+        if conn.dialect.name == "mysql":
+            acquired = conn.execute(
+                text("SELECT GET_LOCK(:name, 600)"), {"name": _LOCK_NAME}
+            ).scalar()
+            if acquired != 1:
+                raise RuntimeError("Could not acquire the schema migration lock")
+
+    def _unlock(self, conn: Connection):
+        if conn.dialect.name == "mysql":
+            conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": _LOCK_NAME})
+
+
+def _run(runner: MigrationRunner, command: str):
+    if command == "status":
+        pending = {migration.version for migration in runner.pending()}
+        for migration in runner.discover():
+            state = "pending" if migration.version in pending else "applied"
+            print(f"{migration.version} {state:<8} {migration.description}")
+        return
+
+    applied = runner.upgrade()
+    for version in applied:
+        print(f"applied {version}")
+    if not applied:
+        print("schema is up to date")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply database schema migrations")
+    parser.add_argument("command", choices=["upgrade", "status"])
+    args = parser.parse_args(argv)
+
+    from app.config.db_config import shard_engines
+
+    # Every shard carries the full schema
+    for shard, shard_engine in enumerate(shard_engines):
+        if len(shard_engines) > 1:
+            print(f"shard {shard}: {shard_engine.url.render_as_string(hide_password=True)}")
+        _run(MigrationRunner(shard_engine), args.command)
+
+
+if __name__ == "__main__":
+    main()
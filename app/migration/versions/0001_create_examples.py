@@ -0,0 +1,19 @@
+"""Create the examples table"""
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, Text
+from sqlalchemy.sql import func
+
+description = "create examples table"
+
+
+def upgrade(conn):
+    metadata = MetaData()
+    examples = Table(
+        "examples",
+        metadata,
+        Column("id", Integer, primary_key=True, autoincrement=True),
+        Column("name", String(255), nullable=False),
+        Column("description", Text, nullable=True),
+        Column("created_at", DateTime, server_default=func.now()),
+        Column("updated_at", DateTime, server_default=func.now()),
+    )
+    examples.create(conn, checkfirst=True)
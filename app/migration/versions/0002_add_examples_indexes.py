@@ -0,0 +1,9 @@
+"""Index examples.name (find_by_name) and examples.updated_at (snapshot refresh)"""
+from app.migration.migration_runner import create_index_online
+
+description = "add examples name and updated_at indexes"
+
+
+def upgrade(conn):
+    create_index_online(conn, "examples", "ix_examples_name", ["name"])
+    create_index_online(conn, "examples", "ix_examples_updated_at", ["updated_at"])
@@ -0,0 +1,41 @@
+"""Create the jobs table (background job queue)"""
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+)
+from sqlalchemy.sql import func
+
+description = "create jobs table"
+
+
+def upgrade(conn):
+    metadata = MetaData()
+    jobs = Table(
+        "jobs",
+        metadata,
+        Column("id", Integer, primary_key=True, autoincrement=True),
+        Column("type", String(64), nullable=False),
+        Column("status", String(16), nullable=False),
+        Column("params", JSON, nullable=True),
+        Column("progress", Integer, nullable=False),
+        Column("total", Integer, nullable=True),
+        Column("result", JSON, nullable=True),
+        Column("error", Text, nullable=True),
+        Column("cancel_requested", Boolean, nullable=False),
+        Column("worker", String(255), nullable=True),
+        Column("created_at", DateTime, server_default=func.now()),
+        Column("started_at", DateTime, nullable=True),
+        Column("finished_at", DateTime, nullable=True),
+        Column("updated_at", DateTime, server_default=func.now()),
+        # Workers claim the oldest pending job
+        Index("ix_jobs_status_id", "status", "id"),
+    )
+    jobs.create(conn, checkfirst=True)
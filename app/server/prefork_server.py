@@ -0,0 +1,167 @@
+import gc
+import os
+import resource
+import signal
+import sys
+import time
+
+import uvicorn
+from uvicorn.importer import import_from_string
+
+from app.config.logging_config import LoggingConfig
+
+
+def get_rss_bytes() -> int:
+    """Return current resident set size of this process in bytes"""
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # ru_maxrss is peak RSS in KiB on Linux (bytes on macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class RecyclingServer(uvicorn.Server):
+    """Uvicorn server that exits once it grows above an RSS limit"""
+
+    def __init__(self, config: uvicorn.Config, max_rss_bytes: int = 0):
+        super().__init__(config)
+        self.max_rss_bytes = max_rss_bytes
+
+    async def on_tick(self, counter: int) -> bool:
+        if await super().on_tick(counter):
+            return True
+        # Check once per second, on_tick runs every 100ms
+        if self.max_rss_bytes and counter % 10 == 0:
+            rss = get_rss_bytes()
+            if rss > self.max_rss_bytes:
+                LoggingConfig.get_logger().info(
+                    f"Worker {os.getpid()} RSS {rss} exceeds {self.max_rss_bytes}, recycling"
+                )
+                return True
+        return False
+
+
+class PreforkServer:
+    """
+    Pre-fork launcher
+    - Imports and warms the app once in the parent process
+    - Freezes the GC generations so forked workers share pages copy-on-write
+    - Forks workers that serve on the inherited listening socket
+    - Restarts workers that exit (crash, max requests or RSS limit)
+    """
+
+    def __init__(
+        self,
+        app_path: str = "app.main:app",
+        host: str = None,
+        port: int = None,
+        workers: int = None,
+        max_requests: int = None,
+        max_rss_mb: int = None,
+    ):
+        self.app_path = app_path
+        self.host = host or os.getenv("HOST", "0.0.0.0")
+        self.port = port or int(os.getenv("PORT", "8080"))
+        self.workers = workers or int(os.getenv("WORKERS", 1))
+        self.max_requests = (
+            max_requests
+            if max_requests is not None
+            else int(os.getenv("WORKER_MAX_REQUESTS", 0))
+        )
+        self.max_rss_mb = (
+            max_rss_mb
+            if max_rss_mb is not None
+            else int(os.getenv("WORKER_MAX_RSS_MB", 0))
+        )
+        self.children = {}
+        self.should_exit = False
+        self.app = None
+        self.sockets = []
+
+    def load(self):
+        """Import the app and do the per-process work once, before forking"""
+        self.app = import_from_string(self.app_path)
+        # Build OpenAPI schema and middleware stack so workers inherit them
+        self.app.openapi()
+        self.app.middleware_stack = self.app.build_middleware_stack()
+
+    def _make_config(self) -> uvicorn.Config:
+        return uvicorn.Config(
+            app=self.app,
+            host=self.host,
+            port=self.port,
+            limit_max_requests=self.max_requests or None,
+        )
+
+    def spawn(self, slot: int):
+        """Fork one worker for the given slot"""
+        pid = os.fork()
+        if pid == 0:
+            # Child: restore default signal handling, uvicorn installs its own
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            gc.enable()
+            server = RecyclingServer(
+                self._make_config(), max_rss_bytes=self.max_rss_mb * 1024 * 1024
+            )
+            exit_code = 0
+            try:
+                server.run(sockets=self.sockets)
+            except BaseException:
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+        self.children[pid] = (slot, time.monotonic())
+
+    def handle_exit(self, signum, frame):
+        self.should_exit = True
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self):
+        """Load the app, fork workers and supervise them until stopped"""
+        logger = LoggingConfig.get_logger()
+        # Keep the collector from punching holes in pages the workers will share
+        gc.disable()
+        self.load()
+        self.sockets = [self._make_config().bind_socket()]
+
+        signal.signal(signal.SIGTERM, self.handle_exit)
+        signal.signal(signal.SIGINT, self.handle_exit)
+
+        gc.freeze()
+        for slot in range(self.workers):
+            self.spawn(slot)
+        logger.info(f"Prefork master {os.getpid()} started {self.workers} workers")
+
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            except InterruptedError:
+                continue
+            slot, started = self.children.pop(pid, (None, None))
+            if slot is None or self.should_exit:
+                continue
+            logger.info(
+                f"Worker {pid} exited with status {os.waitstatus_to_exitcode(status)} "
+                f"after {time.monotonic() - started:.1f}s, respawning"
+            )
+            # Avoid a hot fork loop when workers die immediately on startup
+            if time.monotonic() - started < 1:
+                time.sleep(1)
+            self.spawn(slot)
+
+        for sock in self.sockets:
+            sock.close()
+        logger.info("Prefork master shutdown")
+
+
+if __name__ == "__main__":
+    PreforkServer().run()
@@ -0,0 +1,73 @@
+from fastapi import APIRouter, Response
+
+from app.config.db_config import DbConnectGuard, QueryCacheStats, shard_engines
+from app.config.db_executor_config import DbExecutor
+from app.config.logging_config import LoggingConfig
+from app.config.snapshot_config import SnapshotConfig
+from app.models.response import ApiResponse
+from app.utility.db.circuit_breaker_utility import OPEN
+
+system_router = APIRouter(prefix="/api/v1/system", tags=["System"])
+
+
+@system_router.get(
+    "/metrics/db-executor",
+    response_model=ApiResponse[dict],
+    summary="DB Executor 指標",
+    description="取得 DB executor 各路由的佇列深度與等待時間",
+)
+async def get_db_executor_metrics():
+    """DB Executor 指標"""
+    return ApiResponse.success(data=DbExecutor.snapshot(), message="get metrics success")
+
+
+@system_router.get(
+    "/metrics/query-cache",
+    response_model=ApiResponse[dict],
+    summary="SQL 編譯快取指標",
+    description="取得 SQLAlchemy compiled cache 命中與未命中次數",
+)
+async def get_query_cache_metrics():
+    """SQL 編譯快取指標"""
+    return ApiResponse.success(data=QueryCacheStats.snapshot(), message="get metrics success")
+
+
+@system_router.get(
+    "/metrics/snapshot",
+    response_model=ApiResponse[dict],
+    summary="Examples 快照指標",
+    description="取得記憶體快照的筆數、記憶體用量與資料延遲",
+)
+async def get_snapshot_metrics():
+    """Examples 快照指標"""
+    snapshot = SnapshotConfig.get_snapshot()
+    data = snapshot.metrics() if snapshot is not None else {"enabled": False}
+    return ApiResponse.success(data=data, message="get metrics success")
+
+
+@system_router.get(
+    "/ready",
+    response_model=ApiResponse[dict],
+    summary="就緒檢查",
+    description="回傳各分片資料庫斷路器狀態，不查詢資料庫；任一分片斷路器開啟時回傳 503",
+)
+async def get_readiness(response: Response):
+    """就緒檢查"""
+    shards = {}
+    for shard in range(len(shard_engines)):
+        state = DbConnectGuard.breaker_for(shard).snapshot()
+        # Driver errors name internal hosts; they go to the log, not this public endpoint
+        last_error = state.pop("last_error")
+        if state["state"] == OPEN:
+            LoggingConfig.get_logger().warning(f"Database shard {shard} not ready: {last_error}")
+        shards[str(shard)] = state
+    data = dict(shards["0"], shards=shards)
+    unavailable = [state for state in shards.values() if state["state"] == OPEN]
+    if unavailable:
+        retry_after = max(state["retry_after"] for state in unavailable)
+        data["state"] = OPEN
+        data["retry_after"] = retry_after
+        response.status_code = 503
+        response.headers["Retry-After"] = str(max(1, int(retry_after + 0.999)))
+        return ApiResponse.error(message="database unavailable", status="503", data=data)
+    return ApiResponse.success(data=data, message="ready")
@@ -0,0 +1,132 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from collections import OrderedDict
+
+_VERSION = struct.Struct("<Q")
+
+
+class TableVersion:
+    """
+    Monotonic change counter for one table, kept in a small memory-mapped
+    file so every worker process on the host sees the same value
+    """
+
+    def __init__(self, directory: str, table: str):
+        self.path = os.path.join(directory, f"{table}.version")
+        self.table = table
+        self._mm = None
+        self._fd = None
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _map(self) -> mmap.mmap:
+        if self._mm is None:
+            with self._lock:
+                if self._mm is None:
+                    fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+                    if os.fstat(fd).st_size < _VERSION.size:
+                        os.ftruncate(fd, _VERSION.size)
+                    self._fd = fd
+                    self._mm = mmap.mmap(fd, _VERSION.size)
+        return self._mm
+
+    def get(self) -> int:
+        return _VERSION.unpack_from(self._map(), 0)[0]
+
+    def bump(self) -> int:
+        """Increment the counter (cross-process safe) and return the new value"""
+        mm = self._map()
+        # lockf locks are per process (unlike flock, which forked workers
+        # would share through the inherited descriptor); threads use _lock
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                version = _VERSION.unpack_from(mm, 0)[0] + 1
+                _VERSION.pack_into(mm, 0, version)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+        return version
+
+
+class ResponseCache:
+    """
+    Serialized response bodies keyed on (key, table version)
+    - A per-process LRU sits in front of a file store shared by all workers
+    - Entries of an older version are never served, so bumping the version
+      invalidates every worker at once
+    """
+
+    def __init__(self, directory: str, memory_entries: int = 256, ttl: float = 0):
+        self.directory = directory
+        self.memory_entries = memory_entries
+        self.ttl = ttl
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str, version: int) -> str:
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        return os.path.join(self.directory, f"{version}-{digest}.bin")
+
+    def get_memory(self, key: str, version: int):
+        """Return bytes from the in-process LRU only (no file I/O), or None"""
+        memory_key = (key, version)
+        with self._lock:
+            entry = self._memory.get(memory_key)
+            if entry is not None:
+                stored_at, content = entry
+                if not self.ttl or time.time() - stored_at < self.ttl:
+                    self._memory.move_to_end(memory_key)
+                    return content
+                del self._memory[memory_key]
+        return None
+
+    def get(self, key: str, version: int):
+        """Return cached bytes for the key at this version, or None"""
+        content = self.get_memory(key, version)
+        if content is not None:
+            return content
+
+        memory_key = (key, version)
+        now = time.time()
+        path = self._path(key, version)
+        try:
+            stored_at = os.stat(path).st_mtime
+            if self.ttl and now - stored_at >= self.ttl:
+                return None
+            with open(path, "rb") as cached:
+                content = cached.read()
+        except FileNotFoundError:
+            return None
+        self._remember(memory_key, stored_at, content)
+        return content
+
+    def put(self, key: str, version: int, content: bytes):
+        path = self._path(key, version)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as output:
+            output.write(content)
+        os.replace(tmp_path, path)
+        self._remember((key, version), time.time(), content)
+
+    def _remember(self, memory_key, stored_at: float, content: bytes):
+        with self._lock:
+            self._memory[memory_key] = (stored_at, content)
+            self._memory.move_to_end(memory_key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def purge_before(self, version: int):
+        """Remove stored entries older than the given version"""
+        for entry in os.scandir(self.directory):
+            prefix = entry.name.split("-", 1)[0]
+            if prefix.isdigit() and int(prefix) < version:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
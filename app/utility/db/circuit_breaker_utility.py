@@ -0,0 +1,116 @@
+import random
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Circuit open, retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker
+    - closed: calls pass, `failure_threshold` failures in a row open the circuit
+    - open: calls are rejected without touching the dependency for `reset_timeout` seconds
+    - half_open: a single probe call passes (others are rejected until it
+      reports back, or until `reset_timeout` if it never does); its success
+      closes the circuit, its failure re-opens it
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started = None
+        self._last_error = None
+        self._rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(self._clock())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets calls through again"""
+        with self._lock:
+            if self._current_state(self._clock()) != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def allow(self, claim_probe: bool = True) -> bool:
+        """
+        Whether a call may reach the dependency now. In half_open the first
+        caller claims the probe; pass claim_probe=False to only check that a
+        probe slot is available (e.g. before work that may not connect at all)
+        """
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and (
+                self._probe_started is None or now - self._probe_started >= self.reset_timeout
+            ):
+                if claim_probe:
+                    self._probe_started = now
+                return True
+            self._rejected += 1
+            return False
+
+    def check(self):
+        """Raise CircuitOpenError if the circuit is open"""
+        if not self.allow():
+            raise CircuitOpenError(self.retry_after())
+
+    def record_success(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_started = None
+
+    def record_failure(self, error: BaseException = None):
+        with self._lock:
+            now = self._clock()
+            self._failures += 1
+            self._last_error = repr(error) if error is not None else None
+            self._probe_started = None
+            state = self._current_state(now)
+            if state == HALF_OPEN or (state == CLOSED and self._failures >= self.failure_threshold):
+                self._state = OPEN
+                self._opened_at = now
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "retry_after": round(max(0.0, self._opened_at + self.reset_timeout - now), 3)
+                if state == OPEN else 0.0,
+                "rejected": self._rejected,
+                "last_error": self._last_error,
+            }
+
+
+def backoff_delays(attempts: int, base: float, cap: float):
+    """Full-jitter exponential backoff: a random delay in [0, min(cap, base * 2**n)] per retry"""
+    for attempt in range(attempts):
+        yield random.uniform(0, min(cap, base * (2 ** attempt)))
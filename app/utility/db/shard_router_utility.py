@@ -0,0 +1,112 @@
+import contextvars
+import heapq
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from sqlalchemy.orm import Session, sessionmaker
+
+
+class ShardRouter:
+    """
+    Routes keys to shard engines and runs per-shard work in parallel
+    - Key k lives on shard (k - 1) % N, which is where MySQL places it when
+      shard i inserts with auto_increment_increment = N and
+      auto_increment_offset = i + 1 (db_config sets both per connection)
+    - New rows are spread round-robin; the shard's auto_increment then
+      assigns an id that routes back to it
+    """
+
+    def __init__(self, engines: list, max_workers: int = None):
+        self.engines = engines
+        self.session_factories = [
+            sessionmaker(autocommit=False, autoflush=False, bind=shard_engine)
+            for shard_engine in engines
+        ]
+        self.max_workers = max_workers or 4 * len(engines)
+        self._inserts = itertools.count()
+        self._executor = None
+        self._lock = threading.Lock()
+
+    @property
+    def shard_count(self) -> int:
+        return len(self.engines)
+
+    def shard_for(self, key: int) -> int:
+        return (key - 1) % len(self.engines)
+
+    def next_insert_shard(self) -> int:
+        return next(self._inserts) % len(self.engines)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Created lazily so each forked worker builds its own threads
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="shard"
+                    )
+        return self._executor
+
+    def map(self, func: Callable, items: list) -> list:
+        """Run func over items in parallel, preserving order; the first error is raised"""
+        if len(items) == 1:
+            return [func(items[0])]
+        executor = self._get_executor()
+        # Copy the context so tracing spans follow the call into the pool
+        futures = [
+            executor.submit(contextvars.copy_context().run, func, item) for item in items
+        ]
+        return [future.result() for future in futures]
+
+    def sessions(self, primary: Optional[Session] = None) -> "ShardSessions":
+        return ShardSessions(self, primary)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+
+class ShardSessions:
+    """
+    One lazily opened Session per shard for the duration of a request
+    - Each session is only ever used by one thread at a time: scatter hands
+      every shard's session to exactly one task
+    """
+
+    def __init__(self, router: ShardRouter, primary: Optional[Session] = None):
+        self.router = router
+        self._sessions = {} if primary is None else {0: primary}
+        self._owned = set()
+
+    def get(self, shard: int) -> Session:
+        session = self._sessions.get(shard)
+        if session is None:
+            session = self.router.session_factories[shard]()
+            self._sessions[shard] = session
+            self._owned.add(shard)
+        return session
+
+    def for_key(self, key: int) -> Session:
+        return self.get(self.router.shard_for(key))
+
+    def for_insert(self) -> Session:
+        return self.get(self.router.next_insert_shard())
+
+    def scatter(self, func: Callable[[Session], object]) -> list:
+        """Run func(session) on every shard in parallel; results in shard order"""
+        sessions = [self.get(shard) for shard in range(self.router.shard_count)]
+        return self.router.map(func, sessions)
+
+    def gather_sorted(self, func: Callable[[Session], list], key: Callable) -> List:
+        """Scatter func, whose per-shard results are sorted by key, and merge them in order"""
+        return list(heapq.merge(*self.scatter(func), key=key))
+
+    def close(self):
+        """Close the sessions opened here; the primary belongs to get_db_session"""
+        for shard in self._owned:
+            self._sessions[shard].close()
+        self._owned.clear()
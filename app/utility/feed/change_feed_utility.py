@@ -0,0 +1,217 @@
+import asyncio
+import fcntl
+import os
+import threading
+import time
+
+from anyio.to_thread import run_sync as anyio_run_sync
+
+from app.utility.json.json_utility import JsonUtility
+
+# Marker yielded when a client resumes from a position that was already
+# discarded; the client has to reload its full state
+RESET = object()
+_OVERFLOW = object()
+
+
+class _Subscriber:
+    __slots__ = ("queue",)
+
+    def __init__(self, queue_size: int):
+        self.queue = asyncio.Queue(maxsize=queue_size)
+
+
+class ChangeFeed:
+    """
+    Append-only change log shared by all workers on the host
+    - Events are JSON lines in segment files named by their absolute start
+      offset; an event id is the absolute offset right after its line, so a
+      client resumes by passing the last id it saw
+    - Each worker runs one tail task that polls the log and fans new events
+      out to bounded per-client queues; idle clients cost a queue, not a thread
+    - A client whose queue fills up is disconnected and resumes from its last
+      id on reconnect, reading the backlog from disk instead of memory
+    - formatter(event id, line) is applied once per event, not per client
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        name: str,
+        segment_bytes: int = 8 * 1024 * 1024,
+        keep_segments: int = 4,
+        queue_size: int = 256,
+        poll_interval: float = 0.1,
+        formatter=None,
+        codec: JsonUtility = None,
+    ):
+        self.directory = directory
+        self.name = name
+        self.segment_bytes = segment_bytes
+        self.keep_segments = keep_segments
+        self.queue_size = queue_size
+        self.poll_interval = poll_interval
+        self.formatter = formatter
+        self.codec = codec or JsonUtility()
+        self._subscribers = set()
+        self._position = None
+        self._tailer = None
+        self._tailer_loop = None
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._lock_path = os.path.join(directory, f"{name}.lock")
+
+    # -- storage -----------------------------------------------------------
+
+    def _segments(self) -> list:
+        """(start offset, path) of every segment, oldest first"""
+        prefix, suffix = f"{self.name}.", ".log"
+        segments = []
+        for entry in os.scandir(self.directory):
+            middle = entry.name[len(prefix) : -len(suffix)]
+            if entry.name.startswith(prefix) and entry.name.endswith(suffix) and middle.isdigit():
+                segments.append((int(middle), entry.path))
+        segments.sort()
+        return segments
+
+    def _segment_path(self, start: int) -> str:
+        return os.path.join(self.directory, f"{self.name}.{start:020d}.log")
+
+    def end_offset(self) -> int:
+        segments = self._segments()
+        if not segments:
+            return 0
+        start, path = segments[-1]
+        try:
+            return start + os.path.getsize(path)
+        except FileNotFoundError:
+            return start
+
+    def publish(self, event_type: str, data) -> None:
+        """Append one event; safe to call from any thread or worker process"""
+        line = self.codec.dumps({"type": event_type, "data": data, "ts": time.time()}) + b"\n"
+        with self._lock, open(self._lock_path, "a") as lock_file:
+            fcntl.lockf(lock_file, fcntl.LOCK_EX)
+            segments = self._segments()
+            if segments:
+                start, path = segments[-1]
+                size = os.path.getsize(path)
+                if size >= self.segment_bytes:
+                    start, path = start + size, self._segment_path(start + size)
+                    for _, old_path in segments[: max(0, len(segments) + 1 - self.keep_segments)]:
+                        os.remove(old_path)
+            else:
+                path = self._segment_path(0)
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+
+    def read_range(self, start: int, end: int):
+        """
+        Events with ids in (start, end], as (event id, line) pairs
+        Returns None when part of the range was already discarded
+        """
+        segments = self._segments()
+        if not segments or start < segments[0][0]:
+            return None if start < end else []
+        events = []
+        for index, (segment_start, path) in enumerate(segments):
+            segment_end = segments[index + 1][0] if index + 1 < len(segments) else end
+            if segment_end <= start or segment_start >= end:
+                continue
+            try:
+                with open(path, "rb") as segment:
+                    segment.seek(max(start, segment_start) - segment_start)
+                    chunk = segment.read(min(end, segment_end) - max(start, segment_start))
+            except FileNotFoundError:
+                return None
+            offset = max(start, segment_start)
+            for line in chunk.splitlines(keepends=True):
+                if not line.endswith(b"\n"):
+                    break
+                offset += len(line)
+                events.append((offset, self._format(offset, line)))
+        return events
+
+    def _format(self, event_id: int, line: bytes):
+        return self.formatter(event_id, line) if self.formatter else line
+
+    # -- fan-out -----------------------------------------------------------
+
+    def _poll(self, start: int):
+        """(end offset, events after start) for the tail task, on a worker thread"""
+        end = self.end_offset()
+        if end <= start:
+            return end, []
+        events = self.read_range(start, end)
+        # Fell behind retention: everyone has to reload
+        return end, [(end, RESET)] if events is None else events
+
+    def _tailer_running(self, loop) -> bool:
+        return self._tailer is not None and not self._tailer.done() and self._tailer_loop is loop
+
+    async def _ensure_tailer(self):
+        loop = asyncio.get_running_loop()
+        if self._tailer_running(loop):
+            return
+        # scandir/stat stay off the event loop
+        position = await anyio_run_sync(self.end_offset)
+        if not self._tailer_running(loop):
+            self._position = position
+            self._tailer_loop = loop
+            self._tailer = loop.create_task(self._tail())
+
+    async def _tail(self):
+        while self._subscribers:
+            await asyncio.sleep(self.poll_interval)
+            _, events = await anyio_run_sync(self._poll, self._position)
+            if events:
+                self._position = events[-1][0]
+            for subscriber in list(self._subscribers):
+                for event in events:
+                    try:
+                        subscriber.queue.put_nowait(event)
+                    except asyncio.QueueFull:
+                        self._subscribers.discard(subscriber)
+                        while not subscriber.queue.empty():
+                            subscriber.queue.get_nowait()
+                        subscriber.queue.put_nowait((None, _OVERFLOW))
+                        break
+        if self._tailer is asyncio.current_task():
+            self._tailer = None
+
+    async def subscribe(self, last_event_id: int = None, heartbeat: float = 15.0):
+        """
+        Async iterator of (event id, payload) for new events, replaying events
+        after last_event_id first; yields (id, RESET) when the position is
+        gone and (None, None) as a heartbeat when idle
+        """
+        subscriber = _Subscriber(self.queue_size)
+        self._subscribers.add(subscriber)
+        await self._ensure_tailer()
+        live_from = self._position
+        try:
+            if last_event_id is not None and last_event_id < live_from:
+                replay = await anyio_run_sync(self.read_range, last_event_id, live_from)
+                if replay is None:
+                    yield live_from, RESET
+                else:
+                    for event in replay:
+                        yield event
+            while True:
+                try:
+                    event_id, line = await asyncio.wait_for(subscriber.queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield None, None
+                    continue
+                if line is _OVERFLOW:
+                    return
+                if last_event_id is not None and line is not RESET and event_id <= last_event_id:
+                    # Resumed ahead of this worker's tailer (it lags up to one
+                    # poll behind the worker the client was on); already sent
+                    continue
+                yield event_id, line
+        finally:
+            self._subscribers.discard(subscriber)
@@ -1,21 +1,130 @@
+import dataclasses
+import datetime
+import decimal
+import enum
 import json
-from typing import Any
+import uuid
+from typing import Any, Iterable, Iterator
 
+try:
+    import orjson
+except ImportError:  # optional, pip install orjson (poetry extra "fast-json")
+    orjson = None
 
-class JsonUtility:
-    """Utility class for JSON operations"""
+
+def _default(obj: Any) -> Any:
+    """Fallback for types neither backend encodes natively"""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8", errors="replace")
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    return str(obj)
+
+
+class StdlibJsonBackend:
+    """JSON backend on the standard library json module"""
+
+    name = "stdlib"
 
     def __init__(self):
-        pass
+        # allow_nan=False as in Starlette's JSONResponse: NaN/Infinity are not valid JSON
+        self._encoder = json.JSONEncoder(
+            ensure_ascii=False, allow_nan=False, separators=(",", ":"), default=_default
+        )
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj).encode()
+
+    def loads(self, data) -> Any:
+        return json.loads(data)
+
+
+class OrjsonJsonBackend:
+    """JSON backend on orjson (Rust, encodes straight to UTF-8 bytes)"""
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise RuntimeError("JSON backend 'orjson' requested but orjson is not installed")
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=self._option)
+
+    def loads(self, data) -> Any:
+        return orjson.loads(data)
+
+
+JSON_BACKENDS = {
+    StdlibJsonBackend.name: StdlibJsonBackend,
+    OrjsonJsonBackend.name: OrjsonJsonBackend,
+}
+
+
+def create_json_backend(name: str = "auto"):
+    """Create a backend by name; 'auto' prefers orjson when it is installed"""
+    if name == "auto":
+        name = OrjsonJsonBackend.name if orjson is not None else StdlibJsonBackend.name
+    backend = JSON_BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown JSON backend {name!r}, expected auto or one of {sorted(JSON_BACKENDS)}")
+    return backend()
+
+
+class JsonUtility:
+    """
+    Utility class for JSON operations
+    - Encodes to UTF-8 bytes through a pluggable backend (stdlib or orjson)
+    - datetime/date/time, Decimal, UUID, enums, sets and Pydantic models
+      are encoded natively instead of through str()
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend or create_json_backend()
+
+    def dumps(self, obj: Any) -> bytes:
+        """Convert object to JSON bytes"""
+        return self.backend.dumps(obj)
+
+    def loads(self, data) -> Any:
+        """Convert JSON bytes or string to object"""
+        return self.backend.loads(data)
 
     def to_json(self, obj: Any) -> str:
         """Convert object to JSON string"""
-        return json.dumps(obj, ensure_ascii=False, default=str)
+        return self.backend.dumps(obj).decode()
 
     def from_json(self, json_str: str) -> Any:
         """Convert JSON string to object"""
-        return json.loads(json_str)
+        return self.backend.loads(json_str)
 
     def to_dict(self, pydantic_model) -> dict:
-        """Convert Pydantic model to dictionary"""
-        return json.loads(pydantic_model.json())
+        """Convert Pydantic model to JSON-compatible dictionary"""
+        return pydantic_model.model_dump(mode="json")
+
+    def iter_array(self, items: Iterable[Any], chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Encode an iterable as a JSON array in chunks of about chunk_size bytes"""
+        dumps = self.backend.dumps
+        buffer = bytearray(b"[")
+        first = True
+        for item in items:
+            if not first:
+                buffer += b","
+            first = False
+            buffer += dumps(item)
+            if len(buffer) >= chunk_size:
+                yield bytes(buffer)
+                buffer.clear()
+        buffer += b"]"
+        yield bytes(buffer)
@@ -0,0 +1,90 @@
+import hashlib
+import mmap
+import os
+import struct
+
+# key hash, tokens, last update (CLOCK_MONOTONIC is shared by all processes)
+_SLOT = struct.Struct("<Qdd")
+_SLOT_SIZE = _SLOT.size
+_unpack_from = _SLOT.unpack_from
+_pack_into = _SLOT.pack_into
+_PROBES = 4
+
+
+class SharedTokenBuckets:
+    """
+    Fixed-size table of token buckets in a memory-mapped file, so every
+    worker process on the host draws from the same buckets
+
+    Slots are read and written without locks: two workers racing on the same
+    bucket can both spend the same token, which makes the limit approximate
+    under contention but keeps each decision to a few struct reads/writes.
+    """
+
+    def __init__(self, path: str, slots: int = 65536):
+        self.path = path
+        self.slots = slots
+        self._key_hashes = {}
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            size = slots * _SLOT.size
+            if os.fstat(fd).st_size < size:
+                os.ftruncate(fd, size)
+            self._mm = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+    def key_hash(self, key: str) -> int:
+        """Stable (not per-process randomized) non-zero 64-bit hash of a key"""
+        value = self._key_hashes.get(key)
+        if value is None:
+            digest = hashlib.blake2b(key.encode(), digest_size=8).digest()
+            value = int.from_bytes(digest, "little") | 1
+            if len(self._key_hashes) >= 100_000:
+                self._key_hashes.clear()
+            self._key_hashes[key] = value
+        return value
+
+    def acquire(self, key_hash: int, rate: float, burst: float, now: float) -> float:
+        """Take one token; returns 0.0 when allowed, else seconds until a token is available"""
+        mm = self._mm
+        offset = (key_hash % self.slots) * _SLOT_SIZE
+        slot_key, tokens, updated = _unpack_from(mm, offset)
+        # Fast path: the bucket sits in its home slot
+        if slot_key != key_hash:
+            offset, tokens, updated = self._probe(key_hash, offset, slot_key, tokens, updated, now)
+        tokens += (now - updated) * rate
+        # updated > now only for state left over from before a reboot
+        if tokens > burst or updated > now:
+            tokens = burst
+        if tokens >= 1.0:
+            _pack_into(mm, offset, key_hash, tokens - 1.0, now)
+            return 0.0
+        _pack_into(mm, offset, key_hash, tokens, now)
+        return (1.0 - tokens) / rate
+
+    def _probe(
+        self, key_hash: int, home: int, home_key: int, home_tokens: float, home_updated: float, now: float
+    ):
+        """
+        Find the key's slot near home, claim a free one, or evict the least
+        recently used. An evicted slot's tokens carry over to the new key, so
+        churning the table never hands out a bucket fuller than the refill allows
+        """
+        if home_key == 0:
+            return home, float("inf"), now
+        oldest = (home, home_tokens, home_updated)
+        table_size = self.slots * _SLOT_SIZE
+        for probe in range(1, _PROBES):
+            offset = (home + probe * _SLOT_SIZE) % table_size
+            slot_key, tokens, updated = _unpack_from(self._mm, offset)
+            if slot_key == key_hash:
+                return offset, tokens, updated
+            if slot_key == 0:
+                return offset, float("inf"), now
+            if updated < oldest[2]:
+                oldest = (offset, tokens, updated)
+        return oldest
@@ -0,0 +1,308 @@
+import contextvars
+import functools
+import inspect
+import os
+import queue
+import random
+import threading
+import time
+
+from fastapi.routing import APIRoute
+
+from app.utility.json.json_utility import JsonUtility
+
+# OpenTelemetry SpanKind values
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """A single timed operation, part of a trace"""
+
+    __slots__ = (
+        "trace",
+        "span_id",
+        "parent_id",
+        "name",
+        "kind",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+    )
+
+    def __init__(self, trace, name: str, parent_id: str = None, kind: int = SPAN_KIND_INTERNAL):
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.attributes = {}
+        self.error = None
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def to_otlp(self) -> dict:
+        span = {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class Trace:
+    """Spans collected for one sampled request"""
+
+    __slots__ = ("trace_id", "parent_span_id", "root", "spans")
+
+    def __init__(self, trace_id: str = None, parent_span_id: str = None):
+        self.trace_id = trace_id or os.urandom(16).hex()
+        self.parent_span_id = parent_span_id
+        self.root = None
+        self.spans = []
+
+    @staticmethod
+    def parse_traceparent(header: str):
+        """(trace id, parent span id, sampled) of a W3C traceparent, or None"""
+        parts = header.strip().split("-")
+        if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+            return None
+        try:
+            sampled = bool(int(parts[3], 16) & 1)
+        except ValueError:
+            return None
+        return parts[1], parts[2], sampled
+
+
+def _otlp_attribute(key: str, value) -> dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class FileSpanExporter:
+    """
+    Appends finished traces to a file, one OTLP/JSON ExportTraceServiceRequest per line
+    - export() only enqueues; a background thread (one per process, started
+      lazily so forked workers get their own) serializes and writes, so the
+      request that closes a root span never does file I/O
+    - When queue_size traces are waiting, further traces are dropped and counted
+    """
+
+    def __init__(self, path: str, service_name: str, codec: JsonUtility = None, queue_size: int = 1024):
+        self.path = path
+        self.codec = codec or JsonUtility()
+        self.resource = {"attributes": [_otlp_attribute("service.name", service_name)]}
+        self.queue_size = queue_size
+        self.dropped = 0
+        self._queue = None
+        self._writer_pid = None
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _get_queue(self) -> queue.Queue:
+        if self._writer_pid != os.getpid():
+            with self._lock:
+                if self._writer_pid != os.getpid():
+                    self._queue = queue.Queue(maxsize=self.queue_size)
+                    threading.Thread(
+                        target=self._drain, args=(self._queue,), name="trace-export", daemon=True
+                    ).start()
+                    self._writer_pid = os.getpid()
+        return self._queue
+
+    def export(self, trace: Trace):
+        try:
+            self._get_queue().put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self):
+        """Block until every trace queued so far has been written"""
+        if self._writer_pid == os.getpid():
+            self._queue.join()
+
+    def _drain(self, traces: queue.Queue):
+        while True:
+            batch = [traces.get()]
+            while True:
+                try:
+                    batch.append(traces.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                with open(self.path, "ab") as output:
+                    output.write(b"".join(self._line(trace) for trace in batch))
+            except Exception:
+                # Tracing must never take the process down; the batch is lost
+                self.dropped += len(batch)
+            finally:
+                for _ in batch:
+                    traces.task_done()
+
+    def _line(self, trace: Trace) -> bytes:
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": self.resource,
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "app.tracing"},
+                            "spans": [span.to_otlp() for span in trace.spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        return self.codec.dumps(payload) + b"\n"
+
+
+class Tracer:
+    """
+    In-process tracer
+    - Sampling is decided once per request; unsampled requests carry no
+      current span, so every instrumented boundary is a single contextvar read
+    - Spans nest through contextvars and follow calls into executor threads
+    """
+
+    sample_rate = 0.0
+    exporter = None
+
+    def __init__(self):
+        pass
+
+    @classmethod
+    def configure(cls, sample_rate: float, exporter: FileSpanExporter):
+        cls.sample_rate = sample_rate
+        cls.exporter = exporter
+
+    @classmethod
+    def should_sample(cls) -> bool:
+        return cls.sample_rate > 0 and random.random() < cls.sample_rate
+
+    @staticmethod
+    def current_span():
+        return _current_span.get()
+
+    @classmethod
+    def start_span(cls, name: str, kind: int = SPAN_KIND_INTERNAL, trace: Trace = None):
+        """Start a span under the current one (or as a root of the given trace)"""
+        parent = _current_span.get()
+        if parent is None and trace is None:
+            return None, None
+        if parent is not None:
+            span = Span(parent.trace, name, parent.span_id, kind)
+        else:
+            span = Span(trace, name, trace.parent_span_id, kind)
+            trace.root = span
+        token = _current_span.set(span)
+        return span, token
+
+    @classmethod
+    def end_span(cls, span: Span, token, error: BaseException = None):
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+        span.trace.spans.append(span)
+        _current_span.reset(token)
+        if span is span.trace.root and cls.exporter is not None:
+            cls.exporter.export(span.trace)
+
+
+def traced(name: str = None, kind: int = SPAN_KIND_INTERNAL):
+    """Decorator wrapping a function call in a span when the request is sampled"""
+
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _current_span.get() is None:
+                    return await func(*args, **kwargs)
+                span, token = Tracer.start_span(span_name, kind)
+                try:
+                    result = await func(*args, **kwargs)
+                except BaseException as error:
+                    Tracer.end_span(span, token, error)
+                    raise
+                Tracer.end_span(span, token)
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+            span, token = Tracer.start_span(span_name, kind)
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as error:
+                Tracer.end_span(span, token, error)
+                raise
+            Tracer.end_span(span, token)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def traced_class(cls):
+    """Class decorator tracing every public method defined on the class"""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.isfunction(value):
+            continue
+        setattr(cls, attr, traced(f"{cls.__name__}.{attr}")(value))
+    return cls
+
+
+class TracedRoute(APIRoute):
+    """
+    APIRoute adding a "route" span (dependencies, validation, endpoint and
+    response encoding) and an "endpoint" span (the controller function)
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, traced(f"endpoint {endpoint.__name__}")(endpoint), **kwargs)
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+        span_name = f"route {self.name}"
+
+        async def traced_handler(request):
+            if _current_span.get() is None:
+                return await handler(request)
+            span, token = Tracer.start_span(span_name)
+            span.set_attribute("http.route", self.path)
+            try:
+                response = await handler(request)
+            except BaseException as error:
+                Tracer.end_span(span, token, error)
+                raise
+            Tracer.end_span(span, token)
+            return response
+
+        return traced_handler
@@ -0,0 +1,151 @@
+"""
+CORS preflights: request volume by max_age and CPU per preflight
+
+1. CPU: sends preflights to app.main:app over ASGI, once with the full
+   middleware stack answering them (CORS_PREFLIGHT_CACHE=False) and once
+   with the cached fast path. Each variant runs in a fresh interpreter.
+2. Request rate: replays a frontend session of cross-origin writes through a
+   browser-style preflight cache (keyed by origin + URL, entries live for
+   max_age seconds) and counts the preflights each max_age leaves. "none" is
+   a response without Access-Control-Max-Age, which Chromium caches for 5s.
+
+    python benchmarks/bench_cors_preflight.py
+    BENCH_PREFLIGHTS=50000 BENCH_WRITE_INTERVAL=1 python benchmarks/bench_cors_preflight.py
+"""
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+PREFLIGHTS = int(os.getenv("BENCH_PREFLIGHTS", 20000))
+SESSION_SECONDS = int(os.getenv("BENCH_SESSION_SECONDS", 8 * 3600))
+WRITE_INTERVAL = float(os.getenv("BENCH_WRITE_INTERVAL", 2))
+HOT_IDS = int(os.getenv("BENCH_HOT_IDS", 50))
+# (label, seconds a browser keeps the answer); Chromium caps max_age at 7200
+MAX_AGES = [("none", 5), ("600", 600), ("7200", 7200)]
+
+os.environ.setdefault("MYSQL_HOST", f"sqlite:///{tempfile.mkdtemp()}/bench.db")
+os.environ.setdefault("LOG_PATH", os.path.join(tempfile.gettempdir(), "bench.log"))
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+sys.path.insert(0, str(ROOT))
+
+PREFLIGHT_HEADERS = [
+    (b"host", b"api.example.com"),
+    (b"origin", b"https://app.example.com"),
+    (b"access-control-request-method", b"PUT"),
+    (b"access-control-request-headers", b"content-type,x-api-key"),
+]
+
+
+async def preflight(app) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "OPTIONS",
+        "scheme": "https",
+        "path": "/api/v1/examples/1",
+        "raw_path": b"/api/v1/examples/1",
+        "query_string": b"",
+        "root_path": "",
+        "headers": PREFLIGHT_HEADERS,
+        "client": ("127.0.0.1", 50000),
+        "server": ("api.example.com", 443),
+        "state": {},
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+def run_variant(fast_path: str):
+    os.environ["CORS_PREFLIGHT_CACHE"] = fast_path
+    from app.main import app
+
+    async def run():
+        for _ in range(1000):
+            assert await preflight(app) == 200
+        wall, cpu = time.perf_counter(), time.process_time()
+        for _ in range(PREFLIGHTS):
+            await preflight(app)
+        return time.perf_counter() - wall, time.process_time() - cpu
+
+    wall, cpu = asyncio.run(run())
+    print(f"{wall / PREFLIGHTS} {cpu / PREFLIGHTS}")
+
+
+def simulate(cache_seconds: float) -> tuple:
+    """(writes, preflights) for one session with a browser preflight cache"""
+    rng = random.Random(1)
+    expires = {}
+    writes = preflights = 0
+    now = 0.0
+    while now < SESSION_SECONDS:
+        # Creates share one URL; updates go to a hot set of ids, each its own URL
+        url = "/api/v1/examples/" if rng.random() < 0.5 else f"/api/v1/examples/{rng.randint(1, HOT_IDS)}"
+        if expires.get(url, -1.0) <= now:
+            preflights += 1
+            expires[url] = now + cache_seconds
+        writes += 1
+        now += rng.expovariate(1 / WRITE_INTERVAL)
+    return writes, preflights
+
+
+def main():
+    if len(sys.argv) == 3 and sys.argv[1] == "--variant":
+        run_variant(sys.argv[2])
+        return
+
+    cost = {}
+    for label, fast_path in (("stack", "False"), ("cached", "True")):
+        output = subprocess.run(
+            [sys.executable, __file__, "--variant", fast_path],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=os.environ,
+        ).stdout.split()
+        cost[label] = (float(output[0]), float(output[1]))
+
+    print(f"{PREFLIGHTS} preflights, in-process ASGI\n")
+    print(f"{'path':<10}{'wall/req':>12}{'CPU/req':>12}")
+    for label, (wall, cpu) in cost.items():
+        print(f"{label:<10}{wall * 1e6:>10.1f}us{cpu * 1e6:>10.1f}us")
+    print(f"\ncached vs stack: {cost['stack'][1] / cost['cached'][1]:.1f}x less CPU per preflight")
+
+    print(
+        f"\nfrontend session: {SESSION_SECONDS / 3600:.0f}h, one write every "
+        f"{WRITE_INTERVAL:g}s, half to one URL, half across {HOT_IDS} ids\n"
+    )
+    print(
+        f"{'max_age':<9}{'writes':>9}{'preflights':>12}{'requests':>10}{'vs none':>9}"
+        f"{'CPU stack':>12}{'CPU cached':>12}"
+    )
+    baseline = None
+    for label, seconds in MAX_AGES:
+        writes, preflights = simulate(seconds)
+        requests = writes + preflights
+        baseline = baseline or requests
+        print(
+            f"{label:<9}{writes:>9}{preflights:>12}{requests:>10}{requests / baseline:>8.0%}"
+            f"{preflights * cost['stack'][1] * 1000:>10.1f}ms"
+            f"{preflights * cost['cached'][1] * 1000:>10.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
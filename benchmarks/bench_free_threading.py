@@ -0,0 +1,111 @@
+"""
+Throughput of the example endpoints with and without the GIL
+
+Runs the ASGI app in-process against a SQLite stand-in with THREADED_HANDLERS
+enabled, so sync service work is spread over a thread pool in one process.
+
+    python benchmarks/bench_free_threading.py            # current interpreter
+    python3.14t benchmarks/bench_free_threading.py       # runs PYTHON_GIL=1 and 0
+
+On a free-threaded build the script re-runs itself with the GIL forced on and
+off and prints both results side by side.
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import sysconfig
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+REQUESTS = int(os.getenv("BENCH_REQUESTS", 4000))
+CONCURRENCY = int(os.getenv("BENCH_CONCURRENCY", 64))
+ROWS = int(os.getenv("BENCH_ROWS", 200))
+
+
+def _setup_env(db_path: str):
+    os.environ["MYSQL_HOST"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("LOG_PATH", os.path.join(tempfile.gettempdir(), "bench.log"))
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ["THREADED_HANDLERS"] = "True"
+    sys.path.insert(0, str(ROOT))
+
+
+async def _run(app, paths) -> float:
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        semaphore = asyncio.Semaphore(CONCURRENCY)
+
+        async def one(path):
+            async with semaphore:
+                response = await client.get(path)
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(paths[i % len(paths)]) for i in range(REQUESTS)))
+        return time.perf_counter() - started
+
+
+def run_once() -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        _setup_env(os.path.join(tmp, "bench.db"))
+
+        from app.config.db_config import Base, SessionLocal, engine
+        from app.config.db_executor_config import DbExecutor
+        from app.config.thread_config import ThreadConfig
+        from app.example.models.entity.example_entity import ExampleEntity
+        from app.main import app
+
+        Base.metadata.create_all(bind=engine)
+        with SessionLocal() as session:
+            session.add_all(
+                ExampleEntity(name=f"name-{i}", description="x" * 200)
+                for i in range(ROWS)
+            )
+            session.commit()
+
+        paths = ["/api/v1/examples/"] + [f"/api/v1/examples/{i}" for i in range(1, 20)]
+        elapsed = asyncio.run(_run(app, paths))
+        engine.dispose()
+
+    return {
+        "gil_enabled": ThreadConfig.is_gil_enabled(),
+        "threads": DbExecutor.default_workers(),
+        "requests": REQUESTS,
+        "seconds": round(elapsed, 3),
+        "rps": round(REQUESTS / elapsed, 1),
+    }
+
+
+def main():
+    free_threaded_build = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    if "--child" in sys.argv or not free_threaded_build:
+        print(json.dumps(run_once()))
+        return
+
+    results = []
+    for gil in ("1", "0"):
+        env = dict(os.environ, PYTHON_GIL=gil)
+        output = subprocess.run(
+            [sys.executable, __file__, "--child"],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    for result in results:
+        label = "GIL   " if result["gil_enabled"] else "no-GIL"
+        print(f"{label} threads={result['threads']} rps={result['rps']} ({result['seconds']}s)")
+    if results[0]["rps"]:
+        print(f"speedup: {results[1]['rps'] / results[0]['rps']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Cost of one rate-limit decision on the hot path
+
+The loop itself (indexing, time.monotonic()) is timed separately and
+subtracted, so the figures are the cost of the calls alone. Each figure is
+the best of BENCH_REPEATS runs.
+
+    python benchmarks/bench_rate_limit.py
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utility.rate_limit.rate_limit_utility import SharedTokenBuckets  # noqa: E402
+
+ITERATIONS = int(os.getenv("BENCH_ITERATIONS", 1_000_000))
+REPEATS = int(os.getenv("BENCH_REPEATS", 5))
+
+
+def best(run) -> float:
+    """Fastest per-iteration time of REPEATS runs"""
+    times = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        run()
+        times.append((time.perf_counter() - started) / ITERATIONS)
+    return min(times)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        buckets = SharedTokenBuckets(os.path.join(tmp, "buckets.bin"))
+        keys = [f"read|ip:10.0.{i // 256}.{i % 256}" for i in range(1000)]
+        hashes = [buckets.key_hash(key) for key in keys]
+
+        def loop_only():
+            for i in range(ITERATIONS):
+                hashes[i % 1000], keys[i % 1000], time.monotonic()
+
+        def acquire_only():
+            for i in range(ITERATIONS):
+                buckets.acquire(hashes[i % 1000], 50.0, 100.0, time.monotonic())
+
+        def with_key_hash():
+            for i in range(ITERATIONS):
+                buckets.acquire(buckets.key_hash(keys[i % 1000]), 50.0, 100.0, time.monotonic())
+
+        loop = best(loop_only)
+        acquire = best(acquire_only)
+        with_hash = best(with_key_hash)
+
+    print(f"loop overhead:       {loop * 1e9:6.0f} ns/iteration")
+    print(f"acquire:             {(acquire - loop) * 1e9:6.0f} ns/decision")
+    print(f"key_hash + acquire:  {(with_hash - loop) * 1e9:6.0f} ns/decision")
+
+
+if __name__ == "__main__":
+    main()
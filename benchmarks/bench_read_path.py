@@ -0,0 +1,149 @@
+"""
+List read path: full ORM entities vs column rows into the tuple-backed DTO
+
+Compares ExampleService.get_all as it was (scalars(select(ExampleEntity)) plus
+a @dataclass DTO per entity) with the current path (column-only select into
+ExampleDTO rows). Each variant runs in a fresh interpreter so peak RSS is not
+polluted by the other; RSS is reported above the process baseline taken just
+before the query.
+
+    python benchmarks/bench_read_path.py
+    BENCH_ROWS=200000 python benchmarks/bench_read_path.py
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+ROWS = int(os.getenv("BENCH_ROWS", 100000))
+REPEAT = int(os.getenv("BENCH_REPEAT", 3))
+
+os.environ.setdefault("MYSQL_HOST", f"sqlite:///{tempfile.mkdtemp()}/bench.db")
+os.environ.setdefault("LOG_PATH", os.path.join(tempfile.gettempdir(), "bench.log"))
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import select  # noqa: E402
+
+from app.config.db_config import Base, SessionLocal, engine  # noqa: E402
+from app.example.models.entity.example_entity import ExampleEntity  # noqa: E402
+from app.example.repository.example_repository import ExampleRepository  # noqa: E402
+from app.example.service.example_service import ExampleService  # noqa: E402
+from app.server.prefork_server import get_rss_bytes  # noqa: E402
+
+
+@dataclass
+class LegacyExampleDTO:
+    """ExampleDTO before the read path change"""
+
+    id: Optional[int] = None
+    name: str = ""
+    description: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_entity(cls, entity) -> "LegacyExampleDTO":
+        return cls(
+            id=entity.id,
+            name=entity.name,
+            description=entity.description,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+        )
+
+
+def orm_get_all(session):
+    entities = session.scalars(select(ExampleEntity)).all()
+    return [LegacyExampleDTO.from_entity(entity) for entity in entities]
+
+
+def rows_get_all(session):
+    return ExampleService(ExampleRepository(session)).get_all()
+
+
+VARIANTS = {"orm": orm_get_all, "rows": rows_get_all}
+
+
+def seed():
+    Base.metadata.create_all(bind=engine)
+    now = datetime.now()
+    with engine.begin() as conn:
+        conn.execute(ExampleEntity.__table__.delete())
+        conn.execute(
+            ExampleEntity.__table__.insert(),
+            [
+                {
+                    "name": f"Example {i}",
+                    "description": f"Description of example number {i:08d}",
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for i in range(ROWS)
+            ],
+        )
+
+
+def run_variant(name):
+    func = VARIANTS[name]
+    session = SessionLocal()
+    func(session)[:0]  # warm the compiled cache and connection on a throwaway run
+    session.close()
+
+    session = SessionLocal()
+    baseline = get_rss_bytes()
+    started = time.perf_counter()
+    result = func(session)
+    first = time.perf_counter() - started
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    retained = get_rss_bytes() - baseline
+    assert len(result) == ROWS
+    del result
+    session.close()
+
+    timings = [first]
+    for _ in range(REPEAT - 1):
+        session = SessionLocal()
+        started = time.perf_counter()
+        result = func(session)
+        timings.append(time.perf_counter() - started)
+        del result
+        session.close()
+    print(f"{name} {min(timings)} {peak - baseline} {retained}")
+
+
+def main():
+    if len(sys.argv) == 3 and sys.argv[1] == "--variant":
+        run_variant(sys.argv[2])
+        return
+
+    seed()
+    print(f"{ROWS} rows, best of {REPEAT}, RSS above baseline (fresh process per variant)\n")
+    print(f"{'variant':<8}{'time':>12}{'per 100k':>12}{'peak RSS':>14}{'retained':>14}")
+    results = {}
+    for name in VARIANTS:
+        output = subprocess.run(
+            [sys.executable, __file__, "--variant", name],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=os.environ,
+        ).stdout.split()
+        elapsed, peak, retained = float(output[1]), int(output[2]), int(output[3])
+        results[name] = (elapsed, peak)
+        print(
+            f"{name:<8}{elapsed * 1000:>10.1f}ms{elapsed * 100000 / ROWS * 1000:>10.1f}ms"
+            f"{peak / 2**20:>12.1f}MB{retained / 2**20:>12.1f}MB"
+        )
+    orm, rows = results["orm"], results["rows"]
+    print(f"\nrows vs orm: {orm[0] / rows[0]:.1f}x faster, {orm[1] / max(rows[1], 1):.1f}x lower peak RSS")
+
+
+if __name__ == "__main__":
+    main()
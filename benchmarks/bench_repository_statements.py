@@ -0,0 +1,85 @@
+"""
+Python-side query construction overhead: legacy Query vs pre-built select()
+
+Compares ExampleRepository.find_by_id as it was (session.query().filter()
+.first()) with a per-call select(), a lambda_stmt and the pre-built
+parameterized statement now used by the repository. A local SQLite file keeps
+the database round-trip small so the difference is mostly Python work.
+
+    python benchmarks/bench_repository_statements.py
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+ITERATIONS = int(os.getenv("BENCH_ITERATIONS", 20000))
+
+os.environ["MYSQL_HOST"] = f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+os.environ.setdefault("LOG_PATH", os.path.join(tempfile.gettempdir(), "bench.log"))
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import lambda_stmt, select  # noqa: E402
+
+from app.config.db_config import Base, QueryCacheStats, SessionLocal, engine  # noqa: E402
+from app.example.models.entity.example_entity import ExampleEntity  # noqa: E402
+from app.example.repository.example_repository import ExampleRepository  # noqa: E402
+
+
+def legacy_query(session, example_id):
+    return session.query(ExampleEntity).filter(ExampleEntity.id == example_id).first()
+
+
+def per_call_select(session, example_id):
+    stmt = select(ExampleEntity).where(ExampleEntity.id == example_id).limit(1)
+    return session.scalars(stmt).first()
+
+
+def lambda_statement(session, example_id):
+    stmt = lambda_stmt(lambda: select(ExampleEntity))
+    stmt += lambda s: s.where(ExampleEntity.id == example_id).limit(1)
+    return session.scalars(stmt).first()
+
+
+def prebuilt(session, example_id):
+    return ExampleRepository(session).find_by_id(example_id)
+
+
+def measure(name, func, session):
+    for i in range(200):
+        func(session, i % 50 + 1)
+    session.expunge_all()
+    QueryCacheStats.reset()
+    started = time.perf_counter()
+    for i in range(ITERATIONS):
+        func(session, i % 50 + 1)
+        session.expunge_all()
+    elapsed = time.perf_counter() - started
+    stats = QueryCacheStats.snapshot()
+    print(
+        f"{name:<18} {elapsed / ITERATIONS * 1e6:8.1f} us/call"
+        f"  cache hits={stats['hits']} misses={stats['misses']}"
+    )
+    return elapsed
+
+
+def main():
+    Base.metadata.create_all(bind=engine)
+    with SessionLocal() as session:
+        session.add_all(ExampleEntity(name=f"name-{i}") for i in range(50))
+        session.commit()
+
+        baseline = measure("legacy query", legacy_query, session)
+        for name, func in (
+            ("per-call select", per_call_select),
+            ("lambda_stmt", lambda_statement),
+            ("pre-built select", prebuilt),
+        ):
+            elapsed = measure(name, func, session)
+            print(f"{'':<18} {(baseline - elapsed) / ITERATIONS * 1e6:8.1f} us/call saved")
+
+
+if __name__ == "__main__":
+    main()
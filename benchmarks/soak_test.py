@@ -0,0 +1,317 @@
+"""
+Soak test: memory growth and resource leaks over many in-process requests
+
+Drives app.main:app directly through ASGI (no sockets, no server) with a mix
+of reads, writes, 404s, batches and readiness probes against a SQLite file
+standing in for MySQL. MYSQL_HOST and SHARD_HOSTS from the shell or
+config/.env are always overridden, since seed() empties the examples table.
+After a warm-up, every SOAK_CHECK_EVERY requests it waits for in-flight
+requests to drain and records:
+
+- tracemalloc traced memory and process RSS
+- pool.checkedout() across shard engines (must be back to 0 between rounds)
+- sessions opened by get_db_session that were never closed
+- open file descriptors and the ones held by logging handlers
+
+The retained-memory trend is the least-squares slope of traced memory over
+requests after warm-up. The run fails (exit status 1) if that slope is over
+SOAK_MAX_BYTES_PER_REQUEST, or if a connection, session or descriptor leaks,
+or if any request returns 5xx.
+
+The default million requests take two hours or more (roughly 100-150
+requests per second with tracemalloc on); set SOAK_REQUESTS for a quick run.
+
+    python benchmarks/soak_test.py
+    SOAK_REQUESTS=200000 SOAK_CHECK_EVERY=10000 python benchmarks/soak_test.py
+"""
+import asyncio
+import gc
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+REQUESTS = int(os.getenv("SOAK_REQUESTS", 1_000_000))
+CHECK_EVERY = int(os.getenv("SOAK_CHECK_EVERY", 50_000))
+WARMUP = int(os.getenv("SOAK_WARMUP", 20_000))
+CONCURRENCY = int(os.getenv("SOAK_CONCURRENCY", 8))
+ROWS = int(os.getenv("SOAK_ROWS", 200))
+MAX_BYTES_PER_REQUEST = float(os.getenv("SOAK_MAX_BYTES_PER_REQUEST", 16))
+MAX_FD_GROWTH = int(os.getenv("SOAK_MAX_FD_GROWTH", 0))
+TRACE_FRAMES = int(os.getenv("SOAK_TRACE_FRAMES", 1))
+SEED = int(os.getenv("SOAK_SEED", 1))
+
+_workdir = tempfile.mkdtemp(prefix="soak-")
+# Never the real database; an empty SHARD_HOSTS also keeps config/.env from adding shards
+os.environ["MYSQL_HOST"] = f"sqlite:///{_workdir}/soak.db"
+os.environ["SHARD_HOSTS"] = ""
+os.environ.setdefault("LOG_PATH", os.path.join(_workdir, "soak.log"))
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from app.config import db_config  # noqa: E402
+from app.config.db_config import Base, engine, shard_engines  # noqa: E402
+from app.config.logging_config import LoggingConfig  # noqa: E402
+from app.example.models.entity.example_entity import ExampleEntity  # noqa: E402
+from app.main import app  # noqa: E402
+from app.server.prefork_server import get_rss_bytes  # noqa: E402
+
+
+class TrackedSession(Session):
+    """Session that counts how many were opened and how many were closed"""
+
+    opened = 0
+    closed = 0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._soak_closed = False
+        TrackedSession.opened += 1
+
+    def close(self):
+        if not self._soak_closed:
+            self._soak_closed = True
+            TrackedSession.closed += 1
+        super().close()
+
+
+def open_fds() -> int:
+    for fd_dir in ("/proc/self/fd", "/dev/fd"):
+        if os.path.isdir(fd_dir):
+            return len(os.listdir(fd_dir))
+    return -1
+
+
+def log_handler_fds() -> int:
+    """Descriptors held by logging handlers (rotation must not accumulate them)"""
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+    fds = set()
+    for logger in loggers:
+        for handler in logger.handlers:
+            stream = getattr(handler, "stream", None)
+            try:
+                fds.add(stream.fileno())
+            except (AttributeError, OSError, ValueError):
+                pass
+    return len(fds)
+
+
+async def call(method: str, path: str, body=None):
+    """One request through the ASGI app; returns (status code, response body)"""
+    raw_path, _, query = path.partition("?")
+    payload = json.dumps(body).encode() if body is not None else b""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": raw_path,
+        "raw_path": raw_path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": [
+            (b"host", b"soak"),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(payload)).encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("soak", 80),
+        "state": {},
+    }
+    pending = [{"type": "http.request", "body": payload, "more_body": False}]
+    done = asyncio.Event()
+    status = 0
+    chunks = []
+
+    async def receive():
+        if pending:
+            return pending.pop()
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                done.set()
+
+    await app(scope, receive, send)
+    done.set()
+    return status, b"".join(chunks)
+
+
+class Workload:
+    """Deterministic request mix; created rows are deleted again so the table stays small"""
+
+    def __init__(self, seed: int):
+        self.random = random.Random(seed)
+        self.created = []
+        self.statuses = {}
+
+    def _id(self) -> int:
+        return self.random.randint(1, ROWS)
+
+    def next_request(self):
+        roll = self.random.random()
+        if roll < 0.40:
+            return "GET", f"/api/v1/examples/{self._id()}", None
+        if roll < 0.55:
+            ids = ",".join(str(self._id()) for _ in range(5))
+            return "GET", f"/api/v1/examples/?ids={ids}", None
+        if roll < 0.65:
+            return "GET", "/api/v1/examples/", None
+        if roll < 0.75:
+            return "POST", "/api/v1/examples/", {"name": "soak", "description": "x" * 64}
+        if roll < 0.85 and self.created:
+            return "DELETE", f"/api/v1/examples/{self.created.pop(0)}", None
+        if roll < 0.90:
+            return "PUT", f"/api/v1/examples/{self._id()}", {"description": f"v{roll}"}
+        if roll < 0.95:
+            return "GET", "/api/v1/examples/99999999", None
+        if roll < 0.99:
+            requests = [
+                {"path": f"/api/v1/examples/{self._id()}"},
+                {"path": f"/api/v1/examples/?ids={self._id()},{self._id()}"},
+            ]
+            return "POST", "/api/v1/batch/", {"requests": requests}
+        return "GET", "/api/v1/system/ready", None
+
+    async def worker(self, count: int):
+        for _ in range(count):
+            method, path, body = self.next_request()
+            status, content = await call(method, path, body)
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            if method == "POST" and status == 201:
+                # DELETEs drain the created rows oldest-first
+                self.created.append(json.loads(content)["data"]["id"])
+
+
+async def run_round(workload: Workload, count: int):
+    share, extra = divmod(count, CONCURRENCY)
+    await asyncio.gather(
+        *(workload.worker(share + (1 if i < extra else 0)) for i in range(CONCURRENCY))
+    )
+
+
+def seed():
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(ExampleEntity.__table__.delete())
+        conn.execute(
+            ExampleEntity.__table__.insert(),
+            [{"id": i, "name": f"Example {i}", "description": "seed"} for i in range(1, ROWS + 1)],
+        )
+
+
+def slope(points) -> float:
+    """Least-squares slope of y over x"""
+    if len(points) < 2:
+        return 0.0
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x if var_x else 0.0
+
+
+async def soak() -> int:
+    seed()
+    db_config.SessionLocal = sessionmaker(
+        class_=TrackedSession, autocommit=False, autoflush=False, bind=engine
+    )
+    LoggingConfig.get_logger()
+    workload = Workload(SEED)
+
+    async with app.router.lifespan_context(app):
+        await run_round(workload, WARMUP)
+        gc.collect()
+        tracemalloc.start(TRACE_FRAMES)
+        baseline = tracemalloc.take_snapshot()
+        base_fds, base_log_fds = open_fds(), log_handler_fds()
+        base_rss = get_rss_bytes()
+
+        print(
+            f"{REQUESTS} requests after {WARMUP} warm-up, concurrency {CONCURRENCY}, "
+            f"check every {CHECK_EVERY}\n"
+        )
+        print(
+            f"{'requests':>10}{'req/s':>9}{'traced':>11}{'B/req':>8}{'RSS':>11}"
+            f"{'pool':>6}{'unclosed':>10}{'fds':>6}{'log fds':>9}"
+        )
+        traced_points, rss_points, failures = [], [], []
+        done_requests = 0
+        while done_requests < REQUESTS:
+            count = min(CHECK_EVERY, REQUESTS - done_requests)
+            started = time.perf_counter()
+            await run_round(workload, count)
+            elapsed = time.perf_counter() - started
+            done_requests += count
+
+            gc.collect()
+            traced = tracemalloc.get_traced_memory()[0]
+            rss = get_rss_bytes()
+            traced_points.append((done_requests, traced))
+            rss_points.append((done_requests, rss))
+            checked_out = sum(shard_engine.pool.checkedout() for shard_engine in shard_engines)
+            unclosed = TrackedSession.opened - TrackedSession.closed
+            fds, log_fds = open_fds(), log_handler_fds()
+            print(
+                f"{done_requests:>10}{count / elapsed:>9.0f}{traced / 2**20:>9.2f}MB"
+                f"{traced / done_requests:>8.1f}{(rss - base_rss) / 2**20:>9.1f}MB"
+                f"{checked_out:>6}{unclosed:>10}{fds - base_fds:>+6}{log_fds:>9}"
+            )
+            if checked_out:
+                failures.append(f"{checked_out} connection(s) still checked out at {done_requests}")
+            if unclosed:
+                failures.append(f"{unclosed} session(s) never closed at {done_requests}")
+
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    fds, log_fds = open_fds(), log_handler_fds()
+    retained_per_request = slope(traced_points)
+    print(f"\nstatuses: {dict(sorted(workload.statuses.items()))}")
+    print(f"retained: {retained_per_request:.2f} B/request traced, "
+          f"{slope(rss_points):.2f} B/request RSS (slope after warm-up)")
+    print("\ntop growth since warm-up:")
+    for stat in snapshot.compare_to(baseline, "lineno")[:10]:
+        if stat.size_diff > 0:
+            print(f"  {stat.size_diff / 1024:>10.1f} KiB {stat.count_diff:>+8} {stat.traceback}")
+
+    if retained_per_request > MAX_BYTES_PER_REQUEST:
+        failures.append(
+            f"retained {retained_per_request:.2f} B/request > {MAX_BYTES_PER_REQUEST} B/request"
+        )
+    if fds - base_fds > MAX_FD_GROWTH:
+        failures.append(f"{fds - base_fds} file descriptor(s) leaked")
+    if log_fds > base_log_fds:
+        failures.append(f"logging handlers hold {log_fds - base_log_fds} more descriptor(s)")
+    server_errors = sum(n for status, n in workload.statuses.items() if status >= 500)
+    if server_errors:
+        failures.append(f"{server_errors} 5xx response(s)")
+
+    print()
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if not failures:
+        print("PASS")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(soak()))
@@ -0,0 +1,108 @@
+"""
+Tests for the batch endpoint (real in-memory SQLite)
+"""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.config import db_config
+from app.config.db_config import Base
+from app.example.models.entity.example_entity import ExampleEntity
+from app.main import app
+from tests.query_budget import create_counting_engine
+
+
+@pytest.fixture
+def opened_sessions(monkeypatch, query_counter):
+    """Route get_db_session to an in-memory database and record every session it opens"""
+    engine = create_counting_engine(query_counter)
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    seed = factory()
+    seed.add_all(ExampleEntity(name=f"Example {i}") for i in range(1, 4))
+    seed.commit()
+    seed.close()
+
+    sessions = []
+
+    def session_local():
+        session = factory()
+        sessions.append(session)
+        return session
+
+    monkeypatch.setattr(db_config, "SessionLocal", session_local)
+    yield sessions
+    engine.dispose()
+
+
+@pytest.fixture
+def batch_client(opened_sessions):
+    return TestClient(app)
+
+
+class TestBatchController:
+    """Test cases for POST /api/v1/batch"""
+
+    def test_sub_requests_share_one_session(self, batch_client, opened_sessions, query_counter):
+        """Test every sub-request runs on the batch's single session"""
+        # Arrange
+        payload = {
+            "requests": [
+                {"path": "/api/v1/examples/1"},
+                {"path": "/api/v1/examples/?ids=2,3"},
+                {"method": "POST", "path": "/api/v1/examples/", "body": {"name": "New"}},
+            ]
+        }
+
+        # Act
+        with query_counter.budget(max_queries=4):
+            response = batch_client.post("/api/v1/batch/", json=payload)
+
+        # Assert
+        results = response.json()["data"]
+        assert response.status_code == 200
+        assert [result["status"] for result in results] == [200, 200, 201]
+        assert results[0]["body"]["data"]["name"] == "Example 1"
+        assert [item["id"] for item in results[1]["body"]["data"]] == [2, 3]
+        assert results[2]["body"]["data"]["name"] == "New"
+        assert len(opened_sessions) == 1
+
+    def test_failed_sub_request_does_not_fail_batch(self, batch_client):
+        """Test errors are reported per sub-request"""
+        # Arrange
+        payload = {
+            "requests": [
+                {"path": "/api/v1/examples/999"},
+                {"method": "POST", "path": "/api/v1/examples/", "body": {"name": ""}},
+                {"path": "/api/v1/examples/1"},
+            ]
+        }
+
+        # Act
+        response = batch_client.post("/api/v1/batch/", json=payload)
+
+        # Assert
+        statuses = [result["status"] for result in response.json()["data"]]
+        assert statuses == [404, 422, 200]
+
+    def test_nested_batch_rejected(self, batch_client):
+        """Test a batch cannot contain another batch"""
+        # Act
+        response = batch_client.post(
+            "/api/v1/batch/", json={"requests": [{"method": "POST", "path": "/api/v1/batch/"}]}
+        )
+
+        # Assert
+        assert response.json()["data"][0]["status"] == 400
+
+    def test_rejects_non_api_paths_and_oversized_batches(self, batch_client):
+        """Test paths outside /api/ and batches above the limit fail validation"""
+        # Act
+        outside = batch_client.post("/api/v1/batch/", json={"requests": [{"path": "/docs"}]})
+        oversized = batch_client.post(
+            "/api/v1/batch/", json={"requests": [{"path": "/api/v1/examples/1"}] * 51}
+        )
+
+        # Assert
+        assert outside.status_code == 422
+        assert oversized.status_code == 422
@@ -0,0 +1,343 @@
+"""
+Unit tests for database connectivity guard and circuit breaker
+"""
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.config import db_config
+from app.config.db_config import DbConnectGuard
+from app.main import app
+from app.system.controller import system_controller
+from app.utility.db.circuit_breaker_utility import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeDbapiError(Exception):
+    pass
+
+
+class FakeDbapi:
+    OperationalError = FakeDbapiError
+
+
+class FakeDialect:
+    """Dialect whose connect fails a given number of times"""
+
+    loaded_dbapi = FakeDbapi
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.attempts = 0
+
+    def connect(self, *cargs, **cparams):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise FakeDbapiError("connection refused")
+        return "connection"
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(monkeypatch, clock):
+    """Fresh breaker (2 failures, 10s reset) installed on DbConnectGuard"""
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+    monkeypatch.setattr(DbConnectGuard, "breaker", breaker)
+    monkeypatch.setattr(db_config.time, "sleep", lambda delay: None)
+    return breaker
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker"""
+
+    def test_opens_after_consecutive_failures(self, breaker):
+        """Test the circuit opens at the failure threshold and rejects calls"""
+        # Act
+        breaker.record_failure()
+        assert breaker.state == CLOSED
+        breaker.record_failure()
+
+        # Assert
+        assert breaker.state == OPEN
+        assert breaker.allow() is False
+        assert breaker.retry_after() == 10
+
+    def test_success_resets_failure_count(self, breaker):
+        """Test a success between failures keeps the circuit closed"""
+        # Act
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        # Assert
+        assert breaker.state == CLOSED
+
+    def test_half_open_after_timeout(self, breaker, clock):
+        """Test the circuit half-opens after the reset timeout and closes on success"""
+        # Arrange
+        breaker.record_failure()
+        breaker.record_failure()
+
+        # Act
+        clock.now += 10
+
+        # Assert
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow() is True
+        breaker.record_success()
+        assert breaker.state == CLOSED
+
+    def test_half_open_failure_reopens(self, breaker, clock):
+        """Test a single failure while half-open re-opens the circuit"""
+        # Arrange
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now += 10
+
+        # Act
+        breaker.record_failure()
+
+        # Assert
+        assert breaker.state == OPEN
+        assert breaker.retry_after() == 10
+
+    def test_half_open_allows_a_single_probe(self, breaker, clock):
+        """Test only one caller probes a half-open circuit until it reports back"""
+        # Arrange
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now += 10
+
+        # Act
+        first = breaker.allow()
+        peek = breaker.allow(claim_probe=False)
+        second = breaker.allow()
+        clock.now += 10
+        after_probe_timeout = breaker.allow()
+
+        # Assert
+        assert (first, peek, second) == (True, False, False)
+        assert after_probe_timeout is True
+
+
+class TestDbConnectGuard:
+    """Test cases for DbConnectGuard"""
+
+    def test_connect_retries_then_succeeds(self, breaker):
+        """Test transient connect failures are retried with backoff"""
+        # Arrange
+        dialect = FakeDialect(failures=DbConnectGuard.retries)
+
+        # Act
+        connection = DbConnectGuard._connect(dialect, None, (), {})
+
+        # Assert
+        assert connection == "connection"
+        assert dialect.attempts == DbConnectGuard.retries + 1
+        assert breaker.snapshot()["consecutive_failures"] == 0
+
+    def test_connect_failures_trip_breaker(self, breaker):
+        """Test exhausted retries count as failures and then fail fast"""
+        # Arrange
+        dialect = FakeDialect(failures=100)
+
+        # Act
+        for _ in range(2):
+            with pytest.raises(FakeDbapiError):
+                DbConnectGuard._connect(dialect, None, (), {})
+        attempts = dialect.attempts
+        with pytest.raises(FakeDbapiError, match="circuit open"):
+            DbConnectGuard._connect(dialect, None, (), {})
+
+        # Assert
+        assert breaker.state == OPEN
+        assert dialect.attempts == attempts
+
+    def test_half_open_probe_does_not_retry(self, breaker, clock):
+        """Test a half-open circuit makes a single connect attempt"""
+        # Arrange
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now += 10
+        dialect = FakeDialect(failures=100)
+
+        # Act
+        with pytest.raises(FakeDbapiError):
+            DbConnectGuard._connect(dialect, None, (), {})
+
+        # Assert
+        assert dialect.attempts == 1
+        assert breaker.state == OPEN
+
+    def test_connect_on_event_loop_does_not_retry(self, breaker, monkeypatch):
+        """Test a connect made inline on the event loop fails fast without sleeping"""
+        # Arrange
+        dialect = FakeDialect(failures=1)
+        sleeps = []
+        monkeypatch.setattr(db_config.time, "sleep", sleeps.append)
+
+        async def connect_inline():
+            DbConnectGuard._connect(dialect, None, (), {})
+
+        # Act
+        with pytest.raises(FakeDbapiError):
+            asyncio.run(connect_inline())
+
+        # Assert
+        assert dialect.attempts == 1
+        assert sleeps == []
+        assert breaker.snapshot()["consecutive_failures"] == 1
+
+    def test_each_shard_has_its_own_breaker(self, breaker, monkeypatch, clock):
+        """Test a dead shard opens its own circuit without failing shard 0"""
+        # Arrange
+        monkeypatch.setattr(
+            DbConnectGuard, "shard_breakers", {1: CircuitBreaker(2, 10, clock=clock)}
+        )
+        dialect = FakeDialect(failures=100)
+
+        # Act
+        for _ in range(2):
+            with pytest.raises(FakeDbapiError):
+                DbConnectGuard._connect(dialect, None, (), {}, shard=1)
+
+        # Assert
+        assert DbConnectGuard.breaker_for(1).state == OPEN
+        assert breaker.state == CLOSED
+        assert DbConnectGuard._connect(FakeDialect(failures=0), None, (), {}) == "connection"
+
+    def test_sharding_requires_mysql(self, tmp_path):
+        """Test a non-MySQL shard URL is rejected at startup"""
+        # Arrange
+        env = dict(
+            os.environ,
+            MYSQL_HOST="mysql+pymysql://u:p@localhost/db",
+            SHARD_HOSTS=f"sqlite:///{tmp_path}/shard1.db",
+        )
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, "-c", "import app.config.db_config"],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+
+        # Assert
+        assert result.returncode != 0
+        assert "SHARD_HOSTS requires MySQL" in result.stderr
+
+
+class TestGetDbSession:
+    """Test cases for get_db_session behaviour through the API"""
+
+    def test_open_circuit_returns_503(self, client, breaker):
+        """Test requests fail fast with 503 while the circuit is open"""
+        # Arrange
+        breaker.record_failure()
+        breaker.record_failure()
+
+        # Act
+        response = client.get("/api/v1/examples/1")
+
+        # Assert
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "10"
+
+    def test_connect_failure_returns_503(self, client, breaker, monkeypatch, tmp_path):
+        """Test a database that cannot be reached answers 503 and counts against the breaker"""
+        # Arrange
+        engine = create_engine(f"sqlite:///{tmp_path}/missing/dir/app.db")
+        DbConnectGuard.install(engine)
+        monkeypatch.setattr(db_config, "SessionLocal", sessionmaker(bind=engine))
+
+        # Act
+        response = client.get("/api/v1/examples/1")
+
+        # Assert
+        assert response.status_code == 503
+        assert breaker.snapshot()["consecutive_failures"] == 1
+        engine.dispose()
+
+    def test_other_operational_errors_are_not_503(self, breaker, monkeypatch):
+        """Test query errors unrelated to connectivity (missing table, deadlock) are not 503s"""
+        # Arrange: a database without the examples table
+        engine = create_engine(
+            "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+        monkeypatch.setattr(db_config, "SessionLocal", sessionmaker(bind=engine))
+        client = TestClient(app, raise_server_exceptions=False)
+
+        # Act
+        response = client.get("/api/v1/examples/1")
+
+        # Assert
+        assert response.status_code == 500
+        assert breaker.snapshot()["consecutive_failures"] == 0
+        engine.dispose()
+
+
+class TestReadiness:
+    """Test cases for the readiness endpoint"""
+
+    def test_ready_when_closed(self, client, breaker):
+        """Test readiness reports 200 while the circuit is closed"""
+        # Act
+        response = client.get("/api/v1/system/ready")
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json()["data"]["state"] == CLOSED
+
+    def test_not_ready_when_any_shard_is_open(self, client, breaker, monkeypatch, clock):
+        """Test a dead shard makes the service not ready and is reported per shard"""
+        # Arrange
+        shard_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        shard_breaker.record_failure(FakeDbapiError("secret-db-host:3306 refused"))
+        monkeypatch.setattr(DbConnectGuard, "shard_breakers", {1: shard_breaker})
+        monkeypatch.setattr(system_controller, "shard_engines", [None, None])
+
+        # Act
+        response = client.get("/api/v1/system/ready")
+
+        # Assert
+        data = response.json()["data"]
+        assert response.status_code == 503
+        assert data["state"] == OPEN
+        assert data["shards"]["0"]["state"] == CLOSED
+        assert data["shards"]["1"]["state"] == OPEN
+        assert "secret-db-host" not in response.text
+
+    def test_not_ready_when_open(self, client, breaker):
+        """Test readiness reports 503 while the circuit is open"""
+        # Arrange
+        breaker.record_failure()
+        breaker.record_failure()
+
+        # Act
+        response = client.get("/api/v1/system/ready")
+
+        # Assert
+        assert response.status_code == 503
+        assert response.json()["data"]["state"] == OPEN
+        assert response.headers["Retry-After"] == "10"
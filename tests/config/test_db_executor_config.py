@@ -0,0 +1,89 @@
+"""
+Unit tests for DbExecutor
+"""
+import asyncio
+import threading
+
+import pytest
+
+from app.config.db_executor_config import DbExecutor, DbExecutorSaturatedException
+
+
+@pytest.fixture
+def db_executor(monkeypatch):
+    """DbExecutor with one worker and one queue slot"""
+    monkeypatch.setenv("DB_EXECUTOR_WORKERS", "1")
+    monkeypatch.setenv("DB_EXECUTOR_QUEUE", "1")
+    DbExecutor.shutdown()
+    monkeypatch.setattr(DbExecutor, "_metrics", {})
+    yield DbExecutor
+    DbExecutor.shutdown()
+
+
+class TestDbExecutor:
+    """Test cases for DbExecutor"""
+
+    def test_run_returns_result_and_records_metrics(self, db_executor):
+        """Test run executes on a worker thread and counts the call"""
+        # Act
+        result = asyncio.run(db_executor.run("get_examples", lambda: 42))
+
+        # Assert
+        route = db_executor.snapshot()["routes"]["get_examples"]
+        assert result == 42
+        assert route["calls"] == 1
+        assert route["queued"] == 0
+
+    def test_run_rejects_when_saturated(self, db_executor):
+        """Test calls beyond workers + queue are rejected with 503"""
+        # Arrange
+        release = threading.Event()
+
+        async def scenario():
+            busy = [
+                asyncio.ensure_future(db_executor.run("slow", release.wait))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0.05)
+            try:
+                with pytest.raises(DbExecutorSaturatedException) as exc_info:
+                    await db_executor.run("slow", release.wait)
+            finally:
+                release.set()
+                await asyncio.gather(*busy)
+            return exc_info.value
+
+        # Act
+        error = asyncio.run(scenario())
+
+        # Assert
+        assert error.status_code == 503
+        assert db_executor.snapshot()["routes"]["slow"]["rejected"] == 1
+        assert db_executor.snapshot()["in_flight"] == 0
+
+    def test_cancelled_call_counts_until_thread_finishes(self, db_executor):
+        """Test a cancelled request keeps its slot while its query is still running"""
+        # Arrange
+        release = threading.Event()
+        running = threading.Event()
+
+        def query():
+            running.set()
+            release.wait(5)
+
+        async def scenario():
+            task = asyncio.ensure_future(db_executor.run("slow", query))
+            await asyncio.get_running_loop().run_in_executor(None, running.wait, 5)
+            task.cancel()
+            await asyncio.sleep(0.01)
+            in_flight = db_executor.snapshot()["in_flight"]
+            release.set()
+            await asyncio.sleep(0.05)
+            return in_flight
+
+        # Act
+        in_flight_after_cancel = asyncio.run(scenario())
+
+        # Assert
+        assert in_flight_after_cancel == 1
+        assert db_executor.snapshot()["in_flight"] == 0
@@ -0,0 +1,72 @@
+"""
+Unit tests for ThreadConfig and thread-safe LoggingConfig
+"""
+import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from app.config import thread_config
+from app.config.logging_config import LoggingConfig
+from app.config.thread_config import ThreadConfig
+
+
+class TestThreadConfig:
+    """Test cases for ThreadConfig"""
+
+    def test_run_sync_inline_by_default(self, monkeypatch):
+        """Test run_sync calls the function on the calling thread by default"""
+        # Arrange
+        monkeypatch.delenv("THREADED_HANDLERS", raising=False)
+
+        # Act
+        result = asyncio.run(ThreadConfig.run_sync(threading.get_ident))
+
+        # Assert
+        assert result == threading.get_ident()
+
+    def test_run_sync_on_thread_pool_when_threaded(self, monkeypatch):
+        """Test run_sync runs the function on a worker thread when enabled"""
+        # Arrange
+        monkeypatch.setenv("THREADED_HANDLERS", "True")
+
+        # Act
+        result = asyncio.run(ThreadConfig.run_sync(threading.get_ident))
+
+        # Assert
+        assert result != threading.get_ident()
+
+    def test_run_sync_off_the_loop_when_sharded(self, monkeypatch):
+        """Test sharded deployments never scatter from the event loop thread"""
+        # Arrange
+        monkeypatch.delenv("THREADED_HANDLERS", raising=False)
+        monkeypatch.setattr(thread_config, "shard_router", object())
+
+        # Act
+        result = asyncio.run(ThreadConfig.run_sync(threading.get_ident))
+
+        # Assert
+        assert result != threading.get_ident()
+
+
+class TestLoggingConfig:
+    """Test cases for LoggingConfig"""
+
+    def test_get_logger_is_singleton_across_threads(self, monkeypatch):
+        """Test concurrent get_logger calls create a single instance"""
+        # Arrange
+        monkeypatch.setattr(LoggingConfig, "_instance", None)
+        core_logger = logging.getLogger("core-log")
+        handlers_before = list(core_logger.handlers)
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            loggers = list(executor.map(lambda _: LoggingConfig.get_logger(), range(32)))
+        added = [h for h in core_logger.handlers if h not in handlers_before]
+        for handler in added:
+            core_logger.removeHandler(handler)
+            handler.close()
+
+        # Assert
+        assert all(logger is loggers[0] for logger in loggers)
+        assert len(added) == 2
@@ -3,14 +3,15 @@ Pytest configuration and fixtures
 """
 import pytest
 from unittest.mock import MagicMock
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 from fastapi.testclient import TestClient
 
 from app.main import app
-from app.config.db_config import get_db_session
+from app.config.db_config import Base, get_db_session
 from app.example.repository.example_repository import ExampleRepository
 from app.example.service.example_service import ExampleService
 from app.example.models.entity.example_entity import ExampleEntity
+from tests.query_budget import QueryCounter, create_counting_engine
 
 
 @pytest.fixture
@@ -59,3 +60,32 @@ def override_db_session():
     app.dependency_overrides[get_db_session] = _get_mock_db
     yield mock_session
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def query_counter():
+    """Counts SQL statements and fetched rows of the in-memory database"""
+    return QueryCounter()
+
+
+@pytest.fixture
+def db_session(query_counter):
+    """Real in-memory SQLite session with counted queries"""
+    engine = create_counting_engine(query_counter)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def db_client(db_session):
+    """Test client whose requests use the in-memory database session"""
+
+    def _get_db():
+        yield db_session
+
+    app.dependency_overrides[get_db_session] = _get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
@@ -63,3 +63,24 @@ class TestExampleDTO:
         assert dto.description is None
         assert dto.created_at is None
         assert dto.updated_at is None
+
+    def test_from_rows_converts_rows(self):
+        """Test from_rows builds DTOs from (id, name, description, created_at, updated_at) rows"""
+        # Arrange
+        rows = [(1, "A", None, None, None), (2, "B", "Desc", None, None)]
+
+        # Act
+        result = ExampleDTO.from_rows(rows)
+
+        # Assert
+        assert [dto.id for dto in result] == [1, 2]
+        assert result[1].description == "Desc"
+
+    def test_dto_is_immutable(self):
+        """Test DTO fields cannot be reassigned"""
+        # Arrange
+        dto = ExampleDTO(id=1, name="Test")
+
+        # Act & Assert
+        with pytest.raises(AttributeError):
+            dto.name = "Changed"
@@ -0,0 +1,76 @@
+"""
+Query budgets for the Example endpoints (real in-memory SQLite)
+"""
+import pytest
+
+from app.example.models.entity.example_entity import ExampleEntity
+from tests.query_budget import QueryBudgetExceeded
+
+
+@pytest.fixture
+def seeded(db_session):
+    """Three examples in the database"""
+    db_session.add_all(ExampleEntity(name=f"Example {i}") for i in range(1, 4))
+    db_session.commit()
+    db_session.expunge_all()
+
+
+class TestExampleQueryBudget:
+    """Each Example endpoint must stay within its query budget"""
+
+    def test_get_examples_budget(self, db_client, query_counter, seeded):
+        """GET list: one SELECT, one row per example"""
+        with query_counter.budget(max_queries=1, max_rows=3):
+            response = db_client.get("/api/v1/examples/")
+
+        assert response.status_code == 200
+        assert len(response.json()["data"]) == 3
+
+    def test_get_example_budget(self, db_client, query_counter, seeded):
+        """GET by id: one SELECT, one row"""
+        with query_counter.budget(max_queries=1, max_rows=1):
+            response = db_client.get("/api/v1/examples/2")
+
+        assert response.json()["data"]["name"] == "Example 2"
+
+    def test_get_example_not_found_budget(self, db_client, query_counter, seeded):
+        """GET missing id: one SELECT"""
+        with query_counter.budget(max_queries=1, max_rows=0):
+            response = db_client.get("/api/v1/examples/999")
+
+        assert response.status_code == 404
+
+    def test_get_examples_by_ids_budget(self, db_client, query_counter, seeded):
+        """GET ?ids=: one SELECT ... IN, one row per found id"""
+        with query_counter.budget(max_queries=1, max_rows=2):
+            response = db_client.get("/api/v1/examples/?ids=3,1,999")
+
+        assert [item["id"] for item in response.json()["data"]] == [3, 1]
+
+    def test_create_example_budget(self, db_client, query_counter):
+        """POST: INSERT ... RETURNING plus the refresh SELECT"""
+        with query_counter.budget(max_queries=2, max_rows=2):
+            response = db_client.post("/api/v1/examples/", json={"name": "New"})
+
+        assert response.status_code == 201
+
+    def test_update_example_budget(self, db_client, query_counter, seeded):
+        """PUT: SELECT, UPDATE and the refresh SELECT"""
+        with query_counter.budget(max_queries=3, max_rows=2):
+            response = db_client.put("/api/v1/examples/1", json={"name": "Renamed"})
+
+        assert response.json()["data"]["name"] == "Renamed"
+
+    def test_delete_example_budget(self, db_client, query_counter, seeded):
+        """DELETE: SELECT and DELETE"""
+        with query_counter.budget(max_queries=2, max_rows=1):
+            response = db_client.delete("/api/v1/examples/1")
+
+        assert response.status_code == 200
+
+    def test_budget_exceeded_raises(self, db_client, query_counter, seeded):
+        """Test the budget fails when a block issues too many queries"""
+        with pytest.raises(QueryBudgetExceeded):
+            with query_counter.budget(max_queries=1):
+                db_client.get("/api/v1/examples/")
+                db_client.get("/api/v1/examples/1")
@@ -14,7 +14,7 @@ class TestExampleRepository:
         """Test find_all returns a list of entities"""
         # Arrange
         mock_entities = [MagicMock(spec=ExampleEntity), MagicMock(spec=ExampleEntity)]
-        mock_db_session.query.return_value.all.return_value = mock_entities
+        mock_db_session.scalars.return_value.all.return_value = mock_entities
 
         repository = ExampleRepository(mock_db_session)
 
@@ -23,12 +23,12 @@ class TestExampleRepository:
 
         # Assert
         assert result == mock_entities
-        mock_db_session.query.assert_called_once_with(ExampleEntity)
+        mock_db_session.scalars.assert_called_once()
 
     def test_find_all_returns_empty_list(self, mock_db_session):
         """Test find_all returns empty list when no data"""
         # Arrange
-        mock_db_session.query.return_value.all.return_value = []
+        mock_db_session.scalars.return_value.all.return_value = []
         repository = ExampleRepository(mock_db_session)
 
         # Act
@@ -37,12 +37,24 @@ class TestExampleRepository:
         # Assert
         assert result == []
 
+    def test_find_all_rows_returns_rows(self, mock_db_session):
+        """Test find_all_rows returns plain rows from a column-only select"""
+        # Arrange
+        rows = [(1, "Test", None, None, None)]
+        mock_db_session.execute.return_value.all.return_value = rows
+        repository = ExampleRepository(mock_db_session)
+
+        # Act
+        result = repository.find_all_rows()
+
+        # Assert
+        assert result == rows
+        mock_db_session.scalars.assert_not_called()
+
     def test_find_by_id_returns_entity(self, mock_db_session, sample_entity):
         """Test find_by_id returns entity when found"""
         # Arrange
-        mock_db_session.query.return_value.filter.return_value.first.return_value = (
-            sample_entity
-        )
+        mock_db_session.scalars.return_value.first.return_value = sample_entity
         repository = ExampleRepository(mock_db_session)
 
         # Act
@@ -51,11 +63,13 @@ class TestExampleRepository:
         # Assert
         assert result == sample_entity
         assert result.id == 1
+        _, params = mock_db_session.scalars.call_args.args
+        assert params == {"example_id": 1}
 
     def test_find_by_id_returns_none(self, mock_db_session):
         """Test find_by_id returns None when not found"""
         # Arrange
-        mock_db_session.query.return_value.filter.return_value.first.return_value = None
+        mock_db_session.scalars.return_value.first.return_value = None
         repository = ExampleRepository(mock_db_session)
 
         # Act
@@ -64,6 +78,32 @@ class TestExampleRepository:
         # Assert
         assert result is None
 
+    def test_find_by_ids_uses_single_query(self, mock_db_session, sample_entity):
+        """Test find_by_ids issues one query with the expanded id list"""
+        # Arrange
+        mock_db_session.scalars.return_value.all.return_value = [sample_entity]
+        repository = ExampleRepository(mock_db_session)
+
+        # Act
+        result = repository.find_by_ids((1, 2))
+
+        # Assert
+        assert result == [sample_entity]
+        _, params = mock_db_session.scalars.call_args.args
+        assert params == {"example_ids": [1, 2]}
+
+    def test_find_by_ids_empty_skips_query(self, mock_db_session):
+        """Test find_by_ids with no ids does not touch the database"""
+        # Arrange
+        repository = ExampleRepository(mock_db_session)
+
+        # Act
+        result = repository.find_by_ids([])
+
+        # Assert
+        assert result == []
+        mock_db_session.scalars.assert_not_called()
+
     def test_save_creates_entity(self, mock_db_session, sample_entity):
         """Test save persists entity and returns it"""
         # Arrange
@@ -94,7 +134,7 @@ class TestExampleRepository:
     def test_exists_by_id_returns_true(self, mock_db_session):
         """Test exists_by_id returns True when entity exists"""
         # Arrange
-        mock_db_session.query.return_value.filter.return_value.count.return_value = 1
+        mock_db_session.scalar.return_value = True
         repository = ExampleRepository(mock_db_session)
 
         # Act
@@ -106,7 +146,7 @@ class TestExampleRepository:
     def test_exists_by_id_returns_false(self, mock_db_session):
         """Test exists_by_id returns False when entity not exists"""
         # Arrange
-        mock_db_session.query.return_value.filter.return_value.count.return_value = 0
+        mock_db_session.scalar.return_value = False
         repository = ExampleRepository(mock_db_session)
 
         # Act
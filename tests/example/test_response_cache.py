@@ -0,0 +1,54 @@
+"""
+Response cache of the list endpoint, end to end (real in-memory SQLite)
+"""
+import pytest
+
+from app.config.cache_config import CacheConfig
+
+
+@pytest.fixture
+def cached_client(db_client, monkeypatch, tmp_path):
+    """db_client with the response cache enabled in a temporary directory"""
+    monkeypatch.setenv("RESPONSE_CACHE_ENABLED", "True")
+    monkeypatch.setenv("RESPONSE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(CacheConfig, "_versions", {})
+    monkeypatch.setattr(CacheConfig, "_caches", {})
+    return db_client
+
+
+def names(client):
+    return [item["name"] for item in client.get("/api/v1/examples/").json()["data"]]
+
+
+class TestResponseCacheInvalidation:
+    """Test cases for list GET caching across writes"""
+
+    def test_repeated_get_is_served_from_cache(self, cached_client, db_session, query_counter):
+        """Test a second list GET runs no query"""
+        # Arrange
+        cached_client.post("/api/v1/examples/", json={"name": "First"})
+        names(cached_client)
+        query_counter.reset()
+
+        # Act
+        result = names(cached_client)
+
+        # Assert
+        assert result == ["First"]
+        assert query_counter.statements == []
+
+    def test_writes_invalidate_cached_list(self, cached_client):
+        """Test POST, PUT and DELETE are each visible in the next list GET"""
+        # Arrange
+        created = cached_client.post("/api/v1/examples/", json={"name": "First"}).json()["data"]
+        assert names(cached_client) == ["First"]
+
+        # Act & Assert
+        cached_client.post("/api/v1/examples/", json={"name": "Second"})
+        assert names(cached_client) == ["First", "Second"]
+
+        cached_client.put(f"/api/v1/examples/{created['id']}", json={"name": "Renamed"})
+        assert names(cached_client) == ["Renamed", "Second"]
+
+        cached_client.delete(f"/api/v1/examples/{created['id']}")
+        assert names(cached_client) == ["Second"]
@@ -11,6 +11,8 @@ from app.example.models.schema.example_schema import (
     ExampleUpdateRequest,
 )
 from app.example.exception import ExampleNotFoundException
+from app.example.models.dto.example_dto import ExampleDTO
+from app.example.snapshot.example_snapshot import ExampleSnapshot
 
 
 class TestExampleService:
@@ -37,10 +39,10 @@ class TestExampleService:
         entity.updated_at = None
         return entity
 
-    def test_get_all_returns_dtos(self, service, mock_repository, sample_entity):
-        """Test get_all returns list of DTOs"""
+    def test_get_all_returns_dtos(self, service, mock_repository):
+        """Test get_all returns list of DTOs built from rows"""
         # Arrange
-        mock_repository.find_all.return_value = [sample_entity]
+        mock_repository.find_all_rows.return_value = [(1, "Test", "Test Description", None, None)]
 
         # Act
         result = service.get_all()
@@ -49,12 +51,14 @@ class TestExampleService:
         assert len(result) == 1
         assert result[0].id == 1
         assert result[0].name == "Test"
-        mock_repository.find_all.assert_called_once()
+        assert result[0].description == "Test Description"
+        mock_repository.find_all_rows.assert_called_once()
+        mock_repository.find_all.assert_not_called()
 
     def test_get_all_returns_empty_list(self, service, mock_repository):
         """Test get_all returns empty list when no data"""
         # Arrange
-        mock_repository.find_all.return_value = []
+        mock_repository.find_all_rows.return_value = []
 
         # Act
         result = service.get_all()
@@ -166,3 +170,72 @@ class TestExampleService:
 
         # Assert
         assert result is False
+
+    def test_get_all_served_from_snapshot(self, mock_repository):
+        """Test get_all reads the snapshot instead of the repository when serving"""
+        # Arrange
+        snapshot = MagicMock(spec=ExampleSnapshot)
+        snapshot.is_serving.return_value = True
+        snapshot.get_all.return_value = [ExampleDTO(id=1, name="Test")]
+        service = ExampleService(mock_repository, snapshot)
+
+        # Act
+        result = service.get_all()
+
+        # Assert
+        assert result[0].id == 1
+        mock_repository.find_all_rows.assert_not_called()
+
+    def test_get_all_falls_back_when_snapshot_stale(self, mock_repository):
+        """Test get_all queries the repository when the snapshot is not serving"""
+        # Arrange
+        snapshot = MagicMock(spec=ExampleSnapshot)
+        snapshot.is_serving.return_value = False
+        mock_repository.find_all_rows.return_value = [(1, "Test", None, None, None)]
+        service = ExampleService(mock_repository, snapshot)
+
+        # Act
+        result = service.get_all()
+
+        # Assert
+        assert result[0].id == 1
+        snapshot.get_all.assert_not_called()
+
+    def test_get_by_ids_keeps_request_order(self, service, mock_repository):
+        """Test get_by_ids dedupes, keeps request order and skips unknown ids"""
+        # Arrange
+        entities = []
+        for example_id in (1, 3):
+            entity = MagicMock(spec=ExampleEntity)
+            entity.id = example_id
+            entity.name = f"Test {example_id}"
+            entity.description = None
+            entity.created_at = None
+            entity.updated_at = None
+            entities.append(entity)
+        mock_repository.find_by_ids.return_value = entities
+
+        # Act
+        result = service.get_by_ids([3, 2, 1, 3])
+
+        # Assert
+        assert [dto.id for dto in result] == [3, 1]
+        mock_repository.find_by_ids.assert_called_once_with([3, 2, 1])
+
+    def test_get_by_ids_queries_only_snapshot_misses(self, mock_repository, sample_entity):
+        """Test get_by_ids serves hits from the snapshot and queries the rest"""
+        # Arrange
+        snapshot = MagicMock(spec=ExampleSnapshot)
+        snapshot.is_serving.return_value = True
+        snapshot.get.side_effect = lambda example_id: (
+            ExampleDTO(id=2, name="Cached") if example_id == 2 else None
+        )
+        mock_repository.find_by_ids.return_value = [sample_entity]
+        service = ExampleService(mock_repository, snapshot)
+
+        # Act
+        result = service.get_by_ids([2, 1])
+
+        # Assert
+        assert [dto.name for dto in result] == ["Cached", "Test"]
+        mock_repository.find_by_ids.assert_called_once_with([1])
@@ -0,0 +1,133 @@
+"""
+ExampleRepository over two shards (real SQLite files)
+"""
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import object_session
+
+from app.config.db_config import Base
+from app.example.models.entity.example_entity import ExampleEntity
+from app.example.repository.example_repository import ExampleRepository
+from app.utility.db.shard_router_utility import ShardRouter
+
+
+@pytest.fixture
+def router(tmp_path):
+    """Two shards holding ids 1..6 the way MySQL auto_increment offsets would place them"""
+    engines = [create_engine(f"sqlite:///{tmp_path}/shard{shard}.db") for shard in range(2)]
+    for shard_engine in engines:
+        Base.metadata.create_all(bind=shard_engine)
+    router = ShardRouter(engines)
+    for example_id in range(1, 7):
+        with router.session_factories[router.shard_for(example_id)]() as db:
+            db.add(ExampleEntity(id=example_id, name=f"Example {example_id}"))
+            db.commit()
+    yield router
+    router.shutdown()
+    for shard_engine in engines:
+        shard_engine.dispose()
+
+
+@pytest.fixture
+def shards(router):
+    sessions = router.sessions()
+    yield sessions
+    sessions.close()
+
+
+class TestShardRouter:
+    """Test cases for ShardRouter"""
+
+    def test_shard_for_matches_auto_increment_offsets(self, router):
+        """Test ids 1, 3, 5 go to shard 0 and 2, 4, 6 to shard 1"""
+        # Act & Assert
+        assert [router.shard_for(example_id) for example_id in range(1, 7)] == [0, 1, 0, 1, 0, 1]
+
+    def test_map_runs_in_parallel_and_keeps_order(self, router):
+        """Test map runs items on pool threads and returns results in item order"""
+        # Arrange
+        barrier = threading.Barrier(2, timeout=5)
+
+        def work(item):
+            barrier.wait()
+            return item * 10
+
+        # Act
+        result = router.map(work, [1, 2])
+
+        # Assert
+        assert result == [10, 20]
+
+
+class TestShardedExampleRepository:
+    """Test cases for ExampleRepository with shards"""
+
+    def test_find_by_id_reads_owning_shard(self, shards):
+        """Test a read by id goes to the shard owning the id"""
+        # Arrange
+        repository = ExampleRepository(shards.get(0), shards)
+
+        # Act
+        entity = repository.find_by_id(4)
+
+        # Assert
+        assert entity.name == "Example 4"
+        assert object_session(entity) is shards.get(1)
+
+    def test_find_all_rows_merges_in_id_order(self, shards):
+        """Test list reads scatter to every shard and merge by id"""
+        # Arrange
+        repository = ExampleRepository(shards.get(0), shards)
+
+        # Act
+        rows = repository.find_all_rows()
+
+        # Assert
+        assert [row.id for row in rows] == [1, 2, 3, 4, 5, 6]
+        assert [entity.id for entity in repository.find_all()] == [1, 2, 3, 4, 5, 6]
+
+    def test_count_sums_shards(self, shards):
+        """Test count adds up every shard"""
+        # Act & Assert
+        assert ExampleRepository(shards.get(0), shards).count() == 6
+
+    def test_find_by_ids_groups_by_shard(self, shards):
+        """Test ids are split per shard and the results combined"""
+        # Arrange
+        repository = ExampleRepository(shards.get(0), shards)
+
+        # Act
+        entities = repository.find_by_ids([6, 1, 3, 99])
+
+        # Assert
+        assert sorted(entity.id for entity in entities) == [1, 3, 6]
+
+    def test_update_stays_on_loaded_shard(self, shards, router):
+        """Test saving a loaded entity commits on its own shard"""
+        # Arrange
+        repository = ExampleRepository(shards.get(0), shards)
+        entity = repository.find_by_id(2)
+        entity.name = "Renamed"
+
+        # Act
+        repository.save(entity)
+
+        # Assert
+        with router.session_factories[1]() as db:
+            assert db.get(ExampleEntity, 2).name == "Renamed"
+        with router.session_factories[0]() as db:
+            assert db.get(ExampleEntity, 2) is None
+
+    def test_inserts_spread_round_robin(self, shards):
+        """Test new entities are placed on alternating shards"""
+        # Arrange
+        repository = ExampleRepository(shards.get(0), shards)
+
+        # Act
+        first = repository.save(ExampleEntity(name="First"))
+        second = repository.save(ExampleEntity(name="Second"))
+
+        # Assert
+        assert {object_session(first), object_session(second)} == {shards.get(0), shards.get(1)}
@@ -0,0 +1,181 @@
+"""
+Unit tests for ExampleSnapshot
+"""
+import threading
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.config.db_config import Base
+from app.config.snapshot_config import SnapshotConfig
+from app.example.models.entity.example_entity import ExampleEntity
+from app.example.snapshot.example_snapshot import ExampleSnapshot
+
+
+@pytest.fixture
+def db():
+    """Real in-memory SQLite session"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all(
+        [
+            ExampleEntity(id=1, name="one", updated_at=datetime(2026, 1, 1, 10, 0, 0)),
+            ExampleEntity(id=2, name="two", updated_at=datetime(2026, 1, 1, 11, 0, 0)),
+        ]
+    )
+    session.commit()
+    yield session
+    session.close()
+
+
+class TestExampleSnapshot:
+    """Test cases for ExampleSnapshot"""
+
+    def test_refresh_loads_all_rows(self, db):
+        """Test the first refresh loads the whole table"""
+        # Arrange
+        snapshot = ExampleSnapshot()
+
+        # Act
+        snapshot.refresh(db)
+
+        # Assert
+        assert [dto.name for dto in snapshot.get_all()] == ["one", "two"]
+        assert snapshot.get(2).updated_at == datetime(2026, 1, 1, 11, 0, 0)
+        assert snapshot.high_water_mark == datetime(2026, 1, 1, 11, 0, 0)
+        assert snapshot.is_serving()
+
+    def test_incremental_refresh_applies_newer_rows(self, db):
+        """Test later refreshes pick up rows changed after the high-water mark"""
+        # Arrange
+        snapshot = ExampleSnapshot()
+        snapshot.refresh(db)
+        entity = db.get(ExampleEntity, 1)
+        entity.name = "uno"
+        entity.updated_at = datetime(2026, 1, 1, 12, 0, 0)
+        db.add(ExampleEntity(id=3, name="three", updated_at=datetime(2026, 1, 1, 12, 0, 0)))
+        db.commit()
+
+        # Act
+        snapshot.refresh(db)
+
+        # Assert
+        assert [dto.name for dto in snapshot.get_all()] == ["uno", "two", "three"]
+        assert snapshot.high_water_mark == datetime(2026, 1, 1, 12, 0, 0)
+
+    def test_remove_leaves_tombstone(self, db):
+        """Test local deletes hide the row until the next full reload"""
+        # Arrange
+        snapshot = ExampleSnapshot()
+        snapshot.refresh(db)
+
+        # Act
+        snapshot.remove(1)
+
+        # Assert
+        assert snapshot.get(1) is None
+        assert snapshot.metrics()["tombstones"] == 1
+        assert [dto.id for dto in snapshot.get_all()] == [2]
+
+    def test_reconcile_drops_rows_deleted_elsewhere(self, db):
+        """Test the periodic full reload removes rows deleted by other writers"""
+        # Arrange
+        snapshot = ExampleSnapshot(reconcile_every=2)
+        snapshot.refresh(db)
+        db.delete(db.get(ExampleEntity, 2))
+        db.commit()
+
+        # Act
+        snapshot.refresh(db)
+        before_reconcile = snapshot.get(2)
+        snapshot.refresh(db)
+
+        # Assert
+        assert before_reconcile is not None
+        assert snapshot.get(2) is None
+
+    def test_detect_deletes_drops_rows_on_incremental_refresh(self, db):
+        """Test with detect_deletes a delete by another writer disappears on the next refresh"""
+        # Arrange
+        snapshot = ExampleSnapshot(reconcile_every=60, detect_deletes=True)
+        snapshot.refresh(db)
+        db.delete(db.get(ExampleEntity, 2))
+        db.commit()
+
+        # Act
+        snapshot.refresh(db)
+
+        # Assert
+        assert snapshot.get(2) is None
+        assert [dto.id for dto in snapshot.get_all()] == [1]
+
+    def test_remove_during_refresh_is_not_undone(self, db, monkeypatch):
+        """Test a local delete landing between the read and the apply stays deleted"""
+        # Arrange
+        snapshot = ExampleSnapshot(reconcile_every=2)
+        snapshot.refresh(db)
+        snapshot.refresh(db)
+        execute = db.execute
+
+        def execute_then_delete(*args, **kwargs):
+            result = execute(*args, **kwargs)
+            monkeypatch.undo()
+            db.delete(db.get(ExampleEntity, 1))
+            db.commit()
+            snapshot.remove(1)
+            return result
+
+        monkeypatch.setattr(db, "execute", execute_then_delete)
+
+        # Act
+        snapshot.refresh(db)
+
+        # Assert
+        assert snapshot.get(1) is None
+        assert [dto.id for dto in snapshot.get_all()] == [2]
+
+    def test_not_serving_when_stale_or_over_budget(self, db):
+        """Test reads fall back to the database when limits are exceeded"""
+        # Arrange
+        stale = ExampleSnapshot(max_staleness=0)
+        too_big = ExampleSnapshot(max_bytes=1)
+
+        # Act
+        stale.refresh(db)
+        too_big.refresh(db)
+
+        # Assert
+        assert not stale.is_serving()
+        assert not too_big.is_serving()
+
+
+class TestSnapshotConfig:
+    """Test cases for SnapshotConfig"""
+
+    def test_get_snapshot_is_singleton_across_threads(self, monkeypatch):
+        """Test concurrent first calls build a single snapshot"""
+        # Arrange
+        monkeypatch.setattr(SnapshotConfig, "_snapshot", None)
+        monkeypatch.setattr(SnapshotConfig, "is_enabled", staticmethod(lambda: True))
+        barrier = threading.Barrier(8)
+        snapshots = []
+
+        def get():
+            barrier.wait()
+            snapshots.append(SnapshotConfig.get_snapshot())
+
+        # Act
+        threads = [threading.Thread(target=get) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len({id(snapshot) for snapshot in snapshots}) == 1
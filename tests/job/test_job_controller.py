@@ -0,0 +1,94 @@
+"""
+Tests for the job endpoints (real in-memory SQLite)
+"""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.config import db_config
+from app.config.db_config import Base
+from app.config.job_config import JobConfig
+from app.job.runner.job_runner import JobRunner
+from app.main import app
+
+
+@pytest.fixture
+def session_factory(monkeypatch):
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.setattr(db_config, "SessionLocal", factory)
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def job_client(session_factory):
+    return TestClient(app)
+
+
+class TestJobController:
+    """Test cases for /api/v1/jobs"""
+
+    def test_submit_and_get_job(self, job_client):
+        """Test a submitted job is accepted as pending and can be looked up"""
+        # Act
+        submitted = job_client.post(
+            "/api/v1/jobs/", json={"type": "examples.import", "params": {"items": []}}
+        )
+        job_id = submitted.json()["data"]["id"]
+        fetched = job_client.get(f"/api/v1/jobs/{job_id}")
+
+        # Assert
+        assert submitted.status_code == 202
+        assert fetched.status_code == 200
+        assert fetched.json()["data"]["status"] == "pending"
+        assert fetched.json()["data"]["type"] == "examples.import"
+
+    def test_unknown_type_and_missing_job(self, job_client):
+        """Test unknown job types are rejected and unknown ids are 404"""
+        # Act
+        rejected = job_client.post("/api/v1/jobs/", json={"type": "nope"})
+        missing = job_client.get("/api/v1/jobs/999")
+
+        # Assert
+        assert rejected.status_code == 400
+        assert missing.status_code == 404
+
+    def test_cancel_pending_job(self, job_client):
+        """Test a pending job is cancelled at once and cannot be cancelled twice"""
+        # Arrange
+        job_id = job_client.post("/api/v1/jobs/", json={"type": "examples.export"}).json()[
+            "data"
+        ]["id"]
+
+        # Act
+        cancelled = job_client.post(f"/api/v1/jobs/{job_id}/cancel")
+        again = job_client.post(f"/api/v1/jobs/{job_id}/cancel")
+
+        # Assert
+        assert cancelled.json()["data"]["status"] == "cancelled"
+        assert again.status_code == 409
+
+    def test_download_export_result(self, job_client, session_factory, tmp_path, monkeypatch):
+        """Test the file of a finished export can be downloaded"""
+        # Arrange
+        monkeypatch.setenv("JOB_OUTPUT_DIR", str(tmp_path))
+        job_client.post("/api/v1/examples/", json={"name": "Exported"})
+        job_id = job_client.post("/api/v1/jobs/", json={"type": "examples.export"}).json()[
+            "data"
+        ]["id"]
+        pending = job_client.get(f"/api/v1/jobs/{job_id}/download")
+        JobRunner(session_factory, JobConfig.handlers(), tmp_path).run_next()
+
+        # Act
+        response = job_client.get(f"/api/v1/jobs/{job_id}/download")
+
+        # Assert
+        assert pending.status_code == 404
+        assert response.status_code == 200
+        assert [item["name"] for item in response.json()] == ["Exported"]
@@ -0,0 +1,259 @@
+"""
+Tests for the background job queue (real SQLite file, runner driven inline)
+"""
+import json
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app.config.db_config import Base
+from app.example.job.example_jobs import (
+    EXPORT_JOB,
+    IMPORT_JOB,
+    export_examples,
+    import_examples,
+)
+from app.example.models.entity.example_entity import ExampleEntity
+from app.job.models.entity.job_entity import JobEntity
+from app.job.repository.job_repository import JobRepository
+from app.job.runner.job_runner import JobRunner
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/jobs.db")
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def make_runner(session_factory, tmp_path, handlers=None, **kwargs):
+    handlers = handlers or {IMPORT_JOB: import_examples, EXPORT_JOB: export_examples}
+    return JobRunner(session_factory, handlers, tmp_path / "output", **kwargs)
+
+
+def submit(session_factory, job_type, params=None) -> int:
+    with session_factory() as db:
+        job = JobRepository(db).save(
+            JobEntity(type=job_type, status="pending", params=params or {}, progress=0)
+        )
+        return job.id
+
+
+def load(session_factory, job_id) -> JobEntity:
+    with session_factory() as db:
+        return JobRepository(db).find_by_id(job_id)
+
+
+class TestJobRepository:
+    """Test cases for JobRepository"""
+
+    def test_job_is_claimed_once(self, session_factory):
+        """Test two workers racing for one pending job: exactly one gets it"""
+        # Arrange
+        job_id = submit(session_factory, IMPORT_JOB)
+
+        # Act
+        with session_factory() as first, session_factory() as second:
+            claimed = JobRepository(first).claim_next([IMPORT_JOB], "worker-a")
+            again = JobRepository(second).claim_next([IMPORT_JOB], "worker-b")
+
+        # Assert
+        assert claimed.id == job_id
+        assert claimed.status == "running"
+        assert claimed.worker == "worker-a"
+        assert again is None
+
+    def test_claim_skips_unknown_types(self, session_factory):
+        """Test a worker only claims types it has handlers for"""
+        # Arrange
+        submit(session_factory, "other.type")
+
+        # Act
+        with session_factory() as db:
+            claimed = JobRepository(db).claim_next([IMPORT_JOB], "worker")
+
+        # Assert
+        assert claimed is None
+
+    def test_requeue_stale_running_jobs(self, session_factory):
+        """Test running jobs without a recent heartbeat go back to pending"""
+        # Arrange
+        job_id = submit(session_factory, IMPORT_JOB)
+        with session_factory() as db:
+            JobRepository(db).claim_next([IMPORT_JOB], "dead-worker")
+            db.execute(update(JobEntity).values(updated_at=datetime(2000, 1, 1)))
+            db.commit()
+
+        # Act
+        with session_factory() as db:
+            count = JobRepository(db).requeue_stale(60)
+
+        # Assert
+        assert count == 1
+        assert load(session_factory, job_id).status == "pending"
+
+    def test_previous_worker_cannot_touch_reclaimed_job(self, session_factory):
+        """Test a worker whose job was requeued and re-claimed can no longer update or finish it"""
+        # Arrange
+        job_id = submit(session_factory, IMPORT_JOB)
+        with session_factory() as db:
+            JobRepository(db).claim_next([IMPORT_JOB], "slow-worker")
+            db.execute(update(JobEntity).values(updated_at=datetime(2000, 1, 1)))
+            db.commit()
+            JobRepository(db).requeue_stale(60)
+            JobRepository(db).claim_next([IMPORT_JOB], "new-worker")
+
+        # Act
+        with session_factory() as db:
+            repository = JobRepository(db)
+            progress = repository.update_progress(job_id, "slow-worker", 5, 10)
+            finished = repository.finish(job_id, "slow-worker", "succeeded")
+
+        # Assert
+        job = load(session_factory, job_id)
+        assert (progress, finished) == (None, False)
+        assert (job.status, job.worker, job.progress) == ("running", "new-worker", 0)
+
+
+class TestJobRunner:
+    """Test cases for JobRunner and the example job handlers"""
+
+    def test_import_job_creates_examples(self, session_factory, tmp_path):
+        """Test an import creates valid items, reports invalid ones and records progress"""
+        # Arrange
+        items = [{"name": "First"}, {"name": ""}, {"name": "Third", "description": "d"}]
+        job_id = submit(session_factory, IMPORT_JOB, {"items": items})
+        runner = make_runner(session_factory, tmp_path)
+
+        # Act
+        ran = runner.run_next()
+
+        # Assert
+        job = load(session_factory, job_id)
+        assert ran is True
+        assert job.status == "succeeded"
+        assert (job.progress, job.total) == (3, 3)
+        assert job.result["created"] == 2
+        assert [error["index"] for error in job.result["errors"]] == [1]
+        with session_factory() as db:
+            assert db.scalars(select(ExampleEntity.name)).all() == ["First", "Third"]
+        assert runner.run_next() is False
+
+    def test_requeued_import_resumes_from_progress(self, session_factory, tmp_path):
+        """Test an import interrupted after two items does not create them again"""
+        # Arrange
+        items = [{"name": "First"}, {"name": ""}, {"name": "Third"}, {"name": "Fourth"}]
+        job_id = submit(session_factory, IMPORT_JOB, {"items": items})
+        with session_factory() as db:
+            db.add(ExampleEntity(name="First"))
+            db.execute(update(JobEntity).values(progress=2, total=4))
+            db.commit()
+
+        # Act
+        make_runner(session_factory, tmp_path).run_next()
+
+        # Assert
+        job = load(session_factory, job_id)
+        assert job.status == "succeeded"
+        assert (job.progress, job.total) == (4, 4)
+        assert job.result["created"] == 3
+        assert [error["index"] for error in job.result["errors"]] == [1]
+        with session_factory() as db:
+            names = db.scalars(select(ExampleEntity.name).order_by(ExampleEntity.id)).all()
+        assert names == ["First", "Third", "Fourth"]
+
+    def test_export_job_writes_file(self, session_factory, tmp_path):
+        """Test an export writes every example as a JSON array"""
+        # Arrange
+        with session_factory() as db:
+            db.add_all(ExampleEntity(name=f"Example {i}") for i in range(1, 4))
+            db.commit()
+        job_id = submit(session_factory, EXPORT_JOB)
+        runner = make_runner(session_factory, tmp_path)
+
+        # Act
+        runner.run_next()
+
+        # Assert
+        job = load(session_factory, job_id)
+        exported = json.loads((tmp_path / "output" / job.result["file"]).read_text())
+        assert job.status == "succeeded"
+        assert job.result["count"] == 3
+        assert [item["name"] for item in exported] == ["Example 1", "Example 2", "Example 3"]
+        assert list((tmp_path / "output").glob("*.part")) == []
+
+    def test_handler_error_fails_job(self, session_factory, tmp_path):
+        """Test an exception in the handler marks the job failed with the error"""
+        # Arrange
+        job_id = submit(session_factory, IMPORT_JOB, {"items": "not a list"})
+
+        # Act
+        make_runner(session_factory, tmp_path).run_next()
+
+        # Assert
+        job = load(session_factory, job_id)
+        assert job.status == "failed"
+        assert job.error == "ValueError: params.items must be a list"
+
+    def test_running_job_is_cancelled(self, session_factory, tmp_path):
+        """Test cancelling a running job stops it at its next progress report"""
+        # Arrange
+        started = threading.Event()
+
+        def endless(context, params):
+            context.set_total(None)
+            started.set()
+            while True:
+                context.advance()
+                time.sleep(0.01)
+
+        job_id = submit(session_factory, "endless")
+        runner = make_runner(
+            session_factory, tmp_path, {"endless": endless}, progress_interval=0.02
+        )
+        runner.start()
+
+        # Act
+        assert started.wait(5)
+        with session_factory() as db:
+            requested = JobRepository(db).request_cancel(job_id)
+        deadline = time.monotonic() + 5
+        while load(session_factory, job_id).status == "running" and time.monotonic() < deadline:
+            time.sleep(0.02)
+        runner.stop()
+
+        # Assert
+        job = load(session_factory, job_id)
+        assert requested is True
+        assert job.status == "cancelled"
+        assert job.progress > 0
+
+    def test_stop_requeues_running_job(self, session_factory, tmp_path):
+        """Test a job interrupted by shutdown goes back to pending for another worker"""
+        # Arrange
+        started = threading.Event()
+
+        def endless(context, params):
+            started.set()
+            while True:
+                context.advance()
+                time.sleep(0.01)
+
+        job_id = submit(session_factory, "endless")
+        runner = make_runner(session_factory, tmp_path, {"endless": endless})
+        runner.start()
+        assert started.wait(5)
+
+        # Act
+        runner.stop()
+
+        # Assert
+        job = load(session_factory, job_id)
+        assert job.status == "pending"
+        assert job.worker is None
+        assert job.progress > 0
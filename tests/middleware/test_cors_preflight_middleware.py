@@ -0,0 +1,171 @@
+"""
+Unit tests for the CORS preflight fast path
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.testclient import TestClient
+
+from app.config.cors_config import CorsConfig
+from app.middleware.cors_preflight_middleware import CorsPreflightMiddleware
+
+CORS_OPTIONS = {
+    "allow_origins": ["https://app.example.com"],
+    "allow_methods": ["GET", "POST", "PUT"],
+    "allow_headers": ["content-type", "x-api-key"],
+    "allow_credentials": True,
+    "max_age": 3600,
+}
+
+
+def build_app(fast_path: bool, **middleware_options) -> FastAPI:
+    app = FastAPI()
+    app.state.calls = 0
+
+    @app.middleware("http")
+    async def count_calls(request, call_next):
+        app.state.calls += 1
+        return await call_next(request)
+
+    @app.api_route("/items", methods=["GET", "OPTIONS"])
+    async def items():
+        return {"ok": True}
+
+    app.add_middleware(CORSMiddleware, **CORS_OPTIONS)
+    if fast_path:
+        app.add_middleware(CorsPreflightMiddleware, **middleware_options, **CORS_OPTIONS)
+    return app
+
+
+def preflight(client, origin="https://app.example.com", method="POST", headers="content-type"):
+    request_headers = {"Origin": origin, "Access-Control-Request-Method": method}
+    if headers is not None:
+        request_headers["Access-Control-Request-Headers"] = headers
+    return client.options("/items", headers=request_headers)
+
+
+class TestCorsPreflightMiddleware:
+    """Test cases for CorsPreflightMiddleware"""
+
+    @pytest.mark.parametrize(
+        "origin, method, headers",
+        [
+            ("https://app.example.com", "POST", "content-type"),
+            ("https://app.example.com", "PUT", None),
+            ("https://evil.example.com", "POST", "content-type"),
+            ("https://app.example.com", "DELETE", "content-type"),
+            ("https://app.example.com", "POST", "x-unknown"),
+        ],
+    )
+    def test_matches_cors_middleware(self, origin, method, headers):
+        """Test answers are identical to CORSMiddleware, allowed or not"""
+        # Arrange
+        fast = TestClient(build_app(fast_path=True))
+        regular = TestClient(build_app(fast_path=False))
+
+        # Act
+        first = preflight(fast, origin, method, headers)
+        cached = preflight(fast, origin, method, headers)
+        expected = preflight(regular, origin, method, headers)
+
+        # Assert
+        for response in (first, cached):
+            assert response.status_code == expected.status_code
+            assert response.text == expected.text
+            assert dict(response.headers) == dict(expected.headers)
+
+    def test_preflight_skips_inner_stack_and_is_cached(self, monkeypatch):
+        """Test preflights never reach the app and are computed once per origin"""
+        # Arrange
+        app = build_app(fast_path=True)
+        client = TestClient(app)
+        rendered = []
+        original = CORSMiddleware.preflight_response
+
+        def counting(self, request_headers):
+            rendered.append(request_headers["origin"])
+            return original(self, request_headers)
+
+        monkeypatch.setattr(CORSMiddleware, "preflight_response", counting)
+
+        # Act
+        responses = [preflight(client) for _ in range(3)]
+        other = preflight(client, origin="https://other.example.com")
+
+        # Assert
+        assert [response.status_code for response in responses] == [200, 200, 200]
+        assert responses[0].headers["access-control-max-age"] == "3600"
+        assert other.status_code == 400
+        assert rendered == ["https://app.example.com", "https://other.example.com"]
+        assert app.state.calls == 0
+
+    def test_non_preflight_requests_pass_through(self):
+        """Test plain OPTIONS and simple CORS requests still go through the app"""
+        # Arrange
+        app = build_app(fast_path=True)
+        client = TestClient(app)
+
+        # Act
+        options = client.options("/items")
+        simple = client.get("/items", headers={"Origin": "https://app.example.com"})
+
+        # Assert
+        assert options.json() == {"ok": True}
+        assert simple.headers["access-control-allow-origin"] == "https://app.example.com"
+        assert app.state.calls == 2
+
+    def test_rejected_preflights_are_not_cached(self):
+        """Test disallowed origins are answered without taking cache entries"""
+        # Arrange
+        middleware = CorsPreflightMiddleware(None, max_entries=2, **CORS_OPTIONS)
+        client = TestClient(middleware)
+
+        # Act
+        statuses = [
+            preflight(client, origin=f"https://{i}.example.com").status_code for i in range(5)
+        ]
+
+        # Assert
+        assert statuses == [400] * 5
+        assert len(middleware._responses) == 0
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test a flood of new origins cannot keep a frequent origin out; huge keys are not stored"""
+        # Arrange
+        options = dict(
+            CORS_OPTIONS, allow_origins=["*"], allow_headers=["*"], allow_credentials=False
+        )
+        middleware = CorsPreflightMiddleware(None, max_entries=2, **options)
+        client = TestClient(middleware)
+
+        # Act
+        for i in range(5):
+            preflight(client)
+            preflight(client, origin=f"https://{i}.example.com")
+        oversized = preflight(client, headers="content-type," + "x" * 2048)
+
+        # Assert
+        assert oversized.status_code == 200
+        assert len(middleware._responses) == 2
+        assert next(reversed(middleware._responses))[0] == b"https://4.example.com"
+        assert (b"https://app.example.com", b"POST", b"content-type", None) in middleware._responses
+
+class TestCorsConfig:
+    """Test cases for CorsConfig"""
+
+    def test_max_age_from_env(self, monkeypatch):
+        """Test CORS_MAX_AGE sets the preflight Access-Control-Max-Age"""
+        # Arrange
+        monkeypatch.setenv("CORS_MAX_AGE", "7200")
+        app = FastAPI()
+        CorsConfig.init_cors(app)
+        CorsConfig.init_preflight(app)
+
+        # Act
+        response = TestClient(app).options(
+            "/", headers={"Origin": "https://a.example.com", "Access-Control-Request-Method": "GET"}
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["access-control-max-age"] == "7200"
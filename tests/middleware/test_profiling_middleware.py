@@ -0,0 +1,92 @@
+"""
+Unit tests for ProfilingMiddleware
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware.profiling_middleware import (
+    ProfilingMiddleware,
+    StackSampler,
+    sign_profile_request,
+)
+
+SECRET = "test-secret"
+
+
+@pytest.fixture
+def profiled_client(tmp_path):
+    """Client for an app that burns some CPU, behind the profiler"""
+    app = FastAPI()
+
+    @app.get("/work")
+    async def work():
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            pass
+        return {"ok": True}
+
+    app.add_middleware(
+        ProfilingMiddleware, secret=SECRET, output_dir=str(tmp_path), interval=0.001
+    )
+    return TestClient(app), tmp_path
+
+
+class TestProfilingMiddleware:
+    """Test cases for ProfilingMiddleware"""
+
+    def test_signed_request_writes_collapsed_stacks(self, profiled_client):
+        """Test a validly signed request produces a .folded profile"""
+        # Arrange
+        client, output_dir = profiled_client
+        header = sign_profile_request(SECRET, "/work", int(time.time()) + 60)
+
+        # Act
+        response = client.get("/work", headers={"X-Profile": header})
+
+        # Assert
+        files = list(output_dir.glob("*.folded"))
+        assert response.status_code == 200
+        assert len(files) == 1
+        line = files[0].read_text().splitlines()[0]
+        stack, count = line.rsplit(" ", 1)
+        assert ";" in stack and int(count) > 0
+
+    def test_unsigned_request_is_not_profiled(self, profiled_client):
+        """Test requests without a valid signature are not profiled"""
+        # Arrange
+        client, output_dir = profiled_client
+        expired = sign_profile_request(SECRET, "/work", int(time.time()) - 1)
+
+        # Act
+        client.get("/work")
+        client.get("/work", headers={"X-Profile": expired})
+        client.get("/work", headers={"X-Profile": "9999999999:bad"})
+
+        # Assert
+        assert list(output_dir.glob("*.folded")) == []
+
+
+class TestStackSampler:
+    """Test cases for StackSampler"""
+
+    def test_idle_executor_threads_are_skipped(self):
+        """Test threads parked in the executor worker loop add no stacks"""
+        # Arrange
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="idle")
+        executor.submit(lambda: None).result()
+        idle = [t.ident for t in threading.enumerate() if t.name.startswith("idle")]
+        sampler = StackSampler(lambda: idle, interval=0.001)
+
+        # Act
+        time.sleep(0.01)
+        sampler.sample()
+        executor.shutdown()
+
+        # Assert
+        assert len(idle) == 1
+        assert sampler.stacks == {}
@@ -0,0 +1,162 @@
+"""
+Unit tests for rate limiting
+"""
+import os
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config.rate_limit_config import RateLimitConfig
+from app.middleware.rate_limit_middleware import RateLimitMiddleware, RateLimitRule
+from app.utility.rate_limit.rate_limit_utility import SharedTokenBuckets
+
+
+@pytest.fixture
+def buckets(tmp_path):
+    """Shared bucket table in a temporary file"""
+    return SharedTokenBuckets(str(tmp_path / "buckets.bin"), slots=64)
+
+
+class TestSharedTokenBuckets:
+    """Test cases for SharedTokenBuckets"""
+
+    def test_acquire_allows_burst_then_limits(self, buckets):
+        """Test a bucket allows burst requests then asks to retry"""
+        # Arrange
+        key = buckets.key_hash("client")
+        now = time.monotonic()
+
+        # Act
+        results = [buckets.acquire(key, rate=1, burst=3, now=now) for _ in range(4)]
+
+        # Assert
+        assert results[:3] == [0.0, 0.0, 0.0]
+        assert results[3] == pytest.approx(1.0)
+
+    def test_acquire_refills_over_time(self, buckets):
+        """Test tokens are refilled at the configured rate"""
+        # Arrange
+        key = buckets.key_hash("client")
+        buckets.acquire(key, rate=2, burst=1, now=100.0)
+
+        # Act
+        result = buckets.acquire(key, rate=2, burst=1, now=100.5)
+
+        # Assert
+        assert result == 0.0
+
+    def test_state_is_shared_across_processes(self, buckets, tmp_path):
+        """Test tokens spent in a forked worker are seen by the parent"""
+        # Arrange
+        key = buckets.key_hash("client")
+
+        # Act
+        pid = os.fork()
+        if pid == 0:
+            SharedTokenBuckets(buckets.path, slots=64).acquire(key, 0.001, 1, 100.0)
+            os._exit(0)
+        os.waitpid(pid, 0)
+
+        # Assert
+        assert buckets.acquire(key, 0.001, 1, 100.0) > 0
+
+    def test_evicted_slot_keeps_its_tokens(self, tmp_path):
+        """Test a key that evicts another bucket does not start with a full burst"""
+        # Arrange
+        buckets = SharedTokenBuckets(str(tmp_path / "tiny.bin"), slots=4)
+        for client in ("a", "b", "c", "d"):
+            key = buckets.key_hash(client)
+            for _ in range(3):
+                buckets.acquire(key, rate=0.001, burst=3, now=100.0)
+
+        # Act
+        result = buckets.acquire(buckets.key_hash("e"), rate=0.001, burst=3, now=100.0)
+
+        # Assert
+        assert result > 0
+
+    def test_key_hash_is_stable(self, buckets):
+        """Test key hashes do not depend on the process hash seed"""
+        assert buckets.key_hash("client") == SharedTokenBuckets(buckets.path, 64).key_hash("client")
+
+
+class TestRateLimitMiddleware:
+    """Test cases for RateLimitMiddleware"""
+
+    @pytest.fixture
+    def client(self, buckets):
+        app = FastAPI()
+
+        @app.get("/items")
+        async def read_items():
+            return {"ok": True}
+
+        @app.post("/items")
+        async def create_item():
+            return {"ok": True}
+
+        app.add_middleware(
+            RateLimitMiddleware,
+            buckets=buckets,
+            read_rule=RateLimitRule("read", rate=0.001, burst=3),
+            write_rule=RateLimitRule("write", rate=0.001, burst=1),
+            api_keys=("a", "b"),
+        )
+        return TestClient(app)
+
+    def test_write_limit_is_stricter(self, client):
+        """Test POST is limited before GET for the same client"""
+        # Act
+        posts = [client.post("/items").status_code for _ in range(2)]
+        gets = [client.get("/items").status_code for _ in range(2)]
+
+        # Assert
+        assert posts == [200, 429]
+        assert gets == [200, 200]
+
+    def test_clients_are_limited_separately(self, client):
+        """Test different API keys have their own buckets"""
+        # Act
+        first = [client.post("/items", headers={"X-API-Key": "a"}).status_code for _ in range(2)]
+        second = client.post("/items", headers={"X-API-Key": "b"})
+
+        # Assert
+        assert first == [200, 429]
+        assert second.status_code == 200
+        assert "retry-after" in {k.lower() for k in client.post("/items", headers={"X-API-Key": "a"}).headers}
+
+    def test_unknown_api_keys_share_the_ip_bucket(self, client):
+        """Test random API keys cannot be used to get a fresh bucket per request"""
+        # Act
+        statuses = [
+            client.post("/items", headers={"X-API-Key": f"random-{i}"}).status_code for i in range(3)
+        ]
+
+        # Assert
+        assert statuses == [200, 429, 429]
+
+
+class TestRateLimitConfig:
+    """Test cases for RateLimitConfig"""
+
+    def test_parse_rules(self):
+        """Test route rules are parsed from the environment format"""
+        # Act
+        rules = RateLimitConfig.parse_rules("POST /api/v1/examples=1:5; * /api/v1/system=10")
+
+        # Assert
+        assert (rules[0].method, rules[0].path_prefix, rules[0].rate, rules[0].burst) == (
+            "POST",
+            "/api/v1/examples",
+            1.0,
+            5.0,
+        )
+        assert (rules[1].method, rules[1].rate, rules[1].burst) == (None, 10.0, 10.0)
+
+    @pytest.mark.parametrize("spec", ["POST /api=0:5", "* /api=-1", "* /api=5:0.5"])
+    def test_parse_rules_rejects_invalid_limits(self, spec):
+        """Test a zero or negative rate, or a burst below one token, fails at startup"""
+        with pytest.raises(ValueError):
+            RateLimitConfig.parse_rules(spec)
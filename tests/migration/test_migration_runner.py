@@ -0,0 +1,61 @@
+"""
+Unit tests for MigrationRunner
+"""
+import pytest
+from sqlalchemy import create_engine, inspect
+
+from app.migration.migration_runner import MigrationRunner
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Empty SQLite database"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrate.db'}")
+    yield engine
+    engine.dispose()
+
+
+class TestMigrationRunner:
+    """Test cases for MigrationRunner"""
+
+    def test_upgrade_applies_all_versions(self, engine):
+        """Test upgrade creates the examples and jobs tables and their indexes"""
+        # Arrange
+        runner = MigrationRunner(engine)
+
+        # Act
+        applied = runner.upgrade()
+
+        # Assert
+        inspector = inspect(engine)
+        index_names = {index["name"] for index in inspector.get_indexes("examples")}
+        assert applied == ["0001", "0002", "0003"]
+        assert {"ix_examples_name", "ix_examples_updated_at"} <= index_names
+        assert [index["name"] for index in inspector.get_indexes("jobs")] == ["ix_jobs_status_id"]
+
+    def test_upgrade_is_idempotent(self, engine):
+        """Test a second upgrade applies nothing"""
+        # Arrange
+        runner = MigrationRunner(engine)
+        runner.upgrade()
+
+        # Act
+        applied = runner.upgrade()
+
+        # Assert
+        assert applied == []
+        assert runner.pending() == []
+
+    def test_upgrade_on_existing_create_all_schema(self, engine):
+        """Test databases created by create_all are adopted without errors"""
+        # Arrange
+        from app.config.db_config import Base
+        from app.example.models.entity.example_entity import ExampleEntity  # noqa: F401
+
+        Base.metadata.create_all(bind=engine)
+
+        # Act
+        applied = MigrationRunner(engine).upgrade()
+
+        # Assert
+        assert applied == ["0001", "0002", "0003"]
@@ -0,0 +1,86 @@
+"""
+Query budget helpers for tests running against a real SQLite database
+
+Counts SQL statements and rows fetched so a test can assert that a call
+stays within its budget:
+
+    with query_counter.budget(max_queries=1, max_rows=3):
+        client.get("/api/v1/examples/")
+"""
+import sqlite3
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when a block issues more queries or fetches more rows than allowed"""
+
+
+class QueryCounter:
+    """Statement and fetched-row counters for one engine"""
+
+    def __init__(self):
+        self.statements = []
+        self.rows = 0
+
+    def reset(self):
+        self.statements = []
+        self.rows = 0
+
+    @property
+    def queries(self) -> int:
+        return len(self.statements)
+
+    @contextmanager
+    def budget(self, max_queries: int, max_rows: int = None):
+        """Fail if the block issues more than max_queries statements (or fetches more than max_rows)"""
+        self.reset()
+        yield self
+        details = "\n".join(f"  {i + 1}. {sql}" for i, sql in enumerate(self.statements))
+        if self.queries > max_queries:
+            raise QueryBudgetExceeded(
+                f"Expected at most {max_queries} queries, got {self.queries}:\n{details}"
+            )
+        if max_rows is not None and self.rows > max_rows:
+            raise QueryBudgetExceeded(
+                f"Expected at most {max_rows} rows fetched, got {self.rows}:\n{details}"
+            )
+
+
+def create_counting_engine(counter: QueryCounter):
+    """In-memory SQLite engine whose statements and fetched rows are counted"""
+
+    class CountingCursor(sqlite3.Cursor):
+        def fetchone(self):
+            row = super().fetchone()
+            if row is not None:
+                counter.rows += 1
+            return row
+
+        def fetchmany(self, size=None):
+            rows = super().fetchmany(self.arraysize if size is None else size)
+            counter.rows += len(rows)
+            return rows
+
+        def fetchall(self):
+            rows = super().fetchall()
+            counter.rows += len(rows)
+            return rows
+
+    class CountingConnection(sqlite3.Connection):
+        def cursor(self, factory=CountingCursor):
+            return super().cursor(factory)
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False, "factory": CountingConnection},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        counter.statements.append(statement)
+
+    return engine
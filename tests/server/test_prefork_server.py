@@ -0,0 +1,59 @@
+"""
+Unit tests for PreforkServer
+"""
+import asyncio
+
+import uvicorn
+
+from app.main import app
+from app.server.prefork_server import PreforkServer, RecyclingServer, get_rss_bytes
+
+
+class TestRecyclingServer:
+    """Test cases for RecyclingServer"""
+
+    def test_get_rss_bytes_returns_positive(self):
+        """Test get_rss_bytes reads the current RSS"""
+        # Act
+        result = get_rss_bytes()
+
+        # Assert
+        assert result > 0
+
+    def test_on_tick_exits_above_rss_limit(self):
+        """Test on_tick asks the worker to exit above the RSS limit"""
+        # Arrange
+        server = RecyclingServer(uvicorn.Config(app=app), max_rss_bytes=1)
+
+        # Act
+        result = asyncio.run(server.on_tick(10))
+
+        # Assert
+        assert result is True
+
+    def test_on_tick_keeps_running_without_limit(self):
+        """Test on_tick keeps running when no RSS limit is set"""
+        # Arrange
+        server = RecyclingServer(uvicorn.Config(app=app), max_rss_bytes=0)
+
+        # Act
+        result = asyncio.run(server.on_tick(10))
+
+        # Assert
+        assert result is False
+
+
+class TestPreforkServer:
+    """Test cases for PreforkServer"""
+
+    def test_load_warms_app(self):
+        """Test load imports the app and prebuilds its schema and middleware"""
+        # Arrange
+        server = PreforkServer(workers=2)
+
+        # Act
+        server.load()
+
+        # Assert
+        assert server.app.openapi_schema is not None
+        assert server.app.middleware_stack is not None
@@ -0,0 +1,118 @@
+"""
+Unit tests for the change feed utility
+"""
+import asyncio
+import json
+
+from app.utility.feed.change_feed_utility import RESET, ChangeFeed
+
+
+async def collect(feed, last_event_id, count, publish=()):
+    """Subscribe, publish the given events, then collect count payloads"""
+    events = []
+    subscription = feed.subscribe(last_event_id, heartbeat=1)
+    first = asyncio.ensure_future(subscription.__anext__())
+    await asyncio.sleep(0.01)
+    for event_type, data in publish:
+        feed.publish(event_type, data)
+    events.append(await asyncio.wait_for(first, 2))
+    while len(events) < count:
+        events.append(await asyncio.wait_for(subscription.__anext__(), 2))
+    await subscription.aclose()
+    return events
+
+
+class TestChangeFeed:
+    """Test cases for ChangeFeed"""
+
+    def test_read_range_returns_events_with_offsets(self, tmp_path):
+        """Test event ids are the offsets right after each line"""
+        # Arrange
+        feed = ChangeFeed(str(tmp_path), "examples")
+        feed.publish("created", {"id": 1})
+        feed.publish("deleted", {"id": 1})
+
+        # Act
+        events = feed.read_range(0, feed.end_offset())
+
+        # Assert
+        assert [json.loads(line)["type"] for _, line in events] == ["created", "deleted"]
+        assert events[-1][0] == feed.end_offset()
+        assert feed.read_range(events[0][0], feed.end_offset()) == events[1:]
+
+    def test_read_range_before_retention_returns_none(self, tmp_path):
+        """Test positions in discarded segments are reported as a gap"""
+        # Arrange
+        feed = ChangeFeed(str(tmp_path), "examples", segment_bytes=1, keep_segments=2)
+        for i in range(5):
+            feed.publish("created", {"id": i})
+
+        # Act
+        result = feed.read_range(0, feed.end_offset())
+
+        # Assert
+        assert result is None
+        assert len(feed._segments()) == 2
+
+    def test_subscribe_receives_live_events(self, tmp_path):
+        """Test subscribers get events published after they connect"""
+        # Arrange
+        feed = ChangeFeed(str(tmp_path), "examples", poll_interval=0.01)
+
+        # Act
+        events = asyncio.run(
+            collect(feed, None, 2, publish=[("created", {"id": 1}), ("updated", {"id": 1})])
+        )
+
+        # Assert
+        assert [json.loads(line)["type"] for _, line in events] == ["created", "updated"]
+
+    def test_subscribe_resumes_from_last_event_id(self, tmp_path):
+        """Test a reconnecting client replays events after its last id"""
+        # Arrange
+        feed = ChangeFeed(str(tmp_path), "examples", poll_interval=0.01)
+        feed.publish("created", {"id": 1})
+        feed.publish("created", {"id": 2})
+        first_id = feed.read_range(0, feed.end_offset())[0][0]
+
+        # Act
+        events = asyncio.run(collect(feed, first_id, 1))
+
+        # Assert
+        assert json.loads(events[0][1])["data"] == {"id": 2}
+
+    def test_subscribe_resets_when_position_is_gone(self, tmp_path):
+        """Test resuming from a discarded position yields a reset"""
+        # Arrange
+        feed = ChangeFeed(str(tmp_path), "examples", segment_bytes=1, keep_segments=2)
+        for i in range(5):
+            feed.publish("created", {"id": i})
+
+        # Act
+        events = asyncio.run(collect(feed, 0, 1))
+
+        # Assert
+        assert events[0][1] is RESET
+
+    def test_resume_ahead_of_tailer_skips_seen_events(self, tmp_path):
+        """Test a client resuming past this worker's tail position gets no duplicates"""
+        # Arrange
+        feed = ChangeFeed(str(tmp_path), "examples", poll_interval=0.2)
+
+        async def scenario():
+            # Another subscriber has the tailer running at offset 0
+            other = feed.subscribe(None, heartbeat=1)
+            pending = asyncio.ensure_future(other.__anext__())
+            await asyncio.sleep(0.05)
+            # Events the client already saw on another worker, before this tailer polls
+            feed.publish("created", {"id": 1})
+            feed.publish("created", {"id": 2})
+            events = await collect(feed, feed.end_offset(), 1, publish=[("created", {"id": 3})])
+            pending.cancel()
+            return events
+
+        # Act
+        events = asyncio.run(scenario())
+
+        # Assert
+        assert json.loads(events[0][1])["data"] == {"id": 3}
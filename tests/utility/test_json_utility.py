@@ -0,0 +1,151 @@
+"""
+Unit tests for JsonUtility and its backends
+"""
+import datetime
+import decimal
+import json
+import uuid
+
+import pytest
+from pydantic import BaseModel
+
+from app.config.json_config import JsonCodecResponse
+from app.utility.json.json_utility import (
+    JsonUtility,
+    OrjsonJsonBackend,
+    StdlibJsonBackend,
+    create_json_backend,
+    orjson,
+)
+
+BACKENDS = [StdlibJsonBackend]
+if orjson is not None:
+    BACKENDS.append(OrjsonJsonBackend)
+
+
+class Item(BaseModel):
+    id: int
+    created_at: datetime.datetime
+
+
+@pytest.fixture(params=BACKENDS, ids=lambda backend: backend.name)
+def json_utility(request):
+    """JsonUtility on each installed backend"""
+    return JsonUtility(request.param())
+
+
+class TestJsonUtility:
+    """Test cases for JsonUtility"""
+
+    def test_dumps_returns_compact_utf8_bytes(self, json_utility):
+        """Test output is compact UTF-8 bytes without ASCII escaping"""
+        # Act
+        result = json_utility.dumps({"name": "測試", "values": [1, 2]})
+
+        # Assert
+        assert result == '{"name":"測試","values":[1,2]}'.encode()
+
+    def test_dumps_encodes_rich_types(self, json_utility):
+        """Test datetimes, decimals, UUIDs and models encode the same on every backend"""
+        # Arrange
+        moment = datetime.datetime(2024, 1, 2, 3, 4, 5, 600000)
+        value = {
+            "at": moment,
+            "day": moment.date(),
+            "price": decimal.Decimal("1.50"),
+            "uid": uuid.UUID(int=1),
+            "item": Item(id=1, created_at=moment),
+        }
+
+        # Act
+        result = json.loads(json_utility.dumps(value))
+
+        # Assert
+        assert result == {
+            "at": "2024-01-02T03:04:05.600000",
+            "day": "2024-01-02",
+            "price": "1.50",
+            "uid": "00000000-0000-0000-0000-000000000001",
+            "item": {"id": 1, "created_at": "2024-01-02T03:04:05.600000"},
+        }
+
+    def test_round_trip(self, json_utility):
+        """Test to_json and from_json round trip"""
+        # Arrange
+        value = {"a": [1, 2.5, None, True], "b": "x"}
+
+        # Act
+        result = json_utility.from_json(json_utility.to_json(value))
+
+        # Assert
+        assert result == value
+        assert json_utility.loads(json_utility.dumps(value)) == value
+
+    def test_to_dict_uses_json_mode(self, json_utility):
+        """Test to_dict returns JSON-compatible values"""
+        # Arrange
+        item = Item(id=1, created_at=datetime.datetime(2024, 1, 2))
+
+        # Act
+        result = json_utility.to_dict(item)
+
+        # Assert
+        assert result == {"id": 1, "created_at": "2024-01-02T00:00:00"}
+
+    def test_iter_array_matches_dumps(self, json_utility):
+        """Test incremental encoding yields several chunks forming the same array"""
+        # Arrange
+        items = [{"id": i, "name": f"name {i}"} for i in range(500)]
+
+        # Act
+        chunks = list(json_utility.iter_array(iter(items), chunk_size=1024))
+
+        # Assert
+        assert len(chunks) > 1
+        assert json.loads(b"".join(chunks)) == items
+
+    def test_iter_array_empty(self, json_utility):
+        """Test an empty iterable encodes as an empty array"""
+        # Act & Assert
+        assert b"".join(json_utility.iter_array([])) == b"[]"
+
+    def test_stdlib_rejects_nan(self):
+        """Test NaN/Infinity are refused like JSONResponse instead of emitting invalid JSON"""
+        # Arrange
+        json_utility = JsonUtility(StdlibJsonBackend())
+
+        # Act & Assert
+        for value in (float("nan"), float("inf")):
+            with pytest.raises(ValueError):
+                json_utility.dumps({"value": value})
+
+
+class TestCreateJsonBackend:
+    """Test cases for backend selection"""
+
+    def test_auto_prefers_orjson_when_installed(self):
+        """Test auto picks orjson if importable, else stdlib"""
+        # Act
+        backend = create_json_backend("auto")
+
+        # Assert
+        assert backend.name == ("orjson" if orjson is not None else "stdlib")
+
+    def test_unknown_backend_raises(self):
+        """Test an unknown backend name is rejected"""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            create_json_backend("yaml")
+
+
+class TestJsonCodecResponse:
+    """Test cases for JsonCodecResponse"""
+
+    def test_render_uses_codec(self):
+        """Test the default response class renders through the codec"""
+        # Act
+        response = JsonCodecResponse({"at": datetime.datetime(2024, 1, 2), "name": "é"})
+
+        # Assert
+        assert response.body == '{"at":"2024-01-02T00:00:00","name":"é"}'.encode()
+        assert response.headers["content-type"] == "application/json"
@@ -0,0 +1,90 @@
+"""
+Unit tests for the response cache utility
+"""
+import os
+
+from app.utility.cache.response_cache_utility import ResponseCache, TableVersion
+
+
+class TestTableVersion:
+    """Test cases for TableVersion"""
+
+    def test_bump_is_visible_to_other_instances(self, tmp_path):
+        """Test a bump from one worker is seen by another mapping the same file"""
+        # Arrange
+        writer = TableVersion(str(tmp_path), "examples")
+        reader = TableVersion(str(tmp_path), "examples")
+        before = reader.get()
+
+        # Act
+        writer.bump()
+
+        # Assert
+        assert reader.get() == before + 1
+
+    def test_bump_in_child_process_is_visible_to_parent(self, tmp_path):
+        """Test bumps from forked workers update the shared counter"""
+        # Arrange
+        version = TableVersion(str(tmp_path), "examples")
+        version.get()
+
+        # Act
+        pid = os.fork()
+        if pid == 0:
+            version.bump()
+            os._exit(0)
+        os.waitpid(pid, 0)
+
+        # Assert
+        assert version.get() == 1
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache"""
+
+    def test_put_then_get_returns_bytes(self, tmp_path):
+        """Test cached content is returned for the same key and version"""
+        # Arrange
+        cache = ResponseCache(str(tmp_path))
+
+        # Act
+        cache.put("/api/v1/examples/?[]", 3, b'{"data":[]}')
+
+        # Assert
+        assert cache.get("/api/v1/examples/?[]", 3) == b'{"data":[]}'
+
+    def test_get_other_worker_reads_file_store(self, tmp_path):
+        """Test a second cache instance reads entries stored by the first"""
+        # Arrange
+        ResponseCache(str(tmp_path)).put("key", 1, b"body")
+
+        # Act
+        result = ResponseCache(str(tmp_path)).get("key", 1)
+
+        # Assert
+        assert result == b"body"
+
+    def test_get_newer_version_misses(self, tmp_path):
+        """Test entries of an older version are not served"""
+        # Arrange
+        cache = ResponseCache(str(tmp_path))
+        cache.put("key", 1, b"old")
+
+        # Act
+        cache.purge_before(2)
+
+        # Assert
+        assert cache.get("key", 2) is None
+        assert ResponseCache(str(tmp_path)).get("key", 1) is None
+
+    def test_get_expired_entry_misses(self, tmp_path):
+        """Test entries older than the TTL are not served"""
+        # Arrange
+        cache = ResponseCache(str(tmp_path), ttl=0.000001)
+        cache.put("key", 1, b"body")
+
+        # Act
+        result = cache.get("key", 1)
+
+        # Assert
+        assert result is None
@@ -0,0 +1,165 @@
+"""
+Unit tests for the tracing utility
+"""
+import json
+import threading
+import time
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.config.tracing_config import TracingConfig
+from app.middleware.tracing_middleware import TracingMiddleware
+from app.utility.trace.trace_utility import (
+    FileSpanExporter,
+    Trace,
+    Tracer,
+    TracedRoute,
+    traced,
+    traced_class,
+)
+
+
+@pytest.fixture
+def traced_app(tmp_path, monkeypatch):
+    """App with a traced route -> service -> SQL call chain"""
+    engine = create_engine("sqlite://")
+    TracingConfig.instrument_engine(engine)
+
+    @traced_class
+    class DemoService:
+        def compute(self):
+            with engine.connect() as conn:
+                return conn.execute(text("SELECT 1")).scalar()
+
+    router = APIRouter(route_class=TracedRoute)
+
+    @router.get("/demo/{item_id}")
+    async def demo(item_id: int):
+        return {"value": DemoService().compute()}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(TracingMiddleware, trusted_networks=["10.0.0.0/8"])
+
+    output = tmp_path / "spans.jsonl"
+    monkeypatch.setattr(Tracer, "sample_rate", 0.0)
+    monkeypatch.setattr(Tracer, "exporter", FileSpanExporter(str(output), "test"))
+    return TestClient(app, client=("203.0.113.7", 50000)), output
+
+
+def read_spans(output):
+    Tracer.exporter.flush()
+    lines = output.read_text().splitlines() if output.exists() else []
+    return [
+        span
+        for line in lines
+        for span in json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    ]
+
+
+class TestTracing:
+    """Test cases for request tracing"""
+
+    def test_sampled_request_exports_nested_spans(self, traced_app, monkeypatch):
+        """Test a sampled request records router, endpoint, service and SQL spans"""
+        # Arrange
+        client, output = traced_app
+        monkeypatch.setattr(Tracer, "sample_rate", 1.0)
+
+        # Act
+        client.get("/demo/1")
+
+        # Assert
+        spans = {span["name"]: span for span in read_spans(output)}
+        assert set(spans) == {
+            "HTTP GET /demo/{item_id}",
+            "route demo",
+            "endpoint demo",
+            "DemoService.compute",
+            "SQL SELECT",
+        }
+        root = spans["HTTP GET /demo/{item_id}"]
+        assert "parentSpanId" not in root
+        assert spans["route demo"]["parentSpanId"] == root["spanId"]
+        assert spans["SQL SELECT"]["parentSpanId"] == spans["DemoService.compute"]["spanId"]
+        assert len({span["traceId"] for span in spans.values()}) == 1
+
+    def test_unsampled_request_exports_nothing(self, traced_app):
+        """Test no spans are recorded when sampling is off"""
+        # Arrange
+        client, output = traced_app
+
+        # Act
+        response = client.get("/demo/1")
+
+        # Assert
+        assert response.json() == {"value": 1}
+        assert read_spans(output) == []
+
+    def test_trusted_sampled_traceparent_continues_trace(self, traced_app):
+        """Test a sampled W3C traceparent from a trusted network forces tracing with its trace id"""
+        # Arrange
+        client, output = traced_app
+        trusted = TestClient(client.app, client=("10.1.2.3", 50000))
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+        # Act
+        trusted.get(
+            "/demo/1", headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"}
+        )
+
+        # Assert
+        spans = read_spans(output)
+        assert spans and all(span["traceId"] == trace_id for span in spans)
+
+    def test_untrusted_sampled_traceparent_follows_sample_rate(self, traced_app, monkeypatch):
+        """Test other clients cannot force sampling, but sampled requests keep their trace id"""
+        # Arrange
+        client, output = traced_app
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+        headers = {"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"}
+
+        # Act
+        client.get("/demo/1", headers=headers)
+        unsampled = read_spans(output)
+        monkeypatch.setattr(Tracer, "sample_rate", 1.0)
+        client.get("/demo/1", headers=headers)
+
+        # Assert
+        spans = read_spans(output)
+        assert unsampled == []
+        assert spans and all(span["traceId"] == trace_id for span in spans)
+
+    def test_export_drops_traces_when_queue_is_full(self, tmp_path, monkeypatch):
+        """Test export never blocks: traces beyond the queue size are dropped and counted"""
+        # Arrange
+        exporter = FileSpanExporter(str(tmp_path / "spans.jsonl"), "test", queue_size=1)
+        release = threading.Event()
+        monkeypatch.setattr(exporter, "_line", lambda trace: release.wait(5) and b"{}\n")
+        exporter.export(Trace())
+        time.sleep(0.05)
+
+        # Act
+        for _ in range(3):
+            exporter.export(Trace())
+        release.set()
+        exporter.flush()
+
+        # Assert
+        assert exporter.dropped == 2
+        assert (tmp_path / "spans.jsonl").read_text().count("\n") == 2
+
+    def test_traced_without_span_calls_through(self):
+        """Test traced functions run unchanged outside of a sampled request"""
+        # Arrange
+        wrapped = traced()(lambda value: value * 2)
+
+        # Act
+        result = wrapped(21)
+
+        # Assert
+        assert result == 42
+        assert Tracer.current_span() is None